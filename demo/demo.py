@@ -1,6 +1,6 @@
 import logging
 from contextlib import contextmanager
-from typing import Iterator
+from typing import Iterator, Optional
 from unittest import mock
 
 import typer
@@ -19,7 +19,7 @@ from overhave import (
     overhave_test_execution_factory,
 )
 from overhave.cli.admin import _get_admin_app
-from overhave.cli.consumers import _run_consumer
+from overhave.cli.consumers import _run_async_consumer, _run_consumer
 from overhave.cli.synchronizer import _create_synchronizer, _create_validator
 from overhave.scenario.parser.parser import BaseScenarioParserError
 
@@ -144,6 +144,27 @@ def consumer(
     _run_demo_consumer(stream=stream, settings_generator=_get_overhave_settings_generator(language=language))
 
 
+@overhave_demo.command(short_help="Run Overhave asyncio consumer for several streams in demo mode")
+def async_consumer(
+    streams: Optional[list[OverhaveRedisStream]] = typer.Option(
+        None, "-s", "--stream", help="Redis streams, which are consumed in one process (all by default)"
+    ),
+    language: OverhaveDemoAppLanguage = typer.Option(
+        OverhaveDemoAppLanguage.RU,
+        "-l",
+        "--language",
+        help="Overhave application language (defines step prefixes only right now)",
+    ),
+) -> None:
+    settings_generator = _get_overhave_settings_generator(language=language)
+    streams = streams or list(OverhaveRedisStream)
+    if OverhaveRedisStream.TEST in streams:
+        _prepare_test_execution_factory(settings_generator)
+    if OverhaveRedisStream.PUBLICATION in streams:
+        _prepare_publication_factory(settings_generator)
+    _run_async_consumer(streams)
+
+
 @overhave_demo.command(short_help="Run Overhave feature synchronization")
 def sync_run(
     create_db_features: bool = typer.Option(
@@ -14,6 +14,7 @@ from overhave.entities import (
     OverhaveLanguageSettings,
     OverhaveLdapManagerSettings,
     OverhaveStepContextSettings,
+    OverhaveTestRunCoalescingSettings,
     StepPrefixesModel,
 )
 from overhave.factory import ConsumerFactory as OverhaveConsumerFactory
@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 OverhaveAdminApp = typing.NewType("OverhaveAdminApp", flask.Flask)
 
 
-def _prepare_factory(factory: IAdminFactory) -> None:
+def prepare_admin_factory(factory: IAdminFactory) -> None:
     """Resolve necessary settings with :class:`IProxyManager` and prepare :class:`IOverhaveFactory` for usage."""
     proxy_manager = get_proxy_manager()
     proxy_manager.set_factory(factory)
@@ -44,7 +44,7 @@ def overhave_app(factory: IAdminFactory) -> OverhaveAdminApp:  # noqa: C901
     template_dir = current_dir / "templates"
     files_dir = current_dir / "files"
 
-    _prepare_factory(factory)
+    prepare_admin_factory(factory)
     flask_app = _resolved_app(factory=factory, template_dir=template_dir)
     flask_app.config["FILES_DIR"] = files_dir
 
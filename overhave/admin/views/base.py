@@ -43,6 +43,10 @@ class ModelViewConfigured(ModelView):
         "status": "Status",
         "report": "Report",
         "traceback": "Error traceback",
+        "peak_rss": "Peak RSS",
+        "cpu_time": "CPU time",
+        "workers": "xdist workers",
+        "shards": "Shards",
         "feature_id": "Feature",
         "test_run_id": "Test run ID",
         "pr_url": "Pull-request URL",
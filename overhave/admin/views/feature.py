@@ -8,6 +8,7 @@ from typing import Any, Callable, cast
 import flask
 import werkzeug
 from flask_admin import expose
+from flask_admin.actions import action
 from flask_admin.model import InlineFormAdmin
 from flask_login import current_user
 from markupsafe import Markup
@@ -17,16 +18,18 @@ from wtforms.widgets import HiddenInput
 
 from overhave import db
 from overhave.admin.views.base import ModelViewConfigured
-from overhave.factory import IAdminFactory, get_admin_factory, get_test_execution_factory
-from overhave.pytest_plugin import get_proxy_manager
+from overhave.admin.views.local_execution import execute_test_runs_locally
+from overhave.factory import IAdminFactory, get_admin_factory
 from overhave.storage import FeatureTypeName
 from overhave.test_execution import BddStepModel, StepTypeName
-from overhave.transport import TestRunData, TestRunTask
+from overhave.transport import TestRunData, TestRunPriority, TestRunTask
 from overhave.utils import get_current_time
 
 logger = logging.getLogger(__name__)
 
 _SCENARIO_PREFIX = "scenario-0"
+_RUN_SCENARIOS_FIELD = "run_scenarios"
+_RUN_FAIL_FAST_FIELD = "run_fail_fast"
 
 
 class ScenarioTextWidget(HiddenInput):
@@ -221,21 +224,64 @@ class FeatureView(ModelViewConfigured, FactoryViewUtilsMixin):
         factory = get_admin_factory()
         with db.create_session() as session:
             scenario = factory.scenario_storage.scenario_model_by_id(session=session, scenario_id=int(scenario_id))
-        test_run_id = factory.test_run_storage.create_testrun(scenario_id=scenario.id, executed_by=current_user.login)
-        if not factory.context.admin_settings.consumer_based:
-            proxy_manager = get_proxy_manager()
-            test_execution_factory = get_test_execution_factory()
-            proxy_manager.clear_factory()
-            proxy_manager.set_factory(test_execution_factory)
-            factory.threadpool.apply_async(get_test_execution_factory().test_executor.execute_test, args=(test_run_id,))
-        if factory.context.admin_settings.consumer_based and not factory.redis_producer.add_task(
-            TestRunTask(data=TestRunData(test_run_id=test_run_id))
-        ):
+        scenarios = [x.strip() for x in data.get(_RUN_SCENARIOS_FIELD, "").split(",") if x.strip()]
+        test_run = factory.test_run_coalescing_storage.get_or_create_testrun(
+            scenario_id=scenario.id,
+            scenario_text=scenario.text,
+            executed_by=current_user.login,
+            scenarios=scenarios,
+            fail_fast=bool(data.get(_RUN_FAIL_FAST_FIELD)),
+        )
+        test_run_id = test_run.test_run_id
+        if not test_run.created:
+            flask.flash(f"Scenario is already being tested in test run {test_run_id}.", category="info")
+        elif not factory.context.admin_settings.consumer_based:
+            execute_test_runs_locally(factory, test_run_ids=[test_run_id])
+        elif not factory.redis_producer.add_task(TestRunTask(data=TestRunData(test_run_id=test_run_id))):
             flask.flash("Problems with Redis service! TestRunTask has not been sent.", category="error")
             return rendered
         logger.debug("Redirect to TestRun details view with test_run_id='%s'...", test_run_id)
         return flask.redirect(flask.url_for("testrun.details_view", id=test_run_id))
 
+    @action("run", "Run tests", "Run tests of selected features?")
+    def action_run(self, ids: list[str]) -> None:
+        factory = get_admin_factory()
+        test_run_ids: list[int] = []
+        for feature_id in ids:
+            scenario = factory.scenario_storage.get_scenario_by_feature_id(int(feature_id))
+            test_run = factory.test_run_coalescing_storage.get_or_create_testrun(
+                scenario_id=scenario.id, scenario_text=scenario.text, executed_by=current_user.login
+            )
+            if test_run.created:
+                test_run_ids.append(test_run.test_run_id)
+        coalesced_count = len(ids) - len(test_run_ids)
+        if coalesced_count:
+            flask.flash(f"{coalesced_count} features are already being tested.", category="info")
+        if not factory.context.admin_settings.consumer_based:
+            execute_test_runs_locally(factory, test_run_ids=test_run_ids)
+            flask.flash(f"Started {len(test_run_ids)} test runs.", category="success")
+            return
+        results = factory.redis_producer.add_tasks(
+            [
+                TestRunTask(data=TestRunData(test_run_id=test_run_id), priority=TestRunPriority.BULK)
+                for test_run_id in test_run_ids
+            ]
+        )
+        not_sent_ids = [test_run_id for test_run_id, sent in zip(test_run_ids, results) if not sent]
+        for test_run_id in not_sent_ids:
+            factory.test_run_storage.set_run_status(
+                run_id=test_run_id,
+                status=db.TestRunStatus.INTERNAL_ERROR,
+                traceback="Problems with Redis service! TestRunTask has not been sent.",
+            )
+        if not_sent_ids:
+            flask.flash(
+                f"Problems with Redis service! {len(not_sent_ids)} of {len(test_run_ids)} TestRunTasks not sent.",
+                category="error",
+            )
+            return
+        flask.flash(f"Started {len(test_run_ids)} test runs.", category="success")
+
     @expose("/edit/", methods=("GET", "POST"))
     def edit_view(self) -> werkzeug.Response:
         rendered: werkzeug.Response = super().edit_view()
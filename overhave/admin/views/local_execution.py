@@ -0,0 +1,18 @@
+from typing import Sequence
+
+from overhave.factory import IAdminFactory, get_test_execution_factory
+from overhave.pytest_plugin import get_proxy_manager
+
+
+def execute_test_runs_locally(factory: IAdminFactory, test_run_ids: Sequence[int]) -> None:
+    """Execute test runs without consumers: in processes pool, when it is enabled, otherwise in threadpool."""
+    if factory.context.admin_settings.process_pool_enabled:
+        for test_run_id in test_run_ids:
+            factory.test_run_pool.submit(test_run_id)
+        return
+    proxy_manager = get_proxy_manager()
+    test_execution_factory = get_test_execution_factory()
+    proxy_manager.clear_factory()
+    proxy_manager.set_factory(test_execution_factory)
+    for test_run_id in test_run_ids:
+        factory.threadpool.apply_async(test_execution_factory.local_test_executor.execute_test, args=(test_run_id,))
@@ -1,5 +1,5 @@
 import logging
-from typing import cast
+from typing import Any, cast
 
 import flask
 import werkzeug
@@ -10,8 +10,8 @@ from wtforms import Form, ValidationError
 
 from overhave import db
 from overhave.admin.views.base import ModelViewConfigured
-from overhave.factory import get_admin_factory, get_test_execution_factory
-from overhave.pytest_plugin import get_proxy_manager
+from overhave.admin.views.local_execution import execute_test_runs_locally
+from overhave.factory import IAdminFactory, get_admin_factory
 from overhave.transport import TestRunData, TestRunTask
 
 logger = logging.getLogger(__name__)
@@ -48,6 +48,15 @@ class TestRunView(ModelViewConfigured):
         "report_status",
         "report",
         "traceback",
+        "peak_rss",
+        "cpu_time",
+        "workers",
+        "shards",
+        "rerun_of",
+        "scenarios",
+        "fail_fast",
+        "failed_scenarios",
+        "memoized_from",
     )
     column_filters = (
         "name",
@@ -59,8 +68,23 @@ class TestRunView(ModelViewConfigured):
         "name": "Feature name",
         "executed_by": "Initiator of scenarios set test run",
         "status": "Test run result",
+        "peak_rss": "Peak resident set size of isolated test run process in bytes",
+        "cpu_time": "CPU time of isolated test run process",
+        "workers": "Number of xdist workers, 0 - test run without xdist",
+        "shards": "Number of shards, which scenarios of test run were split into",
+        "rerun_of": "Test run, which failed scenarios are rerun by test run",
+        "scenarios": "Names or indices of scenarios, which are run by test run, all scenarios by default",
+        "fail_fast": "Test run is stopped on the first failure",
+        "failed_scenarios": "Names of failed scenarios of test run",
+        "memoized_from": "Test run, which successful result is reused by test run without execution",
     }
 
+    def render(self, template: str, **kwargs: Any) -> str:
+        factory = get_admin_factory()
+        if template == self.list_template and factory.context.admin_settings.process_pool_enabled:
+            kwargs["test_run_queue"] = factory.test_run_pool.queue
+        return cast(str, super().render(template, **kwargs))
+
     def on_model_change(self, form: Form, model: db.TestRun, is_created: bool) -> None:
         if not is_created and current_user.role != db.Role.admin:
             raise ValidationError("Only administrator could change test run data!")
@@ -73,19 +97,33 @@ class TestRunView(ModelViewConfigured):
     def _run_test(rendered: werkzeug.Response) -> werkzeug.Response:
         current_scenario_id = int(get_mdict_item_or_list(flask.request.args, "id"))
         factory = get_admin_factory()
-        test_run_id = factory.test_run_storage.create_testrun(
-            scenario_id=current_scenario_id, executed_by=current_user.login
+        with db.create_session() as session:
+            scenario = factory.scenario_storage.scenario_model_by_id(session=session, scenario_id=current_scenario_id)
+        test_run = factory.test_run_coalescing_storage.get_or_create_testrun(
+            scenario_id=scenario.id, scenario_text=scenario.text, executed_by=current_user.login
         )
+        test_run_id = test_run.test_run_id
+
+        if not test_run.created:
+            flask.flash(f"Scenario is already being tested in test run {test_run_id}.", category="info")
+            return flask.redirect(flask.url_for("testrun.details_view", id=test_run_id))
+        return TestRunView._start_test_run(factory=factory, test_run_id=test_run_id, rendered=rendered)
+
+    @staticmethod
+    def _rerun_failed_scenarios(rendered: werkzeug.Response) -> werkzeug.Response:
+        current_test_run_id = int(get_mdict_item_or_list(flask.request.args, "id"))
+        factory = get_admin_factory()
+        test_run_id = factory.test_run_storage.create_rerun(run_id=current_test_run_id, executed_by=current_user.login)
+        if test_run_id is None:
+            flask.flash("Test run has not got failed scenarios to rerun.", category="error")
+            return rendered
+        return TestRunView._start_test_run(factory=factory, test_run_id=test_run_id, rendered=rendered)
 
+    @staticmethod
+    def _start_test_run(factory: IAdminFactory, test_run_id: int, rendered: werkzeug.Response) -> werkzeug.Response:
         if not factory.context.admin_settings.consumer_based:
-            proxy_manager = get_proxy_manager()
-            test_execution_factory = get_test_execution_factory()
-            proxy_manager.clear_factory()
-            proxy_manager.set_factory(test_execution_factory)
-            factory.threadpool.apply_async(get_test_execution_factory().test_executor.execute_test, args=(test_run_id,))
-        if factory.context.admin_settings.consumer_based and not factory.redis_producer.add_task(
-            TestRunTask(data=TestRunData(test_run_id=test_run_id))
-        ):
+            execute_test_runs_locally(factory, test_run_ids=[test_run_id])
+        elif not factory.redis_producer.add_task(TestRunTask(data=TestRunData(test_run_id=test_run_id))):
             flask.flash("Problems with Redis service! TestRunTask has not been sent.", category="error")
             return rendered
         logger.debug("Redirect to TestRun details view with test_run_id='%s'...", test_run_id)
@@ -95,6 +133,8 @@ class TestRunView(ModelViewConfigured):
     def details_view(self) -> werkzeug.Response:
         rendered: werkzeug.Response = super().details_view()
 
+        if flask.request.method == "POST" and "rerun_failed" in flask.request.form:
+            return self._rerun_failed_scenarios(rendered)
         if flask.request.method == "POST":
             return self._run_test(rendered)
 
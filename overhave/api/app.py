@@ -11,6 +11,7 @@ from overhave.api.views import (
     get_test_run_handler,
     get_testuser_handler,
     login_for_access_token,
+    rerun_failed_scenarios_handler,
     run_tests_by_tag_handler,
     tags_item_handler,
     tags_list_handler,
@@ -95,6 +96,14 @@ def _get_testrun_router() -> fastapi.APIRouter:
         summary="Create TestRunTasks for Features by tag_value",
         description="Create TestRunTasks for Features by `tag_value`",
     )
+    test_run_router.add_api_route(
+        "/rerun_failed/",
+        rerun_failed_scenarios_handler,
+        methods=["POST"],
+        response_model=str,
+        summary="Create TestRunTask for failed scenarios of test run",
+        description="Create test run, which reruns failed scenarios of test run by `test_run_id`, and its TestRunTask",
+    )
     return test_run_router
 
 
@@ -4,7 +4,7 @@ from pathlib import Path
 import walrus
 
 from overhave.api.settings import OverhaveApiAuthSettings
-from overhave.entities import OverhaveEmulationSettings
+from overhave.entities import OverhaveEmulationSettings, OverhaveTestRunCoalescingSettings
 from overhave.metrics import get_common_metric_container
 from overhave.storage import (
     DraftStorage,
@@ -19,14 +19,27 @@ from overhave.storage import (
     IFeatureTypeStorage,
     IScenarioStorage,
     ISystemUserStorage,
+    ITestRunCoalescingStorage,
     ITestRunStorage,
     ITestUserStorage,
     ScenarioStorage,
     SystemUserStorage,
+    TestRunCoalescingStorage,
     TestRunStorage,
     TestUserStorage,
 )
-from overhave.transport import EmulationTask, PublicationTask, RedisProducer, RedisStream, TestRunTask
+from overhave.transport import (
+    BaseRedisTask,
+    EmulationTask,
+    ITaskProducer,
+    LocalProducer,
+    PublicationTask,
+    RedisAdmissionController,
+    RedisProducer,
+    RedisStream,
+    TestRunTask,
+)
+from overhave.transport.local.deps import get_local_broker, get_local_transport_settings
 from overhave.transport.redis.deps import get_redis_settings, make_redis
 
 
@@ -85,6 +98,15 @@ def get_emulation_storage() -> IEmulationStorage:
     return EmulationStorage(settings=OverhaveEmulationSettings(), redis=make_redis(get_redis_settings()))
 
 
+@cache
+def get_test_run_coalescing_storage() -> ITestRunCoalescingStorage:
+    return TestRunCoalescingStorage(
+        settings=OverhaveTestRunCoalescingSettings(),
+        redis=make_redis(get_redis_settings()),
+        test_run_storage=get_test_run_storage(),
+    )
+
+
 @cache
 def get_redis_database() -> walrus.Database:
     redis = make_redis(get_redis_settings())
@@ -92,14 +114,34 @@ def get_redis_database() -> walrus.Database:
 
 
 @cache
-def get_redis_producer() -> RedisProducer:
+def get_task_producer() -> ITaskProducer:
+    mapping: dict[type[BaseRedisTask], RedisStream] = {
+        TestRunTask: RedisStream.TEST,
+        PublicationTask: RedisStream.PUBLICATION,
+        EmulationTask: RedisStream.EMULATION,
+    }
+    if get_local_transport_settings().enabled:
+        return LocalProducer(
+            settings=get_redis_settings(),
+            mapping=mapping,
+            broker=get_local_broker(),
+            metric_container=get_common_metric_container(),
+        )
     return RedisProducer(
         settings=get_redis_settings(),
-        mapping={
-            TestRunTask: RedisStream.TEST,
-            PublicationTask: RedisStream.PUBLICATION,
-            EmulationTask: RedisStream.EMULATION,
-        },
+        mapping=mapping,
+        database=get_redis_database(),
+        metric_container=get_common_metric_container(),
+    )
+
+
+@cache
+def get_test_run_admission_controller() -> RedisAdmissionController:
+    settings = get_redis_settings()
+    return RedisAdmissionController(
+        settings=settings,
+        task_type=RedisStream.TEST.value,
+        streams=list(settings.get_lane_weights(RedisStream.TEST)),
         database=get_redis_database(),
         metric_container=get_common_metric_container(),
     )
@@ -5,7 +5,7 @@ from .extra_views import docs, favicon
 from .feature_type_views import feature_types_list_handler
 from .feature_views import get_features_handler
 from .tags_views import tags_item_handler, tags_list_handler
-from .testrun_views import get_test_run_handler, run_tests_by_tag_handler
+from .testrun_views import get_test_run_handler, rerun_failed_scenarios_handler, run_tests_by_tag_handler
 from .testuser_views import (
     delete_testuser_handler,
     get_testuser_handler,
@@ -1,17 +1,30 @@
+import logging
 from http import HTTPStatus
 
 import fastapi
 
+from overhave import db
 from overhave.api.deps import (
     get_feature_storage,
     get_feature_tag_storage,
-    get_redis_producer,
     get_scenario_storage,
+    get_task_producer,
+    get_test_run_admission_controller,
+    get_test_run_coalescing_storage,
     get_test_run_storage,
 )
 from overhave.api.views.tags_views import tags_item_handler
-from overhave.storage import IFeatureStorage, IFeatureTagStorage, IScenarioStorage, TestRunModel, TestRunStorage
-from overhave.transport import RedisProducer, TestRunData, TestRunTask
+from overhave.storage import (
+    IFeatureStorage,
+    IFeatureTagStorage,
+    IScenarioStorage,
+    ITestRunCoalescingStorage,
+    TestRunModel,
+    TestRunStorage,
+)
+from overhave.transport import ITaskProducer, RedisAdmissionController, TestRunData, TestRunPriority, TestRunTask
+
+logger = logging.getLogger(__name__)
 
 
 def get_test_run_handler(
@@ -28,11 +41,18 @@ def get_test_run_handler(
 
 def run_tests_by_tag_handler(
     tag_value: str,
+    priority: TestRunPriority = TestRunPriority.BULK,
+    scenarios: list[str] | None = fastapi.Query(
+        default=None, description="Names or 1-based indices of scenarios of features to run, all by default"
+    ),
+    fail_fast: bool = False,
     feature_storage: IFeatureStorage = fastapi.Depends(get_feature_storage),
     tag_storage: IFeatureTagStorage = fastapi.Depends(get_feature_tag_storage),
     scenario_storage: IScenarioStorage = fastapi.Depends(get_scenario_storage),
     test_run_storage: TestRunStorage = fastapi.Depends(get_test_run_storage),
-    redis_producer: RedisProducer = fastapi.Depends(get_redis_producer),
+    test_run_coalescing_storage: ITestRunCoalescingStorage = fastapi.Depends(get_test_run_coalescing_storage),
+    task_producer: ITaskProducer = fastapi.Depends(get_task_producer),
+    admission_controller: RedisAdmissionController = fastapi.Depends(get_test_run_admission_controller),
 ) -> list[str]:
     tag_model = tags_item_handler(value=tag_value, feature_tag_storage=tag_storage)
     features = feature_storage.get_features_by_tag(tag_id=tag_model.id)
@@ -40,10 +60,59 @@ def run_tests_by_tag_handler(
         raise fastapi.HTTPException(
             status_code=HTTPStatus.BAD_REQUEST, detail=f"Features with tag='{tag_value}' do not exist"
         )
-    test_run_ids: list[str] = []
+    decision = admission_controller.check(count=len(features))
+    if not decision.admitted:
+        raise fastapi.HTTPException(
+            status_code=HTTPStatus.TOO_MANY_REQUESTS,
+            detail=f"Test run queue is overloaded with {decision.backlog} tasks, try again later",
+            headers={"Retry-After": str(decision.retry_after)},
+        )
+    test_run_ids: list[int] = []
+    created_test_run_ids: list[int] = []
     for feature in features:
         scenario = scenario_storage.get_scenario_by_feature_id(feature.id)
-        test_run_id = test_run_storage.create_testrun(scenario_id=scenario.id, executed_by=feature.last_edited_by)
-        redis_producer.add_task(TestRunTask(data=TestRunData(test_run_id=test_run_id)))
-        test_run_ids.append(str(test_run_id))
-    return test_run_ids
+        test_run = test_run_coalescing_storage.get_or_create_testrun(
+            scenario_id=scenario.id,
+            scenario_text=scenario.text,
+            executed_by=feature.last_edited_by,
+            scenarios=scenarios,
+            fail_fast=fail_fast,
+        )
+        test_run_ids.append(test_run.test_run_id)
+        if test_run.created:
+            created_test_run_ids.append(test_run.test_run_id)
+    results = task_producer.add_tasks(
+        [TestRunTask(data=TestRunData(test_run_id=run_id), priority=priority) for run_id in created_test_run_ids]
+    )
+    for test_run_id, sent in zip(created_test_run_ids, results):
+        if sent:
+            continue
+        logger.error("TestRunTask for test run %s has not been sent!", test_run_id)
+        test_run_storage.set_run_status(
+            run_id=test_run_id,
+            status=db.TestRunStatus.INTERNAL_ERROR,
+            traceback="Problems with Redis service! TestRunTask has not been sent.",
+        )
+    return [str(test_run_id) for test_run_id in test_run_ids]
+
+
+def rerun_failed_scenarios_handler(
+    test_run_id: int,
+    priority: TestRunPriority = TestRunPriority.BULK,
+    test_run_storage: TestRunStorage = fastapi.Depends(get_test_run_storage),
+    task_producer: ITaskProducer = fastapi.Depends(get_task_producer),
+) -> str:
+    test_run = get_test_run_handler(test_run_id=test_run_id, test_run_storage=test_run_storage)
+    rerun_id = test_run_storage.create_rerun(run_id=test_run.id, executed_by=test_run.executed_by)
+    if rerun_id is None:
+        raise fastapi.HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST, detail=f"Test run with id='{test_run_id}' has not got failed scenarios"
+        )
+    if not task_producer.add_task(TestRunTask(data=TestRunData(test_run_id=rerun_id), priority=priority)):
+        logger.error("TestRunTask for test run %s has not been sent!", rerun_id)
+        test_run_storage.set_run_status(
+            run_id=rerun_id,
+            status=db.TestRunStatus.INTERNAL_ERROR,
+            traceback="Problems with Redis service! TestRunTask has not been sent.",
+        )
+    return str(rerun_id)
@@ -1,6 +1,7 @@
 # flake8: noqa
 from .admin import admin
 from .api import api
-from .consumers import consumer
+from .consumers import async_consumer, consumer
 from .db_cmds import set_config_to_context
 from .group import overhave
+from .impact import run_impacted
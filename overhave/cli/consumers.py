@@ -1,21 +1,61 @@
+from functools import partial
+from typing import Optional
+
 import typer
 
 from overhave.base_settings import DataBaseSettings, LoggingSettings
 from overhave.cli.group import overhave
-from overhave.factory import ConsumerFactory
+from overhave.factory import AsyncConsumerFactory, ConsumerFactory
 from overhave.metrics import get_common_metric_container
-from overhave.transport import RedisStream
+from overhave.transport import RedisConsumerSupervisor, RedisStream
+from overhave.transport.redis.deps import get_redis_settings
 
 
 def _run_consumer(stream: RedisStream) -> None:
     DataBaseSettings().setup_engine()
     LoggingSettings().setup_logging()
-    ConsumerFactory(stream=stream, metric_container=get_common_metric_container()).runner.run()
+    factory = ConsumerFactory(stream=stream, metric_container=get_common_metric_container())
+    if not factory.use_local_transport:
+        factory.trimmer.start()
+    factory.runner.run()
 
 
 @overhave.command(short_help="Run Overhave Redis consumer")
 def consumer(
-    stream: RedisStream = typer.Option(..., "-s", "--stream", help="Redis stream, which defines application")
+    stream: RedisStream = typer.Option(..., "-s", "--stream", help="Redis stream, which defines application"),
+    processes: Optional[int] = typer.Option(
+        None, "-p", "--processes", help="Number of consumer processes, OVERHAVE_REDIS_CONSUMER_PROCESSES by default"
+    ),
+) -> None:
+    """Run Overhave Redis consumer.
+
+    Several consumer processes or recycled consumers are kept alive by supervisor.
+    """
+    settings = get_redis_settings()
+    processes = processes or settings.consumer_processes
+    if processes == 1 and not settings.consumer_recycling_enabled:
+        _run_consumer(stream)
+        return
+    LoggingSettings().setup_logging()
+    RedisConsumerSupervisor(target=partial(_run_consumer, stream), processes=processes).run()
+
+
+def _run_async_consumer(streams: list[RedisStream]) -> None:
+    DataBaseSettings().setup_engine()
+    LoggingSettings().setup_logging()
+    factory = AsyncConsumerFactory(streams=list(dict.fromkeys(streams)), metric_container=get_common_metric_container())
+    if factory.use_local_transport:
+        typer.echo("Local transport is not supported by asyncio consumer, use `consumer` command instead!", err=True)
+        raise typer.Exit(1)
+    factory.trimmer.start()
+    factory.runner.run()
+
+
+@overhave.command(short_help="Run Overhave asyncio Redis consumer for several streams")
+def async_consumer(
+    streams: Optional[list[RedisStream]] = typer.Option(
+        None, "-s", "--stream", help="Redis streams, which are consumed in one process (all by default)"
+    )
 ) -> None:
-    """Run Overhave Redis consumer."""
-    _run_consumer(stream)
+    """Run Overhave asyncio Redis consumer, which multiplexes several streams in one event loop."""
+    _run_async_consumer(streams or list(RedisStream))
@@ -0,0 +1,102 @@
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from overhave import db
+from overhave.admin import prepare_admin_factory
+from overhave.admin.views.local_execution import execute_test_runs_locally
+from overhave.base_settings import DataBaseSettings, LoggingSettings
+from overhave.cli.group import overhave
+from overhave.factory import IAdminFactory, get_admin_factory
+from overhave.storage import FeatureModel, ScenarioModel
+from overhave.test_execution import get_changed_files
+from overhave.transport import TestRunData, TestRunPriority, TestRunTask
+
+
+def _get_impacted_features(
+    factory: IAdminFactory, changed_files: list[Path]
+) -> list[tuple[FeatureModel, ScenarioModel]]:
+    impacted_features: list[tuple[FeatureModel, ScenarioModel]] = []
+    for feature_type in factory.feature_extractor.feature_types:
+        features = factory.feature_storage.get_features_with_scenarios(feature_type)
+        impacted_ids = factory.change_impact_analyzer.get_impacted_features(
+            feature_type=feature_type,
+            scenarios={feature.id: scenario.text or "" for feature, scenario in features},
+            changed_files=changed_files,
+        )
+        impacted_features.extend((feature, scenario) for feature, scenario in features if feature.id in impacted_ids)
+    return impacted_features
+
+
+def _execute_test_runs(factory: IAdminFactory, test_run_ids: list[int]) -> None:
+    """Execute test runs without consumers and wait for them, because pools are stopped at exit of command."""
+    execute_test_runs_locally(factory, test_run_ids=test_run_ids)
+    if factory.context.admin_settings.process_pool_enabled:
+        factory.test_run_pool.close()
+        return
+    factory.threadpool.close()
+    factory.threadpool.join()
+
+
+def _enqueue_test_runs(factory: IAdminFactory, features: list[tuple[FeatureModel, ScenarioModel]]) -> None:
+    test_run_ids: list[int] = []
+    for feature, scenario in features:
+        test_run = factory.test_run_coalescing_storage.get_or_create_testrun(
+            scenario_id=scenario.id, scenario_text=scenario.text or "", executed_by=feature.last_edited_by
+        )
+        if test_run.created:
+            test_run_ids.append(test_run.test_run_id)
+    if not factory.context.admin_settings.consumer_based:
+        typer.echo(
+            f"Run {len(test_run_ids)} test runs, {len(features) - len(test_run_ids)} features are already tested."
+        )
+        _execute_test_runs(factory, test_run_ids=test_run_ids)
+        return
+    results = factory.redis_producer.add_tasks(
+        [
+            TestRunTask(data=TestRunData(test_run_id=test_run_id), priority=TestRunPriority.BULK)
+            for test_run_id in test_run_ids
+        ]
+    )
+    for test_run_id, sent in zip(test_run_ids, results):
+        if sent:
+            continue
+        factory.test_run_storage.set_run_status(
+            run_id=test_run_id,
+            status=db.TestRunStatus.INTERNAL_ERROR,
+            traceback="Problems with Redis service! TestRunTask has not been sent.",
+        )
+        typer.echo(f"TestRunTask for test run {test_run_id} has not been sent!", err=True)
+    typer.echo(f"Started {sum(results)} test runs, {len(features) - len(test_run_ids)} features are already tested.")
+
+
+@overhave.command(short_help="Run tests of features, which are impacted by changed steps modules")
+def run_impacted(
+    diff_range: Optional[str] = typer.Option(
+        None, "-d", "--diff", help="Git diff range of steps directory changes, e.g. main...HEAD"
+    ),
+    modules: Optional[list[Path]] = typer.Option(
+        None, "-m", "--module", help="Changed steps module, could be specified several times"
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", is_flag=True, help="Only show impacted features"),
+) -> None:
+    """Run tests of features, which steps are defined in changed steps modules.
+
+    Changed modules are specified explicitly or taken from git diff range of steps directory. Test runs are sent
+    to consumers, for application without consumers they are executed by the command itself.
+    """
+    DataBaseSettings().setup_engine()
+    LoggingSettings().setup_logging()
+    factory = get_admin_factory()
+    changed_files = list(modules or ())
+    if diff_range is not None:
+        changed_files.extend(get_changed_files(diff_range, steps_dir=factory.context.file_settings.steps_dir))
+    if not changed_files:
+        raise typer.BadParameter("Changed steps modules are not specified!")
+    prepare_admin_factory(factory)
+    features = _get_impacted_features(factory, changed_files=changed_files)
+    for feature, _ in features:
+        typer.echo(f"Feature #{feature.id} '{feature.name}' ({feature.feature_type.name}) is impacted")
+    if not dry_run and features:
+        _enqueue_test_runs(factory, features)
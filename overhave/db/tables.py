@@ -102,6 +102,9 @@ class TestRun(BaseTable, PrimaryKeyMixin):
     scenario_id: int = sa.Column(sa.Integer(), sa.ForeignKey(Scenario.id), nullable=False, index=True)
     name: str = sa.Column(sa.String(), nullable=False)
     start: datetime.datetime | None = sa.Column(sa.DateTime(timezone=True), doc="Test start time")
+    lease_until: datetime.datetime | None = sa.Column(
+        sa.DateTime(timezone=True), doc="Time, after which running test run could be started again by another consumer"
+    )
     end: datetime.datetime | None = sa.Column(sa.DateTime(timezone=True), doc="Test finish time")
     status: TestRunStatus = sa.Column(sa.Enum(TestRunStatus), doc="Current test status", nullable=False)
     report_status: TestReportStatus = sa.Column(
@@ -110,6 +113,28 @@ class TestRun(BaseTable, PrimaryKeyMixin):
     executed_by: str = sa.Column(sa.String(), sa.ForeignKey(UserRole.login), doc="Test executor login", nullable=False)
     report: str | None = sa.Column(sa.String(), doc="Relative report URL")
     traceback: str | None = sa.Column(sa.Text(), doc="Text storage for error traceback")
+    peak_rss: int | None = sa.Column(sa.BigInteger(), doc="Peak resident set size of test run process in bytes")
+    cpu_time: datetime.timedelta | None = sa.Column(sa.Interval(), doc="CPU time of test run process")
+    workers: int | None = sa.Column(sa.Integer(), doc="Number of xdist workers of test run, 0 - without xdist")
+    shards: int | None = sa.Column(sa.Integer(), doc="Number of shards of sharded test run")
+    finished_shards: int = sa.Column(
+        sa.BigInteger(), nullable=False, default=0, doc="Bit mask of finished shards of sharded test run"
+    )
+    failed_shards: int = sa.Column(
+        sa.BigInteger(), nullable=False, default=0, doc="Bit mask of failed shards of sharded test run"
+    )
+    rerun_of: int | None = sa.Column(
+        sa.Integer(), sa.ForeignKey("test_run.test_run_id"), doc="Test run, which failed tests are rerun"
+    )
+    scenarios: List[str] | None = sa.Column(
+        sa.ARRAY(sa.String()), doc="Names or 1-based indices of scenarios to run, all scenarios by default"
+    )
+    fail_fast: bool = sa.Column(sa.Boolean(), doc="Stop test run on the first failure", nullable=False, default=False)
+    failed_scenarios: List[str] | None = sa.Column(sa.ARRAY(sa.String()), doc="Names of failed scenarios of test run")
+    memo_key: str | None = sa.Column(sa.String(), index=True, doc="Hash of scenario and steps code of test run")
+    memoized_from: int | None = sa.Column(
+        sa.Integer(), sa.ForeignKey("test_run.test_run_id"), doc="Test run, which successful result is reused"
+    )
 
     scenario: so.Mapped[Scenario] = so.relationship(
         Scenario, uselist=False, backref=so.backref("test_runs", cascade="all, delete-orphan")
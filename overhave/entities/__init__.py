@@ -11,7 +11,14 @@ from .feature import FeatureExtractor, FeatureTypeExtractionError, IFeatureExtra
 from .file_extractor import BaseFileExtractor
 from .git_initializer import GitPullError, GitRepositoryInitializationError, GitRepositoryInitializer
 from .language import StepPrefixesModel
-from .report_manager import ReportManager, ReportPresenceResolution
+from .report_manager import (
+    AllureRunResults,
+    ReportManager,
+    ReportPresenceResolution,
+    get_failed_scenarios,
+    merge_allure_results,
+    split_allure_results,
+)
 from .settings import (
     OverhaveAdminSettings,
     OverhaveDescriptionManagerSettings,
@@ -20,5 +27,6 @@ from .settings import (
     OverhaveLanguageSettings,
     OverhaveReportManagerSettings,
     OverhaveStepContextSettings,
+    OverhaveTestRunCoalescingSettings,
     ProcessorSettings,
 )
@@ -1,3 +1,4 @@
 # flake8: noqa
-from .models import ReportPresenceResolution
+from .models import AllureRunResults, ReportPresenceResolution
 from .report_manager import ReportManager
+from .results_splitter import get_failed_scenarios, merge_allure_results, split_allure_results
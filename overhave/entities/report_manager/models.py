@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from pathlib import Path
 
 from overhave.db import TestReportStatus
 
@@ -15,3 +16,16 @@ class ReportPresenceResolution:
     @property
     def not_ready(self) -> bool:
         return self.s3_enabled and not self.exists and self.report_status is TestReportStatus.GENERATED
+
+
+@dataclass(frozen=True)
+class AllureRunResults:
+    """Model for Allure results of one test run, which are split from results of tests batch."""
+
+    results_dir: Path
+    tests_count: int = 0
+    failed_count: int = 0
+
+    @property
+    def passed(self) -> bool:
+        return self.tests_count > 0 and self.failed_count == 0
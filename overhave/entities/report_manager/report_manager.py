@@ -54,10 +54,22 @@ class ReportManager:
             logger.exception("Error while generating Allure report!")
             return None
 
-    def _process_generated_report(self, test_run_id: int, report_dir: Path) -> None:
-        self._test_run_storage.set_report(run_id=test_run_id, status=TestReportStatus.GENERATED, report=report_dir.name)
+    def generate_allure_report(self, results_dir: Path) -> str | None:
+        """Generate Allure report without saving of its status, returns report name or None on failure."""
+        report_dir = self._file_settings.tmp_reports_dir / uuid1().hex
+        logger.debug("Allure report directory: %s", report_dir)
+
+        report_generation_returncode = self._generate_report(alluredir=results_dir, report_dir=report_dir)
+        if report_generation_returncode != 0:
+            return None
+        logger.debug("Allure report successfully generated to directory: %s", report_dir.as_posix())
+        return report_dir.name
+
+    def save_allure_report(self, test_run_id: int, report: str) -> None:
+        """Upload generated report into S3 and mark it as saved, when S3 is enabled."""
         if not self._s3_manager.enabled:
             return
+        report_dir = self._file_settings.tmp_reports_dir / report
         zip_report = self._archive_manager.archive_path(path=report_dir, extension=self._settings.archive_extension)
         logger.info("Zip Allure report: %s", zip_report)
         upload_result = self._s3_manager.upload_file(file=zip_report)
@@ -66,17 +78,6 @@ class ReportManager:
         self._test_run_storage.set_report(run_id=test_run_id, status=TestReportStatus.SAVED)
         zip_report.unlink()
 
-    def create_allure_report(self, test_run_id: int, results_dir: Path) -> None:
-        report_dir = self._file_settings.tmp_reports_dir / uuid1().hex
-        logger.debug("Allure report directory: %s", report_dir)
-
-        report_generation_returncode = self._generate_report(alluredir=results_dir, report_dir=report_dir)
-        if report_generation_returncode != 0:
-            self._test_run_storage.set_report(run_id=test_run_id, status=TestReportStatus.GENERATION_FAILED)
-            return
-        logger.debug("Allure report successfully generated to directory: %s", report_dir.as_posix())
-        self._process_generated_report(test_run_id=test_run_id, report_dir=report_dir)
-
     def get_report_precense_resolution(self, report: str, run_id: int) -> ReportPresenceResolution:  # noqa: C901
         report_index = Path(self._file_settings.tmp_reports_dir / report)
         report_dir = report_index.parent
@@ -0,0 +1,125 @@
+import json
+import logging
+import shutil
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from overhave.entities.report_manager.models import AllureRunResults
+
+logger = logging.getLogger(__name__)
+
+_RESULT_SUFFIX = "-result.json"
+_CONTAINER_SUFFIX = "-container.json"
+_ATTACHMENT_MARKER = "-attachment"
+_PACKAGE_LABEL = "package"
+_FAILED_STATUSES = frozenset(("failed", "broken"))
+
+
+def _iter_attachments(item: dict[str, Any]) -> Iterator[str]:
+    for attachment in item.get("attachments", []):
+        yield attachment["source"]
+    for step in item.get("steps", []):
+        yield from _iter_attachments(step)
+
+
+def _get_module_name(result: dict[str, Any]) -> str | None:
+    for label in result.get("labels", []):
+        if label.get("name") == _PACKAGE_LABEL:
+            return str(label["value"]).rsplit(".", 1)[-1]
+    return None
+
+
+def _match_results(
+    results_dir: Path, module_mapping: Mapping[str, int], owners: dict[str, int]
+) -> dict[int, AllureRunResults]:
+    tests_count = dict.fromkeys(module_mapping.values(), 0)
+    failed_count = dict.fromkeys(module_mapping.values(), 0)
+    for result_file in results_dir.glob(f"*{_RESULT_SUFFIX}"):
+        result = json.loads(result_file.read_bytes())
+        run_id = module_mapping.get(_get_module_name(result) or "")
+        if run_id is None:
+            logger.warning("Could not match Allure result '%s' with any test run of batch", result_file.name)
+            continue
+        owners[result["uuid"]] = run_id
+        owners[result_file.name] = run_id
+        owners.update(dict.fromkeys(_iter_attachments(result), run_id))
+        tests_count[run_id] += 1
+        if result.get("status") in _FAILED_STATUSES:
+            failed_count[run_id] += 1
+    return {
+        run_id: AllureRunResults(
+            results_dir=results_dir / f"run-{run_id}",
+            tests_count=tests_count[run_id],
+            failed_count=failed_count[run_id],
+        )
+        for run_id in tests_count
+    }
+
+
+def _match_containers(results_dir: Path, owners: dict[str, int]) -> None:
+    for container_file in results_dir.glob(f"*{_CONTAINER_SUFFIX}"):
+        container = json.loads(container_file.read_bytes())
+        run_id = next((owners[x] for x in container.get("children", []) if x in owners), None)
+        if run_id is None:
+            continue
+        owners[container_file.name] = run_id
+        for fixture in (*container.get("befores", []), *container.get("afters", [])):
+            owners.update(dict.fromkeys(_iter_attachments(fixture), run_id))
+
+
+def _is_test_file(file: Path) -> bool:
+    return file.name.endswith((_RESULT_SUFFIX, _CONTAINER_SUFFIX)) or _ATTACHMENT_MARKER in file.name
+
+
+def split_allure_results(results_dir: Path, module_mapping: Mapping[str, int]) -> dict[int, AllureRunResults]:
+    """Split Allure results of tests batch by test runs.
+
+    Every test run of batch is collected from its own fixture module, so test results are matched to runs
+    with ```package``` label, which contains module name. Containers and attachments follow their test results,
+    other files (environment, categories) are copied for every test run.
+    """
+    owners: dict[str, int] = {}
+    run_results = _match_results(results_dir=results_dir, module_mapping=module_mapping, owners=owners)
+    _match_containers(results_dir=results_dir, owners=owners)
+    for results in run_results.values():
+        results.results_dir.mkdir(exist_ok=True)
+
+    for file in results_dir.iterdir():
+        if not file.is_file():
+            continue
+        owner = owners.get(file.name)
+        if owner is not None:
+            shutil.copy(file, run_results[owner].results_dir)
+            continue
+        if _is_test_file(file):
+            continue
+        for results in run_results.values():
+            shutil.copy(file, results.results_dir)
+    return run_results
+
+
+def merge_allure_results(source_dirs: Iterable[Path], results_dir: Path) -> None:
+    """Merge Allure results of several directories, e.g. of test run shards, into ```results_dir```.
+
+    Names of test results, containers and attachments are unique, so only common files are overwritten.
+    """
+    results_dir.mkdir(parents=True, exist_ok=True)
+    for source_dir in source_dirs:
+        for file in source_dir.iterdir():
+            if file.is_file():
+                shutil.copy(file, results_dir)
+
+
+def get_failed_scenarios(results_dir: Path) -> list[str]:
+    """Get sorted names of failed and broken tests from Allure results.
+
+    Overhave plugin sets names of scenarios as titles of pytest-bdd tests, so names of tests of scenario outline
+    examples are the same.
+    """
+    failed_scenarios: set[str] = set()
+    for result_file in results_dir.glob(f"*{_RESULT_SUFFIX}"):
+        result = json.loads(result_file.read_bytes())
+        if result.get("status") in _FAILED_STATUSES:
+            failed_scenarios.add(result["name"])
+    return sorted(failed_scenarios)
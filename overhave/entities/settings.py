@@ -28,12 +28,20 @@ class OverhaveAdminSettings(BaseOverhavePrefix):
     # Threadpool size for admin service
     threadpool_process_num: int = 5
 
+    # Number of processes for test runs, when consumers are disabled. When specified, every test run is
+    # executed in its own process and runs over this number wait in queue, otherwise test runs use threadpool.
+    test_run_processes: int | None = Field(default=None, ge=1)
+
     # Force filling the tasks field in feature creation
     strict_feature_tasks: bool = False
 
     # Link to support chat
     support_chat_url: httpx.URL | None = Field(default=None)
 
+    @property
+    def process_pool_enabled(self) -> bool:
+        return not self.consumer_based and self.test_run_processes is not None
+
     @field_validator("support_chat_url", mode="before")
     def validate_url(cls, v: str | httpx.URL) -> httpx.URL:
         if isinstance(v, str):
@@ -120,6 +128,15 @@ class ProcessorSettings(BaseOverhavePrefix):
     processes_num: int = 5
 
 
+class OverhaveTestRunCoalescingSettings(BaseOverhavePrefix):
+    """Settings for coalescing of duplicate test runs."""
+
+    # Time window, in which duplicate test runs of scenario with the same text are attached to the canonical
+    # queued or running test run instead of new execution. Coalescing is disabled by default.
+    test_run_coalescing_window: timedelta | None = None
+    test_run_coalescing_key_prefix: str = "test-run-coalescing"
+
+
 class OverhaveEmulationSettings(BaseOverhavePrefix):
     """Settings for Overhave Emulator, which emulates session with test user."""
 
@@ -12,7 +12,7 @@ from .components import (
     PublicationFactory,
     TestExecutionFactory,
 )
-from .consumer_factory import ConsumerFactory
+from .consumer_factory import AsyncConsumerFactory, ConsumerFactory
 from .context import (
     OverhaveAdminContext,
     OverhaveEmulationContext,
@@ -19,6 +19,7 @@ from overhave.storage import (
     FeatureTypeStorage,
     IDraftStorage,
     IEmulationStorage,
+    IFeatureStorage,
     IFeatureTypeStorage,
     IScenarioStorage,
     ISystemUserStorage,
@@ -27,7 +28,7 @@ from overhave.storage import (
     SystemUserStorage,
     TestRunStorage,
 )
-from overhave.test_execution import PytestRunner, StepCollector
+from overhave.test_execution import PytestRunner, PytestWorkerPool, PytestWorkersPlanner, StepCollector
 from overhave.transport import S3Manager
 from overhave.transport.redis.deps import get_redis_settings, make_redis
 
@@ -69,6 +70,11 @@ class IOverhaveFactory(Generic[TApplicationContext], abc.ABC):
     def scenario_storage(self) -> IScenarioStorage:
         pass
 
+    @property
+    @abc.abstractmethod
+    def feature_storage(self) -> IFeatureStorage:
+        pass
+
     @property
     @abc.abstractmethod
     def step_collector(self) -> StepCollector:
@@ -210,6 +216,10 @@ class BaseOverhaveFactory(IOverhaveFactory[TApplicationContext]):
     def scenario_storage(self) -> IScenarioStorage:
         return self._scenario_storage
 
+    @property
+    def feature_storage(self) -> IFeatureStorage:
+        return self._feature_storage
+
     @cached_property
     def _step_collector(self) -> StepCollector:
         return StepCollector(
@@ -230,12 +240,22 @@ class BaseOverhaveFactory(IOverhaveFactory[TApplicationContext]):
 
     @cached_property
     def _test_runner(self) -> PytestRunner:
-        return PytestRunner(settings=self.context.test_settings)
+        if self.context.test_settings.prefork_workers is None:
+            return PytestRunner(settings=self.context.test_settings)
+        return PytestRunner(
+            settings=self.context.test_settings, worker_pool=PytestWorkerPool(settings=self.context.test_settings)
+        )
 
     @property
     def test_runner(self) -> PytestRunner:
         return self._test_runner
 
+    @cached_property
+    def _workers_planner(self) -> PytestWorkersPlanner:
+        return PytestWorkersPlanner(
+            settings=self.context.test_settings, step_prefixes=self.context.language_settings.step_prefixes
+        )
+
     @cached_property
     def _system_user_storage(self) -> ISystemUserStorage:
         return SystemUserStorage()
@@ -10,6 +10,7 @@ from overhave.entities import (
     DefaultAdminAuthorizationManager,
     IAdminAuthorizationManager,
     LDAPAdminAuthorizationManager,
+    OverhaveTestRunCoalescingSettings,
     ReportManager,
     SimpleAdminAuthorizationManager,
 )
@@ -17,18 +18,40 @@ from overhave.factory.base_factory import IOverhaveFactory
 from overhave.factory.components.s3_init_factory import FactoryWithS3ManagerInit
 from overhave.factory.context import OverhaveAdminContext
 from overhave.metrics import get_common_metric_container
-from overhave.storage import IFeatureTypeStorage, SystemUserGroupStorage
+from overhave.storage import (
+    IFeatureTypeStorage,
+    ITestRunCoalescingStorage,
+    SystemUserGroupStorage,
+    TestRunCoalescingStorage,
+)
+from overhave.test_execution import ChangeImpactAnalyzer, ITestExecutor, TestRunProcessPool
 from overhave.transport import (
+    BaseRedisTask,
     EmulationTask,
+    ITaskProducer,
     LDAPAuthenticator,
+    LocalProducer,
     PublicationTask,
     RedisProducer,
     RedisStream,
     TestRunTask,
 )
+from overhave.transport.local.deps import get_local_broker, get_local_transport_settings
 from overhave.transport.redis.deps import get_redis_settings, make_redis
 
 
+def _get_test_executor() -> ITestExecutor:
+    """Prepare test executor in process of :class:`TestRunProcessPool`."""
+    from overhave.factory.getters import get_test_execution_factory
+    from overhave.pytest_plugin import get_proxy_manager
+
+    test_execution_factory = get_test_execution_factory()
+    proxy_manager = get_proxy_manager()
+    proxy_manager.clear_factory()
+    proxy_manager.set_factory(test_execution_factory)
+    return test_execution_factory.local_test_executor
+
+
 class IAdminFactory(IOverhaveFactory[OverhaveAdminContext]):
     """Factory interface for Overhave admin application."""
 
@@ -44,7 +67,12 @@ class IAdminFactory(IOverhaveFactory[OverhaveAdminContext]):
 
     @property
     @abc.abstractmethod
-    def redis_producer(self) -> RedisProducer:
+    def redis_producer(self) -> ITaskProducer:
+        pass
+
+    @property
+    @abc.abstractmethod
+    def test_run_coalescing_storage(self) -> ITestRunCoalescingStorage:
         pass
 
     @property
@@ -57,6 +85,16 @@ class IAdminFactory(IOverhaveFactory[OverhaveAdminContext]):
     def threadpool(self) -> ThreadPool:
         pass
 
+    @property
+    @abc.abstractmethod
+    def test_run_pool(self) -> TestRunProcessPool:
+        pass
+
+    @property
+    @abc.abstractmethod
+    def change_impact_analyzer(self) -> ChangeImpactAnalyzer:
+        pass
+
 
 class AdminFactory(FactoryWithS3ManagerInit[OverhaveAdminContext], IAdminFactory):
     """Factory for Overhave admin application."""
@@ -105,22 +143,42 @@ class AdminFactory(FactoryWithS3ManagerInit[OverhaveAdminContext], IAdminFactory
         return walrus.Database(connection_pool=redis.connection_pool)
 
     @cached_property
-    def _redis_producer(self) -> RedisProducer:
+    def _redis_producer(self) -> ITaskProducer:
+        mapping: dict[type[BaseRedisTask], RedisStream] = {
+            TestRunTask: RedisStream.TEST,
+            PublicationTask: RedisStream.PUBLICATION,
+            EmulationTask: RedisStream.EMULATION,
+        }
+        if get_local_transport_settings().enabled:
+            return LocalProducer(
+                settings=get_redis_settings(),
+                mapping=mapping,
+                broker=get_local_broker(),
+                metric_container=get_common_metric_container(),
+            )
         return RedisProducer(
             settings=get_redis_settings(),
-            mapping={
-                TestRunTask: RedisStream.TEST,
-                PublicationTask: RedisStream.PUBLICATION,
-                EmulationTask: RedisStream.EMULATION,
-            },
+            mapping=mapping,
             database=self._database,
             metric_container=get_common_metric_container(),
         )
 
     @property
-    def redis_producer(self) -> RedisProducer:
+    def redis_producer(self) -> ITaskProducer:
         return self._redis_producer
 
+    @cached_property
+    def _test_run_coalescing_storage(self) -> ITestRunCoalescingStorage:
+        return TestRunCoalescingStorage(
+            settings=OverhaveTestRunCoalescingSettings(),
+            redis=make_redis(get_redis_settings()),
+            test_run_storage=self.test_run_storage,
+        )
+
+    @property
+    def test_run_coalescing_storage(self) -> ITestRunCoalescingStorage:
+        return self._test_run_coalescing_storage
+
     @cached_property
     def _threadpool(self) -> ThreadPool:
         if self.context.admin_settings.consumer_based:
@@ -130,3 +188,26 @@ class AdminFactory(FactoryWithS3ManagerInit[OverhaveAdminContext], IAdminFactory
     @property
     def threadpool(self) -> ThreadPool:
         return self._threadpool
+
+    @cached_property
+    def _test_run_pool(self) -> TestRunProcessPool:
+        admin_settings = self.context.admin_settings
+        if admin_settings.test_run_processes is None or admin_settings.consumer_based:
+            raise RuntimeError("No test run processes pool, when it is not enabled for application!")
+        return TestRunProcessPool(processes=admin_settings.test_run_processes, executor_getter=_get_test_executor)
+
+    @property
+    def test_run_pool(self) -> TestRunProcessPool:
+        return self._test_run_pool
+
+    @cached_property
+    def _change_impact_analyzer(self) -> ChangeImpactAnalyzer:
+        return ChangeImpactAnalyzer(
+            step_collector=self.step_collector,
+            step_prefixes=self.context.language_settings.step_prefixes,
+            steps_dir=self.context.file_settings.steps_dir,
+        )
+
+    @property
+    def change_impact_analyzer(self) -> ChangeImpactAnalyzer:
+        return self._change_impact_analyzer
@@ -50,8 +50,6 @@ class PublicationFactory(BaseOverhaveFactory[OverhavePublicationContext], IPubli
     def _stash_publisher(self) -> StashVersionPublisher:
         return StashVersionPublisher(
             project_settings=self.context.project_settings,
-            feature_storage=self._feature_storage,
-            scenario_storage=self._scenario_storage,
             test_run_storage=self._test_run_storage,
             draft_storage=self._draft_storage,
             file_manager=self._file_manager,
@@ -71,8 +69,6 @@ class PublicationFactory(BaseOverhaveFactory[OverhavePublicationContext], IPubli
             raise UrlGitlabTokenizerNotScepifiedIfEnabled("Please set correct url for gitlab_tokenizer!")
         return GitlabVersionPublisher(
             project_settings=self.context.project_settings,
-            feature_storage=self._feature_storage,
-            scenario_storage=self._scenario_storage,
             test_run_storage=self._test_run_storage,
             draft_storage=self._draft_storage,
             file_manager=self._file_manager,
@@ -1,5 +1,9 @@
 import abc
+from datetime import timedelta
 from functools import cached_property
+from typing import Sequence
+
+import walrus
 
 from overhave.factory.base_factory import IOverhaveFactory
 from overhave.factory.components.abstract_consumer import ITaskConsumerFactory
@@ -7,7 +11,10 @@ from overhave.factory.components.s3_init_factory import FactoryWithS3ManagerInit
 from overhave.factory.context import OverhaveTestExecutionContext
 from overhave.metrics import TestRunOverhaveMetricContainer, get_test_metric_container
 from overhave.test_execution.executor import ITestExecutor, TestExecutor
-from overhave.transport import TestRunTask
+from overhave.test_execution.memoization import TestResultMemoizer
+from overhave.transport import ITaskProducer, LocalProducer, RedisProducer, RedisStream, TestRunTask
+from overhave.transport.local.deps import get_local_broker, get_local_transport_settings
+from overhave.transport.redis.deps import get_redis_settings, make_redis
 
 
 class ITestExecutionFactory(IOverhaveFactory[OverhaveTestExecutionContext], ITaskConsumerFactory[TestRunTask], abc.ABC):
@@ -18,6 +25,15 @@ class ITestExecutionFactory(IOverhaveFactory[OverhaveTestExecutionContext], ITas
     def test_executor(self) -> ITestExecutor:
         pass
 
+    @property
+    @abc.abstractmethod
+    def local_test_executor(self) -> ITestExecutor:
+        pass
+
+    @abc.abstractmethod
+    def process_tasks(self, tasks: Sequence[TestRunTask]) -> None:
+        pass
+
 
 class TestExecutionFactory(FactoryWithS3ManagerInit[OverhaveTestExecutionContext], ITestExecutionFactory):
     """Factory for Overhave test execution application."""
@@ -25,25 +41,88 @@ class TestExecutionFactory(FactoryWithS3ManagerInit[OverhaveTestExecutionContext
     context_cls = OverhaveTestExecutionContext
 
     @cached_property
-    def _test_executor(self) -> ITestExecutor:
+    def _shards_producer(self) -> ITaskProducer | None:
+        if self.context.test_settings.shards_max < 2:
+            return None
+        if get_local_transport_settings().enabled:
+            return LocalProducer(
+                settings=get_redis_settings(),
+                mapping={TestRunTask: RedisStream.TEST},
+                broker=get_local_broker(),
+                metric_container=self._metric_container,
+            )
+        return RedisProducer(
+            settings=get_redis_settings(),
+            mapping={TestRunTask: RedisStream.TEST},
+            database=walrus.Database(connection_pool=make_redis(get_redis_settings()).connection_pool),
+            metric_container=self._metric_container,
+        )
+
+    @cached_property
+    def _memoizer(self) -> TestResultMemoizer | None:
+        if not self.context.test_settings.memoization_enabled:
+            return None
+        return TestResultMemoizer(
+            settings=self.context.test_settings,
+            scenario_compiler=self._scenario_compiler,
+            fixture_content=self.context.project_settings.fixture_content,
+            steps_dir=self.context.file_settings.steps_dir,
+        )
+
+    @property
+    def _run_lease(self) -> timedelta | None:
+        """Lease of running test run, which expires before its task is reclaimed from crashed consumer.
+
+        Half of ```reclaim_idle_time``` is used, so the lease is expired despite skew of consumers clocks.
+        Tasks are not reclaimed with `at_most_once` delivery, so running test runs are never started again.
+        """
+        settings = get_redis_settings()
+        if not settings.ack_after_processing:
+            return None
+        return settings.reclaim_idle_time / 2
+
+    def _make_test_executor(self, task_producer: ITaskProducer | None) -> ITestExecutor:
         return TestExecutor(
             file_settings=self.context.file_settings,
-            feature_storage=self._feature_storage,
-            scenario_storage=self._scenario_storage,
             test_run_storage=self._test_run_storage,
             file_manager=self._file_manager,
             test_runner=self._test_runner,
             report_manager=self._report_manager,
             metric_container=self._metric_container,
+            batch_max_runs=self.context.test_settings.batch_max_runs,
+            workers_planner=self._workers_planner,
+            task_producer=task_producer,
+            shards_results_dir=self.context.test_settings.shards_results_dir,
+            memoizer=self._memoizer,
+            run_lease=self._run_lease,
         )
 
+    @cached_property
+    def _test_executor(self) -> ITestExecutor:
+        return self._make_test_executor(task_producer=self._shards_producer)
+
     @property
     def test_executor(self) -> ITestExecutor:
         return self._test_executor
 
+    @cached_property
+    def _local_test_executor(self) -> ITestExecutor:
+        """Test executor of test runs, which are executed without consumers.
+
+        Test runs are not sharded, because nobody consumes tasks of shards, so test runs would be never finished.
+        """
+        return self._make_test_executor(task_producer=None)
+
+    @property
+    def local_test_executor(self) -> ITestExecutor:
+        return self._local_test_executor
+
     def process_task(self, task: TestRunTask) -> None:
         return self._test_executor.process_test_task(task)
 
+    def process_tasks(self, tasks: Sequence[TestRunTask]) -> None:
+        return self._test_executor.process_test_tasks(tasks)
+
     @property
     def _metric_container(self) -> TestRunOverhaveMetricContainer:
         return get_test_metric_container()
@@ -1,61 +1,201 @@
+import logging
 from functools import cached_property, partial
-from typing import Callable
+from typing import Callable, Sequence
 
 import walrus
 
+from overhave.factory.components import ITestExecutionFactory
 from overhave.factory.getters import get_emulation_factory, get_publication_factory, get_test_execution_factory
 from overhave.metrics import BaseOverhaveMetricContainer
 from overhave.pytest_plugin import get_proxy_manager
 from overhave.transport import (
     AnyRedisTask,
+    AsyncRedisConsumerRunner,
     EmulationTask,
+    ITaskConsumer,
+    LocalConsumer,
+    LocalTransportError,
     PublicationTask,
     RedisConsumer,
     RedisConsumerRunner,
+    RedisLanesConsumer,
     RedisStream,
+    RedisStreamTrimmer,
     TestRunTask,
 )
-from overhave.transport.redis.deps import get_redis_settings, make_redis
+from overhave.transport.local.deps import get_local_broker, get_local_transport_settings
+from overhave.transport.redis.deps import get_redis_settings, make_async_redis, make_redis
 
+logger = logging.getLogger(__name__)
 
-class ConsumerFactory:
-    """Factory for :class:`RedisConsumer`, :class:`RedisConsumerRunner` and tasks mapping."""
 
-    def __init__(self, stream: RedisStream, metric_container: BaseOverhaveMetricContainer):
-        self._stream = stream
+class BaseConsumerFactory:
+    """Base factory for tasks mapping of Redis consumers."""
+
+    def __init__(self, metric_container: BaseOverhaveMetricContainer):
         self._metric_container = metric_container
 
+    @property
+    def use_local_transport(self) -> bool:
+        return get_local_transport_settings().enabled
+
     @cached_property
     def _database(self) -> walrus.Database:
         redis = make_redis(get_redis_settings())
         return walrus.Database(connection_pool=redis.connection_pool)
 
     @cached_property
-    def _consumer(self) -> RedisConsumer:
+    def _mapping(self) -> dict[type[AnyRedisTask], Callable[[AnyRedisTask], None]]:
+        return {
+            TestRunTask: self._process_test_execution_task,  # type: ignore
+            PublicationTask: get_publication_factory().process_task,  # type: ignore
+            EmulationTask: get_emulation_factory().process_task,  # type: ignore
+        }
+
+    @cached_property
+    def _test_execution_factory(self) -> ITestExecutionFactory:
+        factory = get_test_execution_factory()
+        proxy_manager = get_proxy_manager()
+        proxy_manager.set_factory(factory)
+        return factory
+
+    @cached_property
+    def _process_test_execution_task(self) -> Callable[[TestRunTask], None]:
+        return partial(
+            self._test_execution_factory.process_task,
+        )
+
+    @property
+    def _test_batch_size(self) -> int:
+        return self._test_execution_factory.context.test_settings.batch_max_runs
+
+    @property
+    def _test_runs_isolated(self) -> bool:
+        test_settings = self._test_execution_factory.context.test_settings
+        return test_settings.isolation_enabled or test_settings.prefork_workers is not None
+
+    def _get_concurrency(self, stream: RedisStream) -> int:
+        """Concurrency of ```stream```, test runs are run concurrently only in separate processes.
+
+        Pytest sessions share global state of the process, so concurrency of test stream is clamped to 1,
+        when test runs are neither isolated nor run by warm pytest workers.
+        """
+        concurrency = get_redis_settings().get_concurrency(stream)
+        if concurrency == 1 or stream is not RedisStream.TEST or self._test_runs_isolated:
+            return concurrency
+        logger.warning(
+            "Concurrency %s of stream %s requires isolation or prefork workers of test runs, so it is set to 1",
+            concurrency,
+            stream,
+        )
+        return 1
+
+    @cached_property
+    def _batch_mapping(self) -> dict[type[AnyRedisTask], Callable[[Sequence[AnyRedisTask]], None]]:
+        if self._test_batch_size <= 1:
+            return {}
+        return {TestRunTask: self._test_execution_factory.process_tasks}  # type: ignore
+
+
+class ConsumerFactory(BaseConsumerFactory):
+    """Factory for :class:`RedisConsumer`, :class:`RedisConsumerRunner` and tasks mapping.
+
+    With enabled local transport :class:`LocalConsumer` is used instead of :class:`RedisConsumer`.
+    """
+
+    def __init__(self, stream: RedisStream, metric_container: BaseOverhaveMetricContainer):
+        super().__init__(metric_container)
+        self._stream = stream
+
+    def _make_consumer(self, stream_key: str) -> ITaskConsumer:
+        if self.use_local_transport:
+            return LocalConsumer(
+                settings=get_redis_settings(),
+                stream_name=self._stream,
+                broker=get_local_broker(),
+                metric_container=self._metric_container,
+                stream_key=stream_key,
+            )
         return RedisConsumer(
             settings=get_redis_settings(),
             stream_name=self._stream,
             database=self._database,
             metric_container=self._metric_container,
+            stream_key=stream_key,
         )
 
+    @cached_property
+    def _consumer(self) -> ITaskConsumer:
+        return self._make_consumer(self._stream.value)
+
+    @cached_property
+    def _lanes_consumer(self) -> ITaskConsumer:
+        lane_weights = get_redis_settings().get_lane_weights(self._stream)
+        if len(lane_weights) == 1:
+            return self._consumer
+        consumers = [self._consumer]
+        consumers.extend(self._make_consumer(stream_key) for stream_key in lane_weights if stream_key != self._stream)
+        return RedisLanesConsumer(consumers=consumers, weights=list(lane_weights.values()))
+
     @cached_property
     def runner(self) -> RedisConsumerRunner:
-        return RedisConsumerRunner(consumer=self._consumer, mapping=self._mapping)
+        settings = get_redis_settings()
+        batch_mapping: dict[type[AnyRedisTask], Callable[[Sequence[AnyRedisTask]], None]] = {}
+        batch_size = 1
+        if self._stream is RedisStream.TEST:
+            batch_mapping = self._batch_mapping
+            batch_size = self._test_batch_size
+        return RedisConsumerRunner(
+            consumer=self._lanes_consumer,
+            mapping=self._mapping,
+            concurrency=self._get_concurrency(self._stream),
+            batch_mapping=batch_mapping,
+            batch_size=batch_size,
+            max_tasks=settings.consumer_max_tasks,
+            max_rss=settings.consumer_max_rss,
+        )
 
     @cached_property
-    def _mapping(self) -> dict[type[AnyRedisTask], Callable[[AnyRedisTask], None]]:
-        return {
-            TestRunTask: self._process_test_execution_task,  # type: ignore
-            PublicationTask: get_publication_factory().process_task,  # type: ignore
-            EmulationTask: get_emulation_factory().process_task,  # type: ignore
-        }
+    def trimmer(self) -> RedisStreamTrimmer:
+        return RedisStreamTrimmer(
+            settings=get_redis_settings(),
+            streams=list(get_redis_settings().get_lane_weights(self._stream)),
+            database=self._database,
+            metric_container=self._metric_container,
+        )
+
+
+class AsyncConsumerFactory(BaseConsumerFactory):
+    """Factory for :class:`AsyncRedisConsumerRunner`, which consumes tasks from several ```streams```.
+
+    Runner reads Redis streams with asyncio client, so local transport is not supported.
+    """
+
+    def __init__(self, streams: Sequence[RedisStream], metric_container: BaseOverhaveMetricContainer):
+        super().__init__(metric_container)
+        self._streams = streams
 
     @cached_property
-    def _process_test_execution_task(self) -> Callable[[TestRunTask], None]:
-        factory = get_test_execution_factory()
-        proxy_manager = get_proxy_manager()
-        proxy_manager.set_factory(factory)
-        return partial(
-            factory.process_task,
+    def runner(self) -> AsyncRedisConsumerRunner:
+        if self.use_local_transport:
+            raise LocalTransportError("Local transport is not supported by asyncio consumer, use `consumer` instead!")
+        settings = get_redis_settings()
+        return AsyncRedisConsumerRunner(
+            settings=settings,
+            streams=self._streams,
+            redis=make_async_redis(settings),
+            mapping=self._mapping,
+            metric_container=self._metric_container,
+            concurrency={stream: self._get_concurrency(stream) for stream in self._streams},
+        )
+
+    @cached_property
+    def trimmer(self) -> RedisStreamTrimmer:
+        return RedisStreamTrimmer(
+            settings=get_redis_settings(),
+            streams=[
+                stream_key for stream in self._streams for stream_key in get_redis_settings().get_lane_weights(stream)
+            ],
+            database=self._database,
+            metric_container=self._metric_container,
         )
@@ -1,6 +1,6 @@
 import logging
 
-from prometheus_client import CollectorRegistry, Counter
+from prometheus_client import CollectorRegistry, Counter, Gauge
 
 logger = logging.getLogger(__name__)
 
@@ -25,12 +25,73 @@ class BaseOverhaveMetricContainer:
             labelnames=("task_type",),
             registry=self.registry,
         )
+        self.dead_letter_redis_tasks = Counter(
+            "dead_letter_redis_tasks",
+            "How many redis tasks have been moved to dead-letter streams",
+            labelnames=("task_type",),
+            registry=self.registry,
+        )
+        self.trimmed_redis_tasks = Counter(
+            "trimmed_redis_tasks",
+            "How many redis tasks have been trimmed from streams by retention policy",
+            labelnames=("task_type",),
+            registry=self.registry,
+        )
+        self.redis_stream_length = Gauge(
+            "redis_stream_length",
+            "Number of entries in redis stream",
+            labelnames=("task_type",),
+            registry=self.registry,
+        )
+        self.redis_stream_memory = Gauge(
+            "redis_stream_memory_bytes",
+            "Memory usage of redis stream in bytes",
+            labelnames=("task_type",),
+            registry=self.registry,
+        )
+        self.redis_stream_backlog = Gauge(
+            "redis_stream_backlog",
+            "Number of redis tasks, which are not delivered or not acknowledged by the slowest consumer group",
+            labelnames=("task_type",),
+            registry=self.registry,
+        )
+        self.redis_stream_backlog_threshold = Gauge(
+            "redis_stream_backlog_threshold",
+            "Backlog of redis tasks, above which new tasks are rejected by admission control",
+            labelnames=("task_type",),
+            registry=self.registry,
+        )
+        self.rejected_redis_tasks = Counter(
+            "rejected_redis_tasks",
+            "How many redis tasks have been rejected by admission control",
+            labelnames=("task_type",),
+            registry=self.registry,
+        )
+
+    def produce_redis_task(self, task_type: str, count: int = 1) -> None:
+        self.produced_redis_tasks.labels(task_type=task_type).inc(count)
+
+    def consume_redis_task(self, task_type: str, count: int = 1) -> None:
+        self.consumed_redis_tasks.labels(task_type=task_type).inc(count)
+
+    def dead_letter_redis_task(self, task_type: str) -> None:
+        self.dead_letter_redis_tasks.labels(task_type=task_type).inc()
+
+    def trim_redis_tasks(self, task_type: str, count: int) -> None:
+        self.trimmed_redis_tasks.labels(task_type=task_type).inc(count)
+
+    def observe_redis_stream(self, task_type: str, length: int, memory: int) -> None:
+        self.redis_stream_length.labels(task_type=task_type).set(length)
+        self.redis_stream_memory.labels(task_type=task_type).set(memory)
+
+    def observe_redis_backlog(self, task_type: str, backlog: int) -> None:
+        self.redis_stream_backlog.labels(task_type=task_type).set(backlog)
 
-    def produce_redis_task(self, task_type: str) -> None:
-        self.produced_redis_tasks.labels(task_type=task_type).inc()
+    def observe_redis_backlog_threshold(self, task_type: str, threshold: int) -> None:
+        self.redis_stream_backlog_threshold.labels(task_type=task_type).set(threshold)
 
-    def consume_redis_task(self, task_type: str) -> None:
-        self.consumed_redis_tasks.labels(task_type=task_type).inc()
+    def reject_redis_tasks(self, task_type: str, count: int) -> None:
+        self.rejected_redis_tasks.labels(task_type=task_type).inc(count)
 
 
 class TestRunOverhaveMetricContainer(BaseOverhaveMetricContainer):
@@ -9,7 +9,7 @@ from overhave.metrics import PublicationOverhaveMetricContainer
 from overhave.publication.abstract_publisher import IVersionPublisher
 from overhave.publication.errors import BaseGitVersionPublisherError
 from overhave.scenario import FileManager, OverhaveProjectSettings, generate_task_info
-from overhave.storage import IDraftStorage, IFeatureStorage, IScenarioStorage, ITestRunStorage, PublisherContext
+from overhave.storage import IDraftStorage, ITestRunStorage, PublisherContext
 from overhave.transport import PublicationTask
 
 logger = logging.getLogger(__name__)
@@ -21,16 +21,12 @@ class BaseVersionPublisher(IVersionPublisher, abc.ABC):
     def __init__(
         self,
         project_settings: OverhaveProjectSettings,
-        feature_storage: IFeatureStorage,
-        scenario_storage: IScenarioStorage,
         test_run_storage: ITestRunStorage,
         draft_storage: IDraftStorage,
         file_manager: FileManager,
         metric_container: PublicationOverhaveMetricContainer,
     ) -> None:
         self._project_settings = project_settings
-        self._feature_storage = feature_storage
-        self._scenario_storage = scenario_storage
         self._test_run_storage = test_run_storage
         self._draft_storage = draft_storage
         self._file_manager = file_manager
@@ -42,20 +38,13 @@ class BaseVersionPublisher(IVersionPublisher, abc.ABC):
 
     def _compile_context(self, draft_id: int) -> PublisherContext:
         with db.create_session() as session:
-            draft_model = self._draft_storage.draft_model_by_id(session=session, draft_id=draft_id)
-            test_run_model = self._test_run_storage.testrun_model_by_id(session=session, run_id=draft_model.test_run_id)
-            feature_model = self._feature_storage.feature_model_by_id(
-                session=session, feature_id=draft_model.feature_id
-            )
-            scenario_model = self._scenario_storage.scenario_model_by_id(
-                session=session, scenario_id=test_run_model.scenario_id
-            )
+            draft_model, context = self._draft_storage.draft_context_by_id(session=session, draft_id=draft_id)
         return PublisherContext(
-            feature=feature_model,
-            scenario=scenario_model,
-            test_run=test_run_model,
+            feature=context.feature,
+            scenario=context.scenario,
+            test_run=context.test_run,
             draft=draft_model,
-            target_branch=f"bdd-feature-{feature_model.id}",
+            target_branch=f"bdd-feature-{context.feature.id}",
         )
 
     def _compile_publication_description(self, context: PublisherContext) -> str:
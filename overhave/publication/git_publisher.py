@@ -15,7 +15,7 @@ from overhave.publication.errors import (
 )
 from overhave.publication.settings import GitPublisherSettings
 from overhave.scenario import FileManager, OverhaveProjectSettings
-from overhave.storage import IDraftStorage, IFeatureStorage, IScenarioStorage, ITestRunStorage, PublisherContext
+from overhave.storage import IDraftStorage, ITestRunStorage, PublisherContext
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +26,6 @@ class GitVersionPublisher(Generic[GitPublisherSettings], BaseVersionPublisher, a
     def __init__(
         self,
         project_settings: OverhaveProjectSettings,
-        feature_storage: IFeatureStorage,
-        scenario_storage: IScenarioStorage,
         test_run_storage: ITestRunStorage,
         draft_storage: IDraftStorage,
         file_manager: FileManager,
@@ -37,8 +35,6 @@ class GitVersionPublisher(Generic[GitPublisherSettings], BaseVersionPublisher, a
     ) -> None:
         super().__init__(
             project_settings=project_settings,
-            feature_storage=feature_storage,
-            scenario_storage=scenario_storage,
             test_run_storage=test_run_storage,
             draft_storage=draft_storage,
             file_manager=file_manager,
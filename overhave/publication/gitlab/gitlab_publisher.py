@@ -11,7 +11,7 @@ from overhave.publication.git_publisher import GitVersionPublisher
 from overhave.publication.gitlab.settings import OverhaveGitlabPublisherSettings
 from overhave.publication.gitlab.tokenizer.client import TokenizerClient
 from overhave.scenario import FileManager, OverhaveProjectSettings
-from overhave.storage import IDraftStorage, IFeatureStorage, IScenarioStorage, ITestRunStorage
+from overhave.storage import IDraftStorage, ITestRunStorage
 from overhave.transport.http.gitlab_client import GitlabHttpClient, GitlabMrRequest
 
 logger = logging.getLogger(__name__)
@@ -23,8 +23,6 @@ class GitlabVersionPublisher(GitVersionPublisher[OverhaveGitlabPublisherSettings
     def __init__(
         self,
         project_settings: OverhaveProjectSettings,
-        feature_storage: IFeatureStorage,
-        scenario_storage: IScenarioStorage,
         test_run_storage: ITestRunStorage,
         draft_storage: IDraftStorage,
         file_manager: FileManager,
@@ -36,8 +34,6 @@ class GitlabVersionPublisher(GitVersionPublisher[OverhaveGitlabPublisherSettings
     ):
         super().__init__(
             project_settings=project_settings,
-            feature_storage=feature_storage,
-            scenario_storage=scenario_storage,
             test_run_storage=test_run_storage,
             draft_storage=draft_storage,
             file_manager=file_manager,
@@ -8,7 +8,7 @@ from overhave.metrics import PublicationOverhaveMetricContainer
 from overhave.publication.git_publisher import GitVersionPublisher
 from overhave.publication.stash.settings import OverhaveStashPublisherSettings
 from overhave.scenario import FileManager, OverhaveProjectSettings
-from overhave.storage import IDraftStorage, IFeatureStorage, IScenarioStorage, ITestRunStorage
+from overhave.storage import IDraftStorage, ITestRunStorage
 from overhave.transport import (
     StashBranch,
     StashErrorResponse,
@@ -27,8 +27,6 @@ class StashVersionPublisher(GitVersionPublisher[OverhaveStashPublisherSettings])
     def __init__(
         self,
         project_settings: OverhaveProjectSettings,
-        feature_storage: IFeatureStorage,
-        scenario_storage: IScenarioStorage,
         test_run_storage: ITestRunStorage,
         draft_storage: IDraftStorage,
         file_manager: FileManager,
@@ -39,8 +37,6 @@ class StashVersionPublisher(GitVersionPublisher[OverhaveStashPublisherSettings])
     ):
         super().__init__(
             project_settings=project_settings,
-            feature_storage=feature_storage,
-            scenario_storage=scenario_storage,
             test_run_storage=test_run_storage,
             draft_storage=draft_storage,
             file_manager=file_manager,
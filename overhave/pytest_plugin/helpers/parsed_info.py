@@ -1,24 +1,84 @@
+import functools
+import hashlib
+from dataclasses import asdict
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
+from _pytest.cacheprovider import Cache
 from _pytest.nodes import Item
-from pytest_bdd.parser import Scenario
+from pydantic import TypeAdapter, ValidationError
 
 from overhave.pytest_plugin.helpers.bdd_item import get_scenario
-from overhave.scenario import FeatureInfo, ScenarioParser
+from overhave.scenario import FeatureInfo, ScenarioParser, load_feature_info
 
+_CACHE_KEY_PREFIX = "overhave/feature_info"
+_FEATURE_INFO_ADAPTER = TypeAdapter(FeatureInfo)
 
-def _parse_feature_info_from_file(scenario: Scenario, scenario_parser: ScenarioParser) -> FeatureInfo:
-    feature_txt = Path(scenario.feature.filename).read_text()
-    return cast(FeatureInfo, scenario_parser.parse(feature_txt))
+
+class FeatureInfoCache:
+    """Cache of feature infos of feature files by path and modification time.
+
+    Feature file is loaded once per session: from sidecar file of compiled feature or by parsing of feature file.
+    Parsed infos are also kept in pytest ```cache```, so xdist workers and next sessions do not parse the same
+    version of feature file again. Infos are cached for :attr:`ScenarioParser.fingerprint` of parser settings.
+    """
+
+    def __init__(self) -> None:
+        self._infos: dict[tuple[Path, int, str], FeatureInfo] = {}
+
+    @staticmethod
+    def _get_cache_key(path: Path) -> str:
+        return f"{_CACHE_KEY_PREFIX}/{hashlib.sha256(path.as_posix().encode()).hexdigest()}"
+
+    def _load(self, path: Path, version: dict[str, Any], cache: Cache | None) -> FeatureInfo | None:
+        if cache is None:
+            return None
+        value: Any = cache.get(self._get_cache_key(path), None)
+        if not isinstance(value, dict) or value.get("version") != version:
+            return None
+        try:
+            return _FEATURE_INFO_ADAPTER.validate_python(value.get("info"))
+        except ValidationError:
+            return None
+
+    def _save(self, path: Path, version: dict[str, Any], feature_info: FeatureInfo, cache: Cache | None) -> None:
+        if cache is None:
+            return
+        info = _FEATURE_INFO_ADAPTER.dump_python(FeatureInfo(**asdict(feature_info)), mode="json")
+        cache.set(self._get_cache_key(path), {"version": version, "info": info})
+
+    def get(self, feature_file: Path, scenario_parser: ScenarioParser, cache: Cache | None = None) -> FeatureInfo:
+        path = feature_file.resolve()
+        mtime_ns = path.stat().st_mtime_ns
+        fingerprint = scenario_parser.fingerprint
+        feature_info = self._infos.get((path, mtime_ns, fingerprint))
+        if feature_info is not None:
+            return feature_info
+        version = {"mtime_ns": mtime_ns, "parser": fingerprint}
+        feature_info = load_feature_info(path) or self._load(path, version=version, cache=cache)
+        if feature_info is None:
+            feature_info = cast(FeatureInfo, scenario_parser.parse(path.read_text()))
+            self._save(path, version=version, feature_info=feature_info, cache=cache)
+        self._infos[(path, mtime_ns, fingerprint)] = feature_info
+        return feature_info
+
+
+@functools.cache
+def get_feature_info_cache() -> FeatureInfoCache:
+    return FeatureInfoCache()
+
+
+def clear_feature_info_cache() -> None:
+    get_feature_info_cache.cache_clear()
 
 
 def set_feature_info_for_item(item: Item, scenario_parser: ScenarioParser) -> None:
-    setattr(
-        item,
-        "feature_info",
-        _parse_feature_info_from_file(scenario=get_scenario(item), scenario_parser=scenario_parser),
+    feature_info = get_feature_info_cache().get(
+        Path(get_scenario(item).feature.filename),
+        scenario_parser=scenario_parser,
+        cache=getattr(item.config, "cache", None),
     )
+    setattr(item, "feature_info", feature_info)
 
 
 def get_feature_info_from_item(item: Item) -> FeatureInfo:
@@ -4,7 +4,9 @@ from typing import Any, Callable
 import _pytest
 import allure
 import httpx
+import pytest
 from _pytest.config import Config
+from _pytest.config.argparsing import Parser
 from _pytest.fixtures import FixtureRequest
 from _pytest.main import Session
 from _pytest.nodes import Item
@@ -18,14 +20,17 @@ from overhave.pytest_plugin.helpers import (
     add_admin_feature_link_to_report,
     add_scenario_title_to_report,
     add_task_links_to_report,
+    clear_feature_info_cache,
     get_feature_info_from_item,
     get_full_step_name,
+    get_scenario,
     is_pytest_bdd_item,
     set_feature_info_for_item,
     set_git_project_url_if_necessary,
     set_severity_level,
 )
 from overhave.pytest_plugin.proxy_manager import get_proxy_manager
+from overhave.test_execution import SCENARIOS_OPTION, SHARD_OPTION, PytestShard, is_selected_scenario
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +39,66 @@ class StepNotFoundError(RuntimeError):
     """Exception for situation with missing or incorrect step definition."""
 
 
+class ShardSelector:
+    """Plugin for deselection of tests, which do not belong to specified shard of test run."""
+
+    def __init__(self, shard: PytestShard) -> None:
+        self._shard = shard
+
+    def pytest_collection_modifyitems(self, config: Config, items: list[Item]) -> None:
+        items[:], deselected = self._shard.select(items)
+        config.hook.pytest_deselected(items=deselected)
+
+
+class ScenariosSelector:
+    """Plugin for deselection of tests of scenarios, which are not specified by names or 1-based indices."""
+
+    def __init__(self, scenarios: list[str]) -> None:
+        self._scenarios = frozenset(scenarios)
+
+    def _is_selected(self, item: Item) -> bool:
+        if not is_pytest_bdd_item(item):
+            return False
+        scenario = get_scenario(item)
+        index = list(scenario.feature.scenarios).index(scenario.name) + 1
+        return is_selected_scenario(name=scenario.name, index=index, scenarios=self._scenarios)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, config: Config, items: list[Item]) -> None:
+        selected: list[Item] = []
+        deselected: list[Item] = []
+        for item in items:
+            if self._is_selected(item):
+                selected.append(item)
+                continue
+            deselected.append(item)
+        items[:] = selected
+        config.hook.pytest_deselected(items=deselected)
+
+
+def pytest_addoption(parser: Parser) -> None:
+    parser.getgroup("overhave").addoption(
+        SHARD_OPTION,
+        type=PytestShard.parse,
+        default=None,
+        help="Run only shard of collected tests, specified in format <index>/<count>",
+    )
+    parser.getgroup("overhave").addoption(
+        SCENARIOS_OPTION,
+        action="append",
+        default=None,
+        help="Run only scenario with specified name or 1-based index in feature, could be specified several times",
+    )
+
+
 def pytest_configure(config: Config) -> None:
     """Patch pytest_bdd objects in current hook."""
+    shard: PytestShard | None = config.getoption(SHARD_OPTION, default=None)
+    if shard is not None:
+        config.pluginmanager.register(ShardSelector(shard), "overhave-shard-selector")
+    scenarios: list[str] | None = config.getoption(SCENARIOS_OPTION, default=None)
+    if scenarios:
+        config.pluginmanager.register(ScenariosSelector(scenarios), "overhave-scenarios-selector")
     proxy_manager = get_proxy_manager()
     if not proxy_manager.has_factory:
         logger.debug("Overhave ProxyManager has not got prepared factory, so skip injection.")
@@ -158,6 +221,11 @@ def pytest_runtest_setup(item: Item) -> None:
     )
 
 
+def pytest_sessionfinish(session: Session, exitstatus: int) -> None:
+    """Hook for purgation of in-memory feature infos, which are loaded once per session."""
+    clear_feature_info_cache()
+
+
 def pytest_runtest_teardown(item: Item, nextitem: Item | None) -> None:
     """Hook for description attachment to Allure report."""
     if not get_proxy_manager().has_factory:
@@ -2,6 +2,7 @@
 from .compiler import IncorrectScenarioTextError, OverhaveScenarioCompilerSettings, ScenarioCompiler, generate_task_info
 from .file_manager import EmptyGitProjectURLError, EmptyTaskTrackerURLError, FileManager, OverhaveProjectSettings
 from .parser import (
+    FEATURE_INFO_SUFFIX,
     FeatureInfo,
     FeatureNameParsingError,
     NullableFeatureIdError,
@@ -9,5 +10,8 @@ from .parser import (
     ScenarioParser,
     StrictFeatureInfo,
     StrictFeatureParsingError,
+    get_feature_info_path,
+    load_feature_info,
+    save_feature_info,
 )
 from .validator import FeatureValidator, IFeatureValidator
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Sequence
 
 import allure
@@ -5,6 +6,7 @@ from pytest_bdd import types as default_types
 
 from overhave.entities import OverhaveLanguageSettings
 from overhave.scenario.compiler.settings import OverhaveScenarioCompilerSettings
+from overhave.scenario.parser.models import FeatureInfo
 from overhave.scenario.prefix_mixin import PrefixMixin
 from overhave.storage import TagModel, TestExecutorContext
 
@@ -45,9 +47,14 @@ class ScenarioCompiler(PrefixMixin):
             return ""
         return f"{self._compilation_settings.tag_prefix}{tag}"
 
+    def _get_header_tags(self, scenario_text: str, tags: list[TagModel]) -> list[str]:
+        return [tag.value for tag in tags if f"{self._compilation_settings.tag_prefix}{tag.value}" not in scenario_text]
+
     def _get_additional_tags(self, scenario_text: str, tags: list[TagModel]) -> str:
-        tags_with_prefix = (f"{self._compilation_settings.tag_prefix}{tag.value}" for tag in tags)
-        return f"{' '.join(tag for tag in tags_with_prefix if tag not in scenario_text)}"
+        tags_with_prefix = (
+            f"{self._compilation_settings.tag_prefix}{tag}" for tag in self._get_header_tags(scenario_text, tags)
+        )
+        return " ".join(tags_with_prefix)
 
     def _get_severity_tag(self, severity: allure.severity_level) -> str:
         return f"{self._compilation_settings.severity_prefix}{severity.value}"
@@ -115,3 +122,22 @@ class ScenarioCompiler(PrefixMixin):
 
     def compile(self, context: TestExecutorContext) -> str:
         return self._compile_header(context=context) + "\n" + context.scenario.text.strip("\n") + "\n"
+
+    def get_feature_info(self, context: TestExecutorContext) -> FeatureInfo:
+        """Get :class:`FeatureInfo`, which is equal to parsed header of compiled feature, without parsing."""
+        time_format = self._compilation_settings.time_format
+        tasks = None
+        if context.feature.task and self._tasks_keyword is not None:
+            tasks = context.feature.task
+        return FeatureInfo(
+            id=context.feature.id,
+            name=context.feature.name,
+            type=context.feature.feature_type.name,
+            tags=self._get_header_tags(scenario_text=context.scenario.text, tags=context.feature.feature_tags),
+            severity=context.feature.severity,
+            author=context.feature.author,
+            last_edited_by=context.feature.last_edited_by,
+            last_edited_at=datetime.strptime(context.feature.last_edited_at.strftime(time_format), time_format),
+            tasks=tasks,
+            scenarios=context.scenario.text.strip("\n") + "\n",
+        )
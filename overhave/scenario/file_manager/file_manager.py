@@ -7,6 +7,7 @@ from pathlib import Path
 from overhave.entities import IFeatureExtractor, OverhaveFileSettings
 from overhave.scenario.compiler import ScenarioCompiler
 from overhave.scenario.file_manager.settings import OverhaveProjectSettings
+from overhave.scenario.parser import get_feature_info_path, save_feature_info
 from overhave.storage import TestExecutorContext
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,7 @@ class FileManager(FileSavingMixin):
     def tmp_feature_file(
         self, context: TestExecutorContext
     ) -> Iterator[tempfile._TemporaryFileWrapper]:  # type: ignore
+        """Compiled feature file with sidecar file of its :class:`FeatureInfo` for pytest plugin."""
         file_name = Path(context.feature.file_path).name
         logger.debug("Feature file name: '%s'", file_name)
         with tempfile.NamedTemporaryFile(
@@ -53,7 +55,12 @@ class FileManager(FileSavingMixin):
             data = self._scenario_compiler.compile(context=context)
             logger.debug("Scenario file:\n%s", data)
             self._write_data(file=file, data=data, entity_name="feature")
-            yield file
+            feature_file = Path(file.name)
+            save_feature_info(self._scenario_compiler.get_feature_info(context=context), feature_file=feature_file)
+            try:
+                yield file
+            finally:
+                get_feature_info_path(feature_file).unlink(missing_ok=True)
 
     @contextmanager
     def tmp_fixture_file(
@@ -1,4 +1,11 @@
 # flake8: noqa
-from .models import FeatureInfo, StrictFeatureInfo
+from .models import (
+    FEATURE_INFO_SUFFIX,
+    FeatureInfo,
+    StrictFeatureInfo,
+    get_feature_info_path,
+    load_feature_info,
+    save_feature_info,
+)
 from .parser import FeatureNameParsingError, NullableFeatureIdError, ScenarioParser, StrictFeatureParsingError
 from .settings import OverhaveScenarioParserSettings
@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
 
 import allure
+from pydantic import TypeAdapter
 
 from overhave.storage import FeatureTypeName
 
@@ -37,3 +39,23 @@ class StrictFeatureInfo:
     tags: list[str] = field(default_factory=list)
     severity: allure.severity_level = allure.severity_level.NORMAL
     tasks: list[str] = field(default_factory=list)
+
+
+FEATURE_INFO_SUFFIX = ".info.json"
+
+
+def get_feature_info_path(feature_file: Path) -> Path:
+    """Path of sidecar file with :class:`FeatureInfo` of compiled feature file."""
+    return feature_file.with_name(feature_file.name + FEATURE_INFO_SUFFIX)
+
+
+def save_feature_info(feature_info: FeatureInfo, feature_file: Path) -> None:
+    get_feature_info_path(feature_file).write_bytes(TypeAdapter(FeatureInfo).dump_json(feature_info))
+
+
+def load_feature_info(feature_file: Path) -> FeatureInfo | None:
+    """Load :class:`FeatureInfo` from sidecar file of feature file, returns None when there is no sidecar."""
+    path = get_feature_info_path(feature_file)
+    if not path.exists():
+        return None
+    return TypeAdapter(FeatureInfo).validate_json(path.read_bytes())
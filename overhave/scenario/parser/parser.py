@@ -1,3 +1,4 @@
+import hashlib
 import logging
 import re
 from dataclasses import asdict
@@ -9,7 +10,7 @@ import allure
 from pytest_bdd import types as default_types
 
 from overhave.entities import IFeatureExtractor, OverhaveLanguageSettings
-from overhave.scenario.compiler import OverhaveScenarioCompilerSettings
+from overhave.scenario.compiler.settings import OverhaveScenarioCompilerSettings
 from overhave.scenario.parser.models import FeatureInfo, StrictFeatureInfo
 from overhave.scenario.parser.settings import OverhaveScenarioParserSettings
 from overhave.scenario.prefix_mixin import PrefixMixin
@@ -67,6 +68,18 @@ class ScenarioParser(PrefixMixin):
     def set_strict_mode(self, mode: bool) -> None:
         self._parser_settings.parser_strict_mode = mode
 
+    @property
+    def fingerprint(self) -> str:
+        """Hash of settings, which parsed feature info depends on."""
+        settings = (
+            self._parser_settings,
+            self._compilation_settings,
+            self._language_settings,
+            self._tasks_keyword,
+            self._feature_extractor.feature_types,
+        )
+        return hashlib.sha256(repr(settings).encode()).hexdigest()
+
     @cached_property
     def _feature_prefixes(self) -> list[str]:
         prefixes = [self._as_prefix(default_types.FEATURE)]
@@ -13,6 +13,7 @@ from .converters import (
     TagModel,
     TestExecutorContext,
     TestRunModel,
+    TestRunResultModel,
     TestUserModel,
     TestUserSpecification,
 )
@@ -24,6 +25,7 @@ from .feature_type_storage import FeatureTypeNotExistsError, FeatureTypeStorage,
 from .scenario_storage import IScenarioStorage, ScenarioStorage
 from .system_user_group_storage import ISystemUserGroupStorage, SystemUserGroupStorage
 from .system_user_storage import ISystemUserStorage, SystemUserStorage
+from .test_run_coalescing_storage import CoalescedTestRun, ITestRunCoalescingStorage, TestRunCoalescingStorage
 from .test_run_storage import ITestRunStorage, TestRunStorage
 from .test_user_storage import (
     ITestUserStorage,
@@ -1,7 +1,8 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import NewType
 
 import allure
+import sqlalchemy.orm as so
 from pydantic import BaseModel, SecretStr
 from pydantic_settings import SettingsConfigDict
 
@@ -67,6 +68,10 @@ class FeatureModel(_SqlAlchemyOrmModel):
     feature_tags: list[TagModel]
 
 
+# Loader options of relationships, which are required for validation of :class:`FeatureModel`
+FEATURE_LOADERS = (so.joinedload(db.Feature.feature_type), so.joinedload(db.Feature.feature_tags))
+
+
 class ScenarioModel(_SqlAlchemyOrmModel):
     """Model for :class:`Scenario` row."""
 
@@ -91,6 +96,33 @@ class TestRunModel(_SqlAlchemyOrmModel):
     report: str | None
     traceback: str | None
     scenario_id: int
+    peak_rss: int | None = None
+    cpu_time: timedelta | None = None
+    workers: int | None = None
+    shards: int | None = None
+    rerun_of: int | None = None
+    scenarios: list[str] | None = None
+    fail_fast: bool = False
+    failed_scenarios: list[str] | None = None
+    memo_key: str | None = None
+    memoized_from: int | None = None
+
+
+class TestRunResultModel(BaseModel):
+    """Model for result of test run, which is saved by :meth:`ITestRunStorage.finish_run`."""
+
+    __test__ = False
+
+    status: TestRunStatus
+    traceback: str | None = None
+    report_status: TestReportStatus | None = None
+    report: str | None = None
+    peak_rss: int | None = None
+    cpu_time: timedelta | None = None
+    workers: int | None = None
+    failed_scenarios: list[str] | None = None
+    memo_key: str | None = None
+    memoized_from: int | None = None
 
 
 class DraftModel(_SqlAlchemyOrmModel):
@@ -5,7 +5,14 @@ import sqlalchemy as sa
 import sqlalchemy.orm as so
 
 from overhave import db
-from overhave.storage import DraftModel
+from overhave.storage.converters import (
+    FEATURE_LOADERS,
+    DraftModel,
+    FeatureModel,
+    ScenarioModel,
+    TestExecutorContext,
+    TestRunModel,
+)
 from overhave.utils import get_current_time
 
 
@@ -17,6 +24,11 @@ class IDraftStorage(abc.ABC):
     def draft_model_by_id(session: so.Session, draft_id: int) -> DraftModel:
         pass
 
+    @staticmethod
+    @abc.abstractmethod
+    def draft_context_by_id(session: so.Session, draft_id: int) -> tuple[DraftModel, TestExecutorContext]:
+        pass
+
     @staticmethod
     @abc.abstractmethod
     def get_last_published_at_for_feature(feature_id: int) -> datetime | None:
@@ -68,6 +80,25 @@ class DraftStorage(IDraftStorage):
         draft = session.query(db.Draft).filter(db.Draft.id == draft_id).one()
         return DraftModel.model_validate(draft)
 
+    @staticmethod
+    def draft_context_by_id(session: so.Session, draft_id: int) -> tuple[DraftModel, TestExecutorContext]:
+        draft, test_run = (
+            session.execute(
+                sa.select(db.Draft, db.TestRun)
+                .join(db.TestRun, db.Draft.test_run_id == db.TestRun.id)
+                .where(db.Draft.id == draft_id)
+                .options(so.joinedload(db.Draft.feature).options(*FEATURE_LOADERS), so.joinedload(db.TestRun.scenario))
+            )
+            .unique()
+            .one()
+        )
+        context = TestExecutorContext(
+            feature=FeatureModel.model_validate(draft.feature),
+            scenario=ScenarioModel.model_validate(test_run.scenario),
+            test_run=TestRunModel.model_validate(test_run),
+        )
+        return DraftModel.model_validate(draft), context
+
     @staticmethod
     def get_last_published_at_for_feature(feature_id: int) -> datetime | None:
         with db.create_session() as session:
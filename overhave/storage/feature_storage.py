@@ -6,7 +6,7 @@ import sqlalchemy as sa
 import sqlalchemy.orm as so
 
 from overhave import db
-from overhave.storage.converters import FeatureModel
+from overhave.storage.converters import FEATURE_LOADERS, FeatureModel, FeatureTypeName, ScenarioModel
 from overhave.utils import get_current_time
 
 logger = logging.getLogger(__name__)
@@ -48,6 +48,11 @@ class IFeatureStorage(abc.ABC):
     def get_features_by_tag(tag_id: int) -> list[FeatureModel]:
         pass
 
+    @staticmethod
+    @abc.abstractmethod
+    def get_features_with_scenarios(feature_type: FeatureTypeName) -> list[tuple[FeatureModel, ScenarioModel]]:
+        pass
+
 
 def _append_tags_to_feature(session: so.Session, feature: db.Feature, tag_ids: Iterable[int]) -> None:
     db_tags: list[db.Tags] = []
@@ -126,6 +131,22 @@ class FeatureStorage(IFeatureStorage):
             features = session.query(db.Feature).filter(db.Feature.id.in_(feature_ids_query)).all()
             return [FeatureModel.model_validate(x) for x in features]
 
+    @staticmethod
+    def get_features_with_scenarios(feature_type: FeatureTypeName) -> list[tuple[FeatureModel, ScenarioModel]]:
+        """Get features of feature type together with their scenarios by one query."""
+        with db.create_session() as session:
+            rows = session.execute(
+                sa.select(db.Feature, db.Scenario)
+                .join(db.Scenario, db.Scenario.feature_id == db.Feature.id)
+                .join(db.FeatureType, db.FeatureType.id == db.Feature.type_id)
+                .where(db.FeatureType.name == feature_type)
+                .options(*FEATURE_LOADERS)
+            ).unique()
+            return [
+                (FeatureModel.model_validate(feature), ScenarioModel.model_validate(scenario))
+                for feature, scenario in rows
+            ]
+
     @staticmethod
     def get_feature_model(feature_id: int) -> FeatureModel | None:
         with db.create_session() as session:
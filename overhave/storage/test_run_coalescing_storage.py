@@ -0,0 +1,122 @@
+import abc
+import hashlib
+import logging
+import time
+from typing import Any, NamedTuple, cast
+
+import redis
+from redis import Redis
+
+from overhave.entities.settings import OverhaveTestRunCoalescingSettings
+from overhave.storage.test_run_storage import ITestRunStorage
+
+logger = logging.getLogger(__name__)
+
+_PENDING_VALUE = b"pending"
+_ACQUIRE_ATTEMPTS = 20
+_ACQUIRE_DELAY_SECONDS = 0.05
+
+
+class CoalescedTestRun(NamedTuple):
+    """Canonical test run of scenario with flag of its creation by current request."""
+
+    test_run_id: int
+    created: bool
+
+
+class ITestRunCoalescingStorage(abc.ABC):
+    """Abstract class for coalescing of duplicate test runs."""
+
+    @abc.abstractmethod
+    def get_or_create_testrun(
+        self,
+        scenario_id: int,
+        scenario_text: str,
+        executed_by: str,
+        scenarios: list[str] | None = None,
+        fail_fast: bool = False,
+    ) -> CoalescedTestRun:
+        pass
+
+
+class TestRunCoalescingStorage(ITestRunCoalescingStorage):
+    """Class for coalescing of duplicate test runs.
+
+    Within ```test_run_coalescing_window``` requests for the scenario with the same text and the same
+    selection of scenarios are attached to the canonical test run, which is registered with Redis SET NX.
+    Finished test runs are not used as canonical, so the next request creates a new test run.
+    """
+
+    __test__ = False
+
+    def __init__(self, settings: OverhaveTestRunCoalescingSettings, redis: Redis, test_run_storage: ITestRunStorage):
+        self._settings = settings
+        self._redis = redis
+        self._test_run_storage = test_run_storage
+
+    def _make_key(self, scenario_id: int, scenario_text: str, scenarios: list[str] | None, fail_fast: bool) -> str:
+        text_hash = hashlib.sha256(scenario_text.encode())
+        if scenarios or fail_fast:
+            text_hash.update("\0".join((str(fail_fast), *(scenarios or ()))).encode())
+        return f"{self._settings.test_run_coalescing_key_prefix}:{scenario_id}:{text_hash.hexdigest()}"
+
+    def _release(self, key: str, value: bytes) -> None:
+        with self._redis.pipeline() as pipeline:
+            try:
+                pipeline.watch(key)
+                if pipeline.get(key) == value:
+                    pipeline.multi()
+                    pipeline.delete(key)
+                    pipeline.execute()
+            except redis.exceptions.WatchError:
+                logger.debug("Key %s has been changed while releasing", key)
+
+    def _create_testrun(self, key: str, window_milliseconds: int, **testrun_kwargs: Any) -> int:
+        try:
+            test_run_id = self._test_run_storage.create_testrun(**testrun_kwargs)
+        except Exception:
+            self._redis.delete(key)
+            raise
+        self._redis.set(key, test_run_id, xx=True, px=window_milliseconds)
+        return test_run_id
+
+    def get_or_create_testrun(
+        self,
+        scenario_id: int,
+        scenario_text: str,
+        executed_by: str,
+        scenarios: list[str] | None = None,
+        fail_fast: bool = False,
+    ) -> CoalescedTestRun:
+        testrun_kwargs: dict[str, Any] = {
+            "scenario_id": scenario_id,
+            "executed_by": executed_by,
+            "scenarios": scenarios,
+            "fail_fast": fail_fast,
+        }
+        window = self._settings.test_run_coalescing_window
+        if window is None:
+            test_run_id = self._test_run_storage.create_testrun(**testrun_kwargs)
+            return CoalescedTestRun(test_run_id=test_run_id, created=True)
+        window_milliseconds = int(window.total_seconds() * 1000)
+        key = self._make_key(
+            scenario_id=scenario_id, scenario_text=scenario_text, scenarios=scenarios, fail_fast=fail_fast
+        )
+        for _ in range(_ACQUIRE_ATTEMPTS):
+            if self._redis.set(key, _PENDING_VALUE, nx=True, px=window_milliseconds):
+                test_run_id = self._create_testrun(key=key, window_milliseconds=window_milliseconds, **testrun_kwargs)
+                return CoalescedTestRun(test_run_id=test_run_id, created=True)
+            value = cast(bytes | None, self._redis.get(key))
+            if value is None:
+                continue
+            if value == _PENDING_VALUE:
+                time.sleep(_ACQUIRE_DELAY_SECONDS)
+                continue
+            test_run = self._test_run_storage.get_testrun_model(int(value))
+            if test_run is not None and not test_run.status.finished:
+                logger.info("Test run for scenario %s coalesced with test run %s", scenario_id, test_run.id)
+                return CoalescedTestRun(test_run_id=test_run.id, created=False)
+            self._release(key, value)
+        logger.warning("Could not coalesce test run for scenario %s, create new one", scenario_id)
+        test_run_id = self._test_run_storage.create_testrun(**testrun_kwargs)
+        return CoalescedTestRun(test_run_id=test_run_id, created=True)
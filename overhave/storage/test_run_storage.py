@@ -1,19 +1,38 @@
 import abc
+from datetime import timedelta
 from typing import Any, cast
 
 import sqlalchemy as sa
 import sqlalchemy.orm as so
 
 from overhave import db
-from overhave.storage.converters import TestRunModel
+from overhave.storage.converters import (
+    FEATURE_LOADERS,
+    FeatureModel,
+    ScenarioModel,
+    TestExecutorContext,
+    TestRunModel,
+    TestRunResultModel,
+)
 from overhave.utils import get_current_time
 
+# Statuses, from which test run could be transferred to the status by :meth:`ITestRunStorage.start_run`
+# and :meth:`ITestRunStorage.finish_run`. Running test run could be started again only after expiry of its lease.
+TEST_RUN_TRANSITIONS: dict[db.TestRunStatus, tuple[db.TestRunStatus, ...]] = {
+    db.TestRunStatus.RUNNING: (db.TestRunStatus.STARTED,),
+    db.TestRunStatus.SUCCESS: (db.TestRunStatus.RUNNING,),
+    db.TestRunStatus.FAILED: (db.TestRunStatus.RUNNING,),
+    db.TestRunStatus.INTERNAL_ERROR: (db.TestRunStatus.STARTED, db.TestRunStatus.RUNNING),
+}
+
 
 class ITestRunStorage(abc.ABC):
     """Abstract class for test runs storage."""
 
     @abc.abstractmethod
-    def create_testrun(self, scenario_id: int, executed_by: str) -> int:
+    def create_testrun(
+        self, scenario_id: int, executed_by: str, scenarios: list[str] | None = None, fail_fast: bool = False
+    ) -> int:
         pass
 
     @abc.abstractmethod
@@ -24,6 +43,30 @@ class ITestRunStorage(abc.ABC):
     def set_report(self, run_id: int, status: db.TestReportStatus, report: str | None = None) -> None:
         pass
 
+    @abc.abstractmethod
+    def start_run(self, session: so.Session, run_id: int, lease: timedelta | None = None) -> bool:
+        pass
+
+    @abc.abstractmethod
+    def finish_run(self, run_id: int, result: TestRunResultModel) -> bool:
+        pass
+
+    @abc.abstractmethod
+    def create_rerun(self, run_id: int, executed_by: str) -> int | None:
+        pass
+
+    @abc.abstractmethod
+    def get_memoized_testrun(self, memo_key: str, max_age: timedelta) -> TestRunModel | None:
+        pass
+
+    @abc.abstractmethod
+    def start_sharding(self, run_id: int, shards: int) -> bool:
+        pass
+
+    @abc.abstractmethod
+    def finish_shard(self, run_id: int, shard: int, failed: bool) -> db.TestRunStatus | None:
+        pass
+
     @abc.abstractmethod
     def testrun_model_by_id(self, session: so.Session, run_id: int) -> TestRunModel:
         pass
@@ -32,11 +75,18 @@ class ITestRunStorage(abc.ABC):
     def get_testrun_model(self, run_id: int) -> TestRunModel | None:
         pass
 
+    @abc.abstractmethod
+    def executor_context_by_id(self, session: so.Session, run_id: int) -> TestExecutorContext:
+        pass
+
 
 class TestRunStorage(ITestRunStorage):
     """Class for test runs storage."""
 
-    def create_testrun(self, scenario_id: int, executed_by: str) -> int:
+    def create_testrun(
+        self, scenario_id: int, executed_by: str, scenarios: list[str] | None = None, fail_fast: bool = False
+    ) -> int:
+        """Create test run of scenario, only ```scenarios``` of feature are run, when they are specified."""
         with db.create_session() as session:
             scenario: db.Scenario = session.query(db.Scenario).filter(db.Scenario.id == scenario_id).one()
             run = db.TestRun(
@@ -45,6 +95,8 @@ class TestRunStorage(ITestRunStorage):
                 status=db.TestRunStatus.STARTED,
                 report_status=db.TestReportStatus.EMPTY,
                 executed_by=executed_by,
+                scenarios=scenarios or None,
+                fail_fast=fail_fast,
             )
             session.add(run)
             session.flush()
@@ -70,6 +122,126 @@ class TestRunStorage(ITestRunStorage):
 
             session.execute(sa.update(db.TestRun).where(db.TestRun.id == run_id).values(**values))
 
+    @staticmethod
+    def _transit(
+        session: so.Session, run_id: int, status: db.TestRunStatus, *clauses: sa.ColumnElement[bool], **values: Any
+    ) -> bool:
+        result = session.execute(
+            sa.update(db.TestRun)
+            .where(db.TestRun.id == run_id, sa.or_(db.TestRun.status.in_(TEST_RUN_TRANSITIONS[status]), *clauses))
+            .values(status=status, **values)
+        )
+        return result.rowcount == 1
+
+    def start_run(self, session: so.Session, run_id: int, lease: timedelta | None = None) -> bool:
+        """Transfer test run to running status, returns False when run is already finished or leased.
+
+        Running test run is leased by its consumer for ```lease```, it could be started again only after expiry
+        of the lease, for example when its task is reclaimed from crashed consumer. Test run without lease
+        is never started again.
+        """
+        now = get_current_time()
+        lease_until = None
+        if lease is not None:
+            lease_until = now + lease
+        return self._transit(
+            session,
+            run_id,
+            db.TestRunStatus.RUNNING,
+            sa.and_(db.TestRun.status == db.TestRunStatus.RUNNING, db.TestRun.lease_until <= now),
+            start=now,
+            lease_until=lease_until,
+        )
+
+    def finish_run(self, run_id: int, result: TestRunResultModel) -> bool:
+        """Save final status of test run together with its report and resources usage in one update.
+
+        Only specified values of ```result``` are saved. Returns False, when test run has been already finished.
+        """
+        values = result.model_dump(exclude={"status"}, exclude_none=True)
+        with db.create_session() as session:
+            return self._transit(session, run_id, result.status, end=get_current_time(), **values)
+
+    def create_rerun(self, run_id: int, executed_by: str) -> int | None:
+        """Create test run of failed scenarios of test run, returns None when test run has not got them."""
+        with db.create_session() as session:
+            source_run = session.get(db.TestRun, run_id)
+            if source_run is None or not source_run.failed_scenarios:
+                return None
+            run = db.TestRun(
+                scenario_id=source_run.scenario_id,
+                name=source_run.name,
+                status=db.TestRunStatus.STARTED,
+                report_status=db.TestReportStatus.EMPTY,
+                executed_by=executed_by,
+                rerun_of=run_id,
+                scenarios=source_run.failed_scenarios,
+                fail_fast=source_run.fail_fast,
+            )
+            session.add(run)
+            session.flush()
+            return cast(int, run.id)
+
+    def get_memoized_testrun(self, memo_key: str, max_age: timedelta) -> TestRunModel | None:
+        """Get the latest successful test run with report, which is executed not earlier than ```max_age``` ago."""
+        with db.create_session() as session:
+            run = session.scalars(
+                sa.select(db.TestRun)
+                .where(
+                    db.TestRun.memo_key == memo_key,
+                    db.TestRun.memoized_from.is_(None),
+                    db.TestRun.status == db.TestRunStatus.SUCCESS,
+                    db.TestRun.report_status.in_((db.TestReportStatus.GENERATED, db.TestReportStatus.SAVED)),
+                    db.TestRun.end >= get_current_time() - max_age,
+                )
+                .order_by(db.TestRun.end.desc())
+                .limit(1)
+            ).one_or_none()
+            if run is None:
+                return None
+            return TestRunModel.model_validate(run)
+
+    def start_sharding(self, run_id: int, shards: int) -> bool:
+        """Save number of shards of running test run, returns False when run is already finished or sharded."""
+        with db.create_session() as session:
+            result = session.execute(
+                sa.update(db.TestRun)
+                .where(
+                    db.TestRun.id == run_id,
+                    db.TestRun.status == db.TestRunStatus.RUNNING,
+                    db.TestRun.shards.is_(None),
+                )
+                .values(shards=shards, finished_shards=0, failed_shards=0)
+            )
+            return result.rowcount == 1
+
+    def finish_shard(self, run_id: int, shard: int, failed: bool) -> db.TestRunStatus | None:
+        """Mark shard of running test run as finished.
+
+        Returns final status of test run, when the shard is the last not finished one. Repeated finish of shard
+        is ignored, so only one consumer gets the final status.
+        """
+        bit = 1 << shard
+        values: dict[str, Any] = {"finished_shards": db.TestRun.finished_shards.op("|")(bit)}
+        if failed:
+            values["failed_shards"] = db.TestRun.failed_shards.op("|")(bit)
+        with db.create_session() as session:
+            row = session.execute(
+                sa.update(db.TestRun)
+                .where(
+                    db.TestRun.id == run_id,
+                    db.TestRun.status == db.TestRunStatus.RUNNING,
+                    db.TestRun.finished_shards.op("&")(bit) == 0,
+                )
+                .values(**values)
+                .returning(db.TestRun.shards, db.TestRun.finished_shards, db.TestRun.failed_shards)
+            ).one_or_none()
+        if row is None or row.shards is None or row.finished_shards != (1 << row.shards) - 1:
+            return None
+        if row.failed_shards:
+            return db.TestRunStatus.FAILED
+        return db.TestRunStatus.SUCCESS
+
     def testrun_model_by_id(self, session: so.Session, run_id: int) -> TestRunModel:
         run = session.query(db.TestRun).filter(db.TestRun.id == run_id).one()
         return TestRunModel.model_validate(run)
@@ -80,3 +252,19 @@ class TestRunStorage(ITestRunStorage):
             if run is None:
                 return None
             return TestRunModel.model_validate(run)
+
+    def executor_context_by_id(self, session: so.Session, run_id: int) -> TestExecutorContext:
+        run = (
+            session.execute(
+                sa.select(db.TestRun)
+                .where(db.TestRun.id == run_id)
+                .options(so.joinedload(db.TestRun.scenario).joinedload(db.Scenario.feature).options(*FEATURE_LOADERS))
+            )
+            .unique()
+            .scalar_one()
+        )
+        return TestExecutorContext(
+            feature=FeatureModel.model_validate(run.scenario.feature),
+            scenario=ScenarioModel.model_validate(run.scenario),
+            test_run=TestRunModel.model_validate(run),
+        )
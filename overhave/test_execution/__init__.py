@@ -1,6 +1,21 @@
 # flake8: noqa
+from .change_impact import (
+    BaseChangeImpactException,
+    ChangeImpactAnalyzer,
+    GitDiffError,
+    NotCollectedStepsError,
+    StepsImpactIndex,
+    get_changed_files,
+)
 from .executor import ITestExecutor, TestExecutor
-from .objects import BddStepModel, StepTypeName, public_step
+from .isolation import PytestProcessResult, run_forked
+from .memoization import TestResultMemoizer
+from .objects import BddStepDefinition, BddStepModel, StepTypeName, public_step
+from .process_pool import TestRunProcessPool, TestRunQueue
+from .selection import FAIL_FAST_OPTION, SCENARIOS_OPTION, is_selected_scenario
 from .settings import OverhaveAdminLinkSettings, OverhaveStepCollectorSettings, OverhaveTestSettings
+from .sharding import SHARD_OPTION, PytestShard
 from .step_collector import StepCollector
 from .test_runner import PytestRunner
+from .worker_pool import PytestWorkerPool
+from .workers_planner import PytestWorkersPlanner
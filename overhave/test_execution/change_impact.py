@@ -0,0 +1,157 @@
+import logging
+import subprocess  # noqa: S404
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Collection, Mapping
+
+from pytest_bdd import types as default_types
+from pytest_bdd.parser import STEP_PREFIXES
+
+from overhave.entities import StepPrefixesModel
+from overhave.storage import FeatureTypeName
+from overhave.test_execution.objects import BddStepDefinition
+from overhave.test_execution.step_collector import StepCollector
+
+logger = logging.getLogger(__name__)
+
+_STEP_TYPES = (default_types.GIVEN, default_types.WHEN, default_types.THEN)
+_PYTHON_SUFFIX = ".py"
+
+
+class BaseChangeImpactException(Exception):
+    """Base exception for :class:`ChangeImpactAnalyzer`."""
+
+
+class NotCollectedStepsError(BaseChangeImpactException):
+    """Exception for situation when steps of feature type have not been collected."""
+
+
+class GitDiffError(BaseChangeImpactException):
+    """Exception for failed `git diff` of changed steps modules."""
+
+
+@dataclass
+class StepsImpactIndex:
+    """Index of features of feature type by steps modules, which define steps of features scenarios."""
+
+    modules: dict[Path, set[int]] = field(default_factory=dict)
+    unresolved: set[int] = field(default_factory=set)
+
+
+def get_changed_files(diff_range: str, steps_dir: Path) -> list[Path]:
+    """Get files of ```steps_dir```, which are changed in git diff range, e.g. `main...HEAD`."""
+    try:
+        output = subprocess.run(  # noqa: S603
+            ["git", "diff", "--name-only", "--relative", diff_range],  # noqa: S607
+            cwd=steps_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True,
+            text=True,
+        ).stdout
+    except (FileNotFoundError, subprocess.CalledProcessError) as e:
+        raise GitDiffError(f"Could not get changed files of '{diff_range}' diff range in '{steps_dir}'!") from e
+    return [(steps_dir / name).resolve() for name in output.splitlines() if name]
+
+
+class ChangeImpactAnalyzer:
+    """Class for selection of features, which are impacted by changes of steps modules.
+
+    Index maps every module with steps definitions, collected by :class:`StepCollector`, to features with
+    scenario steps, which match its definitions. Selection is conservative: features with steps, which do not
+    match any definition, are impacted by every change of steps of their feature type, and changed modules
+    of ```steps_dir``` without steps definitions (helpers, fixtures) impact all features.
+    """
+
+    def __init__(self, step_collector: StepCollector, step_prefixes: StepPrefixesModel | None, steps_dir: Path):
+        self._step_collector = step_collector
+        self._step_prefixes = step_prefixes
+        self._steps_dir = steps_dir.resolve()
+
+    @cached_property
+    def _prefixes(self) -> list[tuple[str, str | None]]:
+        prefixes = [(prefix, step_type) for prefix, step_type in STEP_PREFIXES if step_type in (*_STEP_TYPES, None)]
+        if self._step_prefixes is not None:
+            prefixes.extend(
+                (
+                    (self._step_prefixes.GIVEN, default_types.GIVEN),
+                    (self._step_prefixes.WHEN, default_types.WHEN),
+                    (self._step_prefixes.THEN, default_types.THEN),
+                    (self._step_prefixes.AND, None),
+                    (self._step_prefixes.BUT, None),
+                )
+            )
+        return prefixes
+
+    def parse_steps(self, scenario_text: str) -> list[tuple[str, str]]:
+        """Parse steps of scenario text as pairs of step type and step name."""
+        steps: list[tuple[str, str]] = []
+        step_type: str | None = None
+        for line in (x.strip() for x in scenario_text.splitlines()):
+            for prefix, prefix_type in self._prefixes:
+                if not line.startswith(prefix):
+                    continue
+                step_type = prefix_type or step_type
+                if step_type is not None:
+                    steps.append((step_type, line.removeprefix(prefix).strip()))
+                break
+        return steps
+
+    @staticmethod
+    def _get_step_modules(definitions: list[BddStepDefinition], step_type: str, name: str) -> set[Path] | None:
+        modules: set[Path] = set()
+        for definition in definitions:
+            if not definition.is_matching(step_type=step_type, name=name):
+                continue
+            if definition.module_path is None:
+                return None
+            modules.add(definition.module_path)
+        return modules or None
+
+    def build_index(self, feature_type: FeatureTypeName, scenarios: Mapping[int, str]) -> StepsImpactIndex:
+        """Build index of features by steps modules, ```scenarios``` are scenario texts by feature ids."""
+        definitions = self._step_collector.get_step_definitions(feature_type)
+        if definitions is None:
+            raise NotCollectedStepsError(f"Steps of feature type '{feature_type}' have not been collected!")
+        index = StepsImpactIndex()
+        for feature_id, scenario_text in scenarios.items():
+            for step_type, name in self.parse_steps(scenario_text):
+                modules = self._get_step_modules(definitions, step_type=step_type, name=name)
+                if modules is None:
+                    logger.debug("Step '%s' of feature %s does not match any definition", name, feature_id)
+                    index.unresolved.add(feature_id)
+                    continue
+                for module in modules:
+                    index.modules.setdefault(module, set()).add(feature_id)
+        return index
+
+    def _is_helper_module(self, path: Path) -> bool:
+        return (
+            path.suffix == _PYTHON_SUFFIX
+            and path.is_relative_to(self._steps_dir)
+            and path not in self._step_collector.step_modules
+        )
+
+    def get_impacted_features(
+        self, feature_type: FeatureTypeName, scenarios: Mapping[int, str], changed_files: Collection[Path]
+    ) -> set[int]:
+        """Get ids of features of feature type, which are impacted by changed files."""
+        changed_paths = {path.resolve() for path in changed_files}
+        if any(self._is_helper_module(path) for path in changed_paths):
+            logger.info("Helper modules of steps are changed, so all features of '%s' are impacted", feature_type)
+            return set(scenarios)
+        index = self.build_index(feature_type=feature_type, scenarios=scenarios)
+        impacted: set[int] = set()
+        for path in changed_paths.intersection(index.modules):
+            impacted.update(index.modules[path])
+        if changed_paths.intersection(self._get_feature_type_modules(feature_type)):
+            impacted.update(index.unresolved)
+        return impacted
+
+    def _get_feature_type_modules(self, feature_type: FeatureTypeName) -> set[Path]:
+        return {
+            definition.module_path
+            for definition in self._step_collector.get_step_definitions(feature_type) or ()
+            if definition.module_path is not None
+        }
@@ -1,20 +1,42 @@
 import abc
 import logging
+import shutil
 import tempfile
+from contextlib import ExitStack
+from datetime import timedelta
 from pathlib import Path
+from typing import Any, Sequence
 
 from overhave import db
-from overhave.db import TestRunStatus
-from overhave.entities import OverhaveFileSettings, ReportManager
+from overhave.db import TestReportStatus, TestRunStatus
+from overhave.entities import (
+    OverhaveFileSettings,
+    ReportManager,
+    get_failed_scenarios,
+    merge_allure_results,
+    split_allure_results,
+)
 from overhave.metrics import TestRunOverhaveMetricContainer
 from overhave.scenario import FileManager
-from overhave.storage import IFeatureStorage, IScenarioStorage, ITestRunStorage, TestExecutorContext
+from overhave.storage import ITestRunStorage, TestExecutorContext, TestRunResultModel
+from overhave.test_execution.isolation import PytestProcessResult
+from overhave.test_execution.memoization import TestResultMemoizer
+from overhave.test_execution.sharding import PytestShard
 from overhave.test_execution.test_runner import PytestRunner
-from overhave.transport import TestRunTask
+from overhave.test_execution.workers_planner import PytestWorkersPlanner
+from overhave.transport import ITaskProducer, TestRunData, TestRunPriority, TestRunShardData, TestRunTask
 
 logger = logging.getLogger(__name__)
 
 
+def _get_traceback(result: PytestProcessResult) -> str:
+    if result.timed_out:
+        return "Test run timed out!"
+    if result.killed_by is not None:
+        return f"Test run process was killed by {result.killed_by.name}!"
+    return "Test run failed!"
+
+
 class ITestExecutor(abc.ABC):
     """Abstract class for test execution."""
 
@@ -26,76 +48,307 @@ class ITestExecutor(abc.ABC):
     def process_test_task(self, task: TestRunTask) -> None:
         pass
 
+    @abc.abstractmethod
+    def execute_tests(self, test_run_ids: Sequence[int]) -> None:
+        pass
+
+    @abc.abstractmethod
+    def process_test_tasks(self, tasks: Sequence[TestRunTask]) -> None:
+        pass
+
 
 class TestExecutor(ITestExecutor):
-    """Class for test execution."""
+    """Class for test execution.
+
+    Batches of test runs are grouped by feature type and run in one pytest session by chunks of
+    ```batch_max_runs``` runs, so session setup is paid once per chunk. Allure results of the session are split
+    by test runs, so every run gets its own status and report.
+    Number of xdist workers is chosen by ```workers_planner``` for every pytest session and saved for test runs.
+
+    Large test runs are split into shards, which are produced as tasks by ```task_producer```, so they are run
+    by different consumers. Every shard saves its Allure results into ```shards_results_dir``` shared by
+    consumers, the last finished shard merges results into one report and saves final status of test run.
+
+    Test runs could run only selected ```scenarios``` of feature and stop on the first failure with
+    ```fail_fast```. Such test runs are not batched, because selection is applied to the whole pytest session,
+    and test runs of selected scenarios are not sharded. Names of failed scenarios are saved for failed
+    test runs, so they could be rerun.
+
+    When ```memoizer``` is specified, test run of all scenarios reuses the latest successful result of test run
+    with the same memoization key, which is not older than ```memoizer.max_age```, so it is not executed.
+    """
 
     def __init__(
         self,
         file_settings: OverhaveFileSettings,
-        feature_storage: IFeatureStorage,
-        scenario_storage: IScenarioStorage,
         test_run_storage: ITestRunStorage,
         file_manager: FileManager,
         test_runner: PytestRunner,
         report_manager: ReportManager,
         metric_container: TestRunOverhaveMetricContainer,
+        batch_max_runs: int = 1,
+        workers_planner: PytestWorkersPlanner | None = None,
+        task_producer: ITaskProducer | None = None,
+        shards_results_dir: Path | None = None,
+        memoizer: TestResultMemoizer | None = None,
+        run_lease: timedelta | None = None,
     ):
         self._file_settings = file_settings
-        self._feature_storage = feature_storage
-        self._scenario_storage = scenario_storage
         self._test_run_storage = test_run_storage
         self._file_manager = file_manager
         self._test_runner = test_runner
         self._report_manager = report_manager
         self._metric_container = metric_container
+        self._batch_max_runs = max(batch_max_runs, 1)
+        self._workers_planner = workers_planner
+        self._task_producer = task_producer
+        self._shards_results_dir = shards_results_dir or Path(tempfile.gettempdir())
+        self._memoizer = memoizer
+        self._run_lease = run_lease
+        self._memo_keys: dict[int, str] = {}
+
+    def _get_workers(self, contexts: Sequence[TestExecutorContext]) -> int | None:
+        if self._workers_planner is None:
+            return None
+        return self._workers_planner.get_workers([ctx.scenario.text for ctx in contexts])
 
-    def _run_test(self, context: TestExecutorContext, alluredir: Path) -> int:
+    def _run_test(
+        self, context: TestExecutorContext, alluredir: Path, workers: int | None, shard: PytestShard | None = None
+    ) -> PytestProcessResult:
         with self._file_manager.tmp_feature_file(context=context) as feature_file:
             with self._file_manager.tmp_fixture_file(context=context, feature_file=feature_file) as fixture_file:
-                return self._test_runner.run(fixture_file=fixture_file.name, alluredir=alluredir.as_posix())
+                return self._test_runner.run(
+                    fixture_file=fixture_file.name,
+                    alluredir=alluredir.as_posix(),
+                    workers=workers,
+                    shard=shard,
+                    scenarios=context.test_run.scenarios,
+                    fail_fast=context.test_run.fail_fast,
+                )
 
-    def _compile_context(self, test_run_id: int) -> TestExecutorContext:
+    def _start(self, test_run_id: int) -> TestExecutorContext | None:
         with db.create_session() as session:
-            test_run_model = self._test_run_storage.testrun_model_by_id(session=session, run_id=test_run_id)
-            scenario_model = self._scenario_storage.scenario_model_by_id(
-                session=session, scenario_id=test_run_model.scenario_id
-            )
-            feature_model = self._feature_storage.feature_model_by_id(
-                session=session, feature_id=scenario_model.feature_id
+            if not self._test_run_storage.start_run(session=session, run_id=test_run_id, lease=self._run_lease):
+                logger.warning("Test run %s has been already finished or is running, so it is skipped", test_run_id)
+                return None
+            return self._test_run_storage.executor_context_by_id(session=session, run_id=test_run_id)
+
+    def _finish(self, test_run_id: int, status: TestRunStatus, results_dir: Path | None = None, **values: Any) -> None:
+        values.setdefault("memo_key", self._memo_keys.pop(test_run_id, None))
+        report = None
+        if results_dir is not None:
+            report = self._report_manager.generate_allure_report(results_dir=results_dir)
+            values["report_status"] = TestReportStatus.GENERATION_FAILED
+            if report is not None:
+                values.update(report_status=TestReportStatus.GENERATED, report=report)
+            if status is TestRunStatus.FAILED:
+                values["failed_scenarios"] = get_failed_scenarios(results_dir)
+        result = TestRunResultModel(status=status, **values)
+        if not self._test_run_storage.finish_run(run_id=test_run_id, result=result):
+            logger.warning("Test run %s has been already finished, so its result is not saved", test_run_id)
+            return
+        self._metric_container.add_test_run_status(status=status.value)
+        if report is not None:
+            self._report_manager.save_allure_report(test_run_id=test_run_id, report=report)
+
+    def _finish_with_error(self, test_run_id: int, error: Exception) -> None:
+        self._finish(test_run_id=test_run_id, status=TestRunStatus.INTERNAL_ERROR, traceback=str(error))
+
+    def _reuse_memoized(self, ctx: TestExecutorContext) -> bool:
+        """Finish test run with memoized result, returns False when there is no result to reuse."""
+        if self._memoizer is None or ctx.test_run.scenarios or ctx.test_run.fail_fast:
+            return False
+        test_run_id = ctx.test_run.id
+        try:
+            memo_key = self._memoizer.get_key(ctx)
+            if memo_key is None:
+                return False
+            memoized_run = self._test_run_storage.get_memoized_testrun(
+                memo_key=memo_key, max_age=self._memoizer.max_age
             )
-        return TestExecutorContext(
-            feature=feature_model,
-            scenario=scenario_model,
-            test_run=test_run_model,
+        except Exception:
+            logger.exception("Could not get memoized result of test run %s!", test_run_id)
+            return False
+        if memoized_run is None:
+            self._memo_keys[test_run_id] = memo_key
+            return False
+        logger.info("Test run %s reuses result of test run %s", test_run_id, memoized_run.id)
+        self._finish(
+            test_run_id=test_run_id,
+            status=TestRunStatus.SUCCESS,
+            report_status=memoized_run.report_status,
+            report=memoized_run.report,
+            memo_key=memo_key,
+            memoized_from=memoized_run.id,
         )
+        return True
+
+    def _skip_execution(self, ctx: TestExecutorContext, priority: TestRunPriority) -> bool:
+        if self._reuse_memoized(ctx):
+            return True
+        if self._shard(ctx, priority=priority):
+            self._memo_keys.pop(ctx.test_run.id, None)
+            return True
+        return False
 
     def execute_test(self, test_run_id: int) -> None:
-        self._test_run_storage.set_run_status(run_id=test_run_id, status=TestRunStatus.RUNNING)
-        ctx = self._compile_context(test_run_id)
+        self.process_test_task(TestRunTask(data=TestRunData(test_run_id=test_run_id)))
 
+    def _get_shards_dir(self, test_run_id: int) -> Path:
+        return self._shards_results_dir / f"test-run-{test_run_id}"
+
+    def _shard(self, ctx: TestExecutorContext, priority: TestRunPriority) -> bool:
+        """Split test run into tasks of shards, returns False when test run is not sharded."""
+        if self._task_producer is None or self._workers_planner is None or ctx.test_run.scenarios:
+            return False
+        shards = self._workers_planner.get_shards(ctx.scenario.text)
+        if not shards:
+            return False
+        test_run_id = ctx.test_run.id
+        if not self._test_run_storage.start_sharding(run_id=test_run_id, shards=shards):
+            logger.warning("Test run %s has been already finished or sharded, so it is skipped", test_run_id)
+            return True
+        shutil.rmtree(self._get_shards_dir(test_run_id), ignore_errors=True)
+        tasks = [
+            TestRunTask(
+                data=TestRunData(test_run_id=test_run_id, shard=TestRunShardData(index=index, count=shards)),
+                priority=priority,
+            )
+            for index in range(shards)
+        ]
+        if not all(self._task_producer.add_tasks(tasks)):
+            self._finish_with_error(
+                test_run_id=test_run_id, error=RuntimeError("Could not produce tasks for shards of test run!")
+            )
+            return True
+        logger.info("Test run %s is split into %s shards", test_run_id, shards)
+        return True
+
+    def _execute_shard(self, test_run_id: int, shard: PytestShard) -> None:
+        with db.create_session() as session:
+            ctx = self._test_run_storage.executor_context_by_id(session=session, run_id=test_run_id)
+        if ctx.test_run.status is not TestRunStatus.RUNNING:
+            logger.warning("Test run %s has been already finished, so its shard %s is skipped", test_run_id, shard)
+            return
+        shards_dir = self._get_shards_dir(test_run_id)
+        results_dir = shards_dir / f"shard-{shard.index}"
+        shutil.rmtree(results_dir, ignore_errors=True)
+        results_dir.mkdir(parents=True)
+        failed = True
+        try:
+            failed = self._run_test(context=ctx, alluredir=results_dir, workers=None, shard=shard).return_code != 0
+        except Exception:
+            logger.exception("Error!")
+        status = self._test_run_storage.finish_shard(run_id=test_run_id, shard=shard.index, failed=failed)
+        if status is None:
+            return
+        logger.info("Last shard of test run %s is finished, merge results of shards", test_run_id)
+        merged_results_dir = Path(tempfile.mkdtemp())
+        merge_allure_results(source_dirs=sorted(shards_dir.iterdir()), results_dir=merged_results_dir)
+        shutil.rmtree(shards_dir, ignore_errors=True)
+        values: dict[str, Any] = {}
+        if status is TestRunStatus.FAILED:
+            values["traceback"] = "Test run failed!"
+        self._finish(test_run_id=test_run_id, status=status, results_dir=merged_results_dir, **values)
+
+    def _execute_single(self, ctx: TestExecutorContext) -> None:
         results_dir = Path(tempfile.mkdtemp())
         logger.debug("Allure results directory path: %s", results_dir.as_posix())
         try:
-            test_return_code = self._run_test(context=ctx, alluredir=results_dir)
+            workers = self._get_workers([ctx])
+            result = self._run_test(context=ctx, alluredir=results_dir, workers=workers)
         except Exception as e:
             logger.exception("Error!")
-            self._test_run_storage.set_run_status(
-                run_id=test_run_id, status=TestRunStatus.INTERNAL_ERROR, traceback=str(e)
+            self._finish_with_error(test_run_id=ctx.test_run.id, error=e)
+            return
+
+        logger.debug("Test returncode: %s", result.return_code)
+        values: dict[str, Any] = {"peak_rss": result.peak_rss, "cpu_time": result.cpu_time, "workers": workers}
+        status = TestRunStatus.SUCCESS
+        if result.return_code != 0:
+            status = TestRunStatus.FAILED
+            values["traceback"] = _get_traceback(result)
+        self._finish(test_run_id=ctx.test_run.id, status=status, results_dir=results_dir, **values)
+
+    def _run_batch(
+        self, contexts: Sequence[TestExecutorContext], alluredir: Path, workers: int | None
+    ) -> dict[str, int]:
+        module_mapping: dict[str, int] = {}
+        with ExitStack() as stack:
+            fixture_files = []
+            for ctx in contexts:
+                feature_file = stack.enter_context(self._file_manager.tmp_feature_file(context=ctx))
+                fixture_file = stack.enter_context(
+                    self._file_manager.tmp_fixture_file(context=ctx, feature_file=feature_file)
+                )
+                module_mapping[Path(fixture_file.name).stem] = ctx.test_run.id
+                fixture_files.append(fixture_file.name)
+            result = self._test_runner.run_batch(
+                fixture_files=fixture_files, alluredir=alluredir.as_posix(), workers=workers
             )
-            self._metric_container.add_test_run_status(status=TestRunStatus.INTERNAL_ERROR.value)
+        logger.debug("Tests batch result: %s", result)
+        return module_mapping
+
+    def _execute_batch(self, contexts: Sequence[TestExecutorContext]) -> None:
+        if len(contexts) == 1:
+            self._execute_single(contexts[0])
+            return
+        results_dir = Path(tempfile.mkdtemp())
+        logger.info("Run batch of test runs %s", [ctx.test_run.id for ctx in contexts])
+        logger.debug("Allure results directory path: %s", results_dir.as_posix())
+        try:
+            workers = self._get_workers(contexts)
+            module_mapping = self._run_batch(contexts=contexts, alluredir=results_dir, workers=workers)
+            run_results = split_allure_results(results_dir=results_dir, module_mapping=module_mapping)
+        except Exception as e:
+            logger.exception("Error!")
+            for ctx in contexts:
+                self._finish_with_error(test_run_id=ctx.test_run.id, error=e)
             return
 
-        logger.debug("Test returncode: %s", test_return_code)
-        if test_return_code == 0:
-            self._test_run_storage.set_run_status(run_id=test_run_id, status=TestRunStatus.SUCCESS)
-            self._metric_container.add_test_run_status(status=TestRunStatus.SUCCESS.value)
-        else:
-            self._test_run_storage.set_run_status(
-                run_id=test_run_id, status=TestRunStatus.FAILED, traceback="Test run failed!"
+        for test_run_id, results in run_results.items():
+            if results.passed:
+                self._finish(
+                    test_run_id=test_run_id,
+                    status=TestRunStatus.SUCCESS,
+                    results_dir=results.results_dir,
+                    workers=workers,
+                )
+                continue
+            self._finish(
+                test_run_id=test_run_id,
+                status=TestRunStatus.FAILED,
+                results_dir=results.results_dir,
+                traceback="Test run failed!",
+                workers=workers,
             )
-            self._metric_container.add_test_run_status(status=TestRunStatus.FAILED.value)
-        self._report_manager.create_allure_report(test_run_id=test_run_id, results_dir=results_dir)
+
+    def execute_tests(self, test_run_ids: Sequence[int]) -> None:
+        self.process_test_tasks([TestRunTask(data=TestRunData(test_run_id=x)) for x in test_run_ids])
 
     def process_test_task(self, task: TestRunTask) -> None:
-        self.execute_test(test_run_id=task.data.test_run_id)
+        if task.data.shard is not None:
+            shard = PytestShard(index=task.data.shard.index, count=task.data.shard.count)
+            self._execute_shard(test_run_id=task.data.test_run_id, shard=shard)
+            return
+        ctx = self._start(task.data.test_run_id)
+        if ctx is not None and not self._skip_execution(ctx, priority=task.priority):
+            self._execute_single(ctx)
+
+    def process_test_tasks(self, tasks: Sequence[TestRunTask]) -> None:
+        feature_type_contexts: dict[str, list[TestExecutorContext]] = {}
+        for task in tasks:
+            if task.data.shard is not None:
+                self.process_test_task(task)
+                continue
+            ctx = self._start(task.data.test_run_id)
+            if ctx is None or self._skip_execution(ctx, priority=task.priority):
+                continue
+            if ctx.test_run.scenarios or ctx.test_run.fail_fast:
+                self._execute_single(ctx)
+                continue
+            feature_type_contexts.setdefault(ctx.feature.feature_type.name, []).append(ctx)
+        for contexts in feature_type_contexts.values():
+            for start in range(0, len(contexts), self._batch_max_runs):
+                stop = start + self._batch_max_runs
+                self._execute_batch(contexts[start:stop])
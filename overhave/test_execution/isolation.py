@@ -0,0 +1,95 @@
+import logging
+import math
+import os
+import resource
+import signal
+import threading
+from datetime import timedelta
+from typing import NamedTuple
+
+import pytest
+
+from overhave.test_execution.settings import OverhaveTestSettings
+
+logger = logging.getLogger(__name__)
+
+
+class PytestProcessResult(NamedTuple):
+    """Result of pytest run with resources usage of run process, when it is known."""
+
+    return_code: int
+    peak_rss: int | None = None
+    cpu_time: timedelta | None = None
+    timed_out: bool = False
+
+    @property
+    def killed_by(self) -> signal.Signals | None:
+        if self.return_code >= 0:
+            return None
+        return signal.Signals(-self.return_code)
+
+
+def dispose_inherited_engine() -> None:
+    """Drop database connections, which are inherited by forked process from its parent."""
+    from overhave.db import metadata
+
+    try:
+        engine = metadata.engine
+    except RuntimeError:
+        return
+    # Connections are inherited from parent process, so they are dropped without closing
+    engine.dispose(close=False)
+
+
+def _set_limits(settings: OverhaveTestSettings) -> None:
+    if settings.isolation_memory_limit is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (settings.isolation_memory_limit, settings.isolation_memory_limit))
+    if settings.isolation_cpu_time_limit is not None:
+        seconds = math.ceil(settings.isolation_cpu_time_limit.total_seconds())
+        # Process gets SIGXCPU on soft limit and SIGKILL on hard limit
+        resource.setrlimit(resource.RLIMIT_CPU, (seconds, seconds + 1))
+
+
+def _kill(pid: int, timed_out: threading.Event) -> None:
+    timed_out.set()
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        return
+
+
+def run_forked(pytest_args: list[str], settings: OverhaveTestSettings) -> PytestProcessResult:
+    """Run pytest in forked child process with resources limits from ```settings```.
+
+    Child process inherits factories and imported modules of the current process, so its memory
+    is released right after the run. Child is killed when the run exceeds ```isolation_timeout```.
+    """
+    pid = os.fork()
+    if pid == 0:
+        return_code = 1
+        try:
+            dispose_inherited_engine()
+            _set_limits(settings)
+            return_code = int(pytest.main(pytest_args))
+        finally:
+            os._exit(return_code)
+
+    timed_out = threading.Event()
+    timer: threading.Timer | None = None
+    if settings.isolation_timeout is not None:
+        timer = threading.Timer(settings.isolation_timeout.total_seconds(), _kill, args=(pid, timed_out))
+        timer.start()
+    try:
+        _, status, usage = os.wait4(pid, 0)
+    finally:
+        if timer is not None:
+            timer.cancel()
+    result = PytestProcessResult(
+        return_code=os.waitstatus_to_exitcode(status),
+        # Maximum resident set size is measured in kilobytes on Linux
+        peak_rss=usage.ru_maxrss * 1024,
+        cpu_time=timedelta(seconds=usage.ru_utime + usage.ru_stime),
+        timed_out=timed_out.is_set(),
+    )
+    logger.debug("Pytest process %s finished: %s", pid, result)
+    return result
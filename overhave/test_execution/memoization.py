@@ -0,0 +1,72 @@
+import hashlib
+import logging
+from datetime import timedelta
+from pathlib import Path
+from typing import Sequence
+
+from overhave.scenario import ScenarioCompiler
+from overhave.storage import TestExecutorContext
+from overhave.test_execution.settings import OverhaveTestSettings
+
+logger = logging.getLogger(__name__)
+
+_PYTHON_PATTERN = "*.py"
+
+
+class TestResultMemoizer:
+    """Class for keys of test runs memoization.
+
+    Key is a hash of compiled scenario text, fixture content and steps modules of feature type, so successful
+    result of test run could be reused by another test run with the same key, until scenario or steps code is
+    changed. Published by user of compiled header is not a part of key. Hashes of steps modules are cached
+    by their modification time and size.
+    """
+
+    __test__ = False
+
+    def __init__(
+        self,
+        settings: OverhaveTestSettings,
+        scenario_compiler: ScenarioCompiler,
+        fixture_content: Sequence[str],
+        steps_dir: Path,
+    ) -> None:
+        self._settings = settings
+        self._scenario_compiler = scenario_compiler
+        self._fixture_content = fixture_content
+        self._steps_dir = steps_dir
+        self._file_hashes: dict[Path, tuple[int, int, str]] = {}
+
+    @property
+    def max_age(self) -> timedelta:
+        return self._settings.memoization_max_age
+
+    def _get_file_hash(self, path: Path) -> str:
+        stat = path.stat()
+        cached = self._file_hashes.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        file_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+        self._file_hashes[path] = (stat.st_mtime_ns, stat.st_size, file_hash)
+        return file_hash
+
+    def _get_step_modules(self, feature_type: str) -> list[Path]:
+        modules = list(self._steps_dir.glob(_PYTHON_PATTERN))
+        feature_type_dir = self._steps_dir / feature_type
+        if feature_type_dir.is_dir():
+            modules.extend(feature_type_dir.rglob(_PYTHON_PATTERN))
+        return sorted(modules)
+
+    def get_key(self, context: TestExecutorContext) -> str | None:
+        """Get memoization key of test run, returns None when test run should not be memoized."""
+        feature_type = context.feature.feature_type.name
+        if feature_type in self._settings.memoization_excluded_feature_types:
+            return None
+        test_run = context.test_run.model_copy(update={"executed_by": ""})
+        key = hashlib.sha256()
+        key.update(self._scenario_compiler.compile(context=context.model_copy(update={"test_run": test_run})).encode())
+        key.update("\n".join(self._fixture_content).encode())
+        for module in self._get_step_modules(feature_type):
+            key.update(module.relative_to(self._steps_dir).as_posix().encode())
+            key.update(self._get_file_hash(module).encode())
+        return key.hexdigest()
@@ -1,8 +1,11 @@
 import re
+from dataclasses import dataclass
+from pathlib import Path
 from types import FunctionType
 from typing import NewType
 
 from pydantic import BaseModel, field_validator
+from pytest_bdd.parsers import StepParser
 from pytest_bdd.types import STEP_TYPES
 
 StepTypeName = NewType("StepTypeName", str)
@@ -27,6 +30,18 @@ class BddStepModel(BaseModel):
         return re.sub(r"\n\s{4}", "\n", self.doc).strip("\n ")
 
 
+@dataclass(frozen=True)
+class BddStepDefinition:
+    """Definition of pytest_bdd step with its parser and module, where step function is declared."""
+
+    type: str
+    parser: StepParser
+    module_path: Path | None
+
+    def is_matching(self, step_type: str, name: str) -> bool:
+        return self.type == step_type and self.parser.is_matching(name)
+
+
 def public_step(func: FunctionType) -> FunctionType:
     """
     Decorator for Overhave BDD steps, enables display of decorated step.
@@ -0,0 +1,102 @@
+import atexit
+import logging
+import multiprocessing
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+from multiprocessing.pool import Pool
+from typing import Callable
+
+from overhave.test_execution.executor import ITestExecutor
+from overhave.test_execution.isolation import dispose_inherited_engine
+
+logger = logging.getLogger(__name__)
+
+_worker_executor: ITestExecutor | None = None
+
+
+def _init_worker(executor_getter: Callable[[], ITestExecutor]) -> None:
+    global _worker_executor
+    dispose_inherited_engine()
+    _worker_executor = executor_getter()
+
+
+def _execute_test(test_run_id: int) -> None:
+    if _worker_executor is None:
+        raise RuntimeError("Test executor of process has not been initialized!")
+    _worker_executor.execute_test(test_run_id)
+
+
+@dataclass(frozen=True)
+class TestRunQueue:
+    """Model for state of :class:`TestRunProcessPool` queue."""
+
+    __test__ = False
+
+    running: list[int]
+    waiting: list[int]
+
+
+class TestRunProcessPool:
+    """Pool of processes for test runs of application without consumers.
+
+    Every test run is executed in its own process, which is forked from the current process and exits after
+    the run, so pytest state of runs is not shared. Number of simultaneous runs is limited by ```processes```,
+    other submitted runs wait in queue. Processes are forked on the first submit, ```executor_getter``` is
+    called in every process to prepare test executor, so it is not pickled. Pool is closed at exit
+    of the current process, so it waits for already submitted runs.
+    """
+
+    __test__ = False
+
+    def __init__(self, processes: int, executor_getter: Callable[[], ITestExecutor]) -> None:
+        self._processes = processes
+        self._executor_getter = executor_getter
+        self._lock = threading.Lock()
+        self._pending: dict[int, None] = {}
+
+    @cached_property
+    def _pool(self) -> Pool:
+        logger.info("Starting pool of %s test run processes...", self._processes)
+        atexit.register(self.close)
+        return multiprocessing.get_context("fork").Pool(
+            processes=self._processes,
+            initializer=_init_worker,
+            initargs=(self._executor_getter,),
+            maxtasksperchild=1,
+        )
+
+    def _done(self, test_run_id: int) -> None:
+        with self._lock:
+            self._pending.pop(test_run_id, None)
+
+    def _failed(self, test_run_id: int, error: BaseException) -> None:
+        logger.error("Test run %s failed in process pool: %s", test_run_id, error)
+        self._done(test_run_id)
+
+    def submit(self, test_run_id: int) -> None:
+        with self._lock:
+            pool = self._pool
+            self._pending[test_run_id] = None
+        pool.apply_async(
+            _execute_test,
+            (test_run_id,),
+            callback=lambda _: self._done(test_run_id),
+            error_callback=lambda error: self._failed(test_run_id, error),
+        )
+
+    @property
+    def queue(self) -> TestRunQueue:
+        """Submitted test runs, which are not finished yet, in order of submission."""
+        with self._lock:
+            pending = list(self._pending)
+        processes = self._processes
+        return TestRunQueue(running=pending[:processes], waiting=pending[processes:])
+
+    def close(self) -> None:
+        if "_pool" not in self.__dict__:
+            return
+        atexit.unregister(self.close)
+        self._pool.close()
+        self._pool.join()
+        del self.__dict__["_pool"]
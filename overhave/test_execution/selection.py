@@ -0,0 +1,9 @@
+from typing import Collection
+
+SCENARIOS_OPTION = "--overhave-scenario"
+FAIL_FAST_OPTION = "-x"
+
+
+def is_selected_scenario(name: str, index: int, scenarios: Collection[str]) -> bool:
+    """Check that scenario is selected by its name or by its 1-based ```index``` in feature."""
+    return name in scenarios or str(index) in scenarios
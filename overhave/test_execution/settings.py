@@ -1,3 +1,7 @@
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+
 import httpx
 from pydantic import Field, field_validator
 
@@ -41,6 +45,57 @@ class OverhaveTestSettings(BaseOverhavePrefix):
     extra_pytest_addoptions: str | None = Field(default=None)
 
     workers: int | None = Field(default=None, description="Number of xdist workers")
+    adaptive_workers: bool = Field(
+        default=False, description="Choose number of xdist workers for every test run by its tests count and CPU load"
+    )
+    adaptive_workers_min_tests: int = Field(
+        default=4, description="Minimum number of tests per xdist worker for adaptive workers sizing"
+    )
+    adaptive_workers_max: int | None = Field(
+        default=None, description="Maximum number of xdist workers for adaptive workers sizing"
+    )
+
+    prefork_workers: int | None = Field(
+        default=None, description="Number of warm pytest workers, which fork child process for every test run"
+    )
+    prefork_max_runs_per_worker: int = Field(
+        default=100, description="Number of test runs, after which warm pytest worker is recycled"
+    )
+    isolation_enabled: bool = Field(
+        default=False, description="Run every test run in forked child process with resources limits"
+    )
+    isolation_memory_limit: int | None = Field(
+        default=None, description="Limit of virtual memory (RLIMIT_AS) of test run process in bytes"
+    )
+    isolation_cpu_time_limit: timedelta | None = Field(
+        default=None, description="Limit of CPU time (RLIMIT_CPU) of test run process"
+    )
+    isolation_timeout: timedelta | None = Field(
+        default=None, description="Wall clock timeout, after which test run process is killed"
+    )
+
+    shards_max: int = Field(
+        default=1, le=63, description="Maximum number of shards, which scenarios of large feature are split into"
+    )
+    shard_min_tests: int = Field(default=20, description="Minimum number of tests per shard of test run")
+    shards_results_dir: Path = Field(
+        default=Path(tempfile.gettempdir()) / "overhave-shards",
+        description="Directory for Allure results of test run shards, which is shared by consumers",
+    )
+
+    batch_max_runs: int = Field(
+        default=1, description="Maximum number of test runs of one feature type, which are run in one pytest session"
+    )
+
+    memoization_enabled: bool = Field(
+        default=False, description="Reuse recent successful result of test run with the same scenario and steps"
+    )
+    memoization_max_age: timedelta = Field(
+        default=timedelta(days=1), description="Maximum age of successful test run, which result could be reused"
+    )
+    memoization_excluded_feature_types: list[str] = Field(
+        default_factory=list, description="Feature types, which test runs are always executed"
+    )
 
 
 class OverhaveStepCollectorSettings(BaseOverhavePrefix):
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from typing import Sequence, TypeVar
+
+SHARD_OPTION = "--overhave-shard"
+
+TItem = TypeVar("TItem")
+
+
+@dataclass(frozen=True)
+class PytestShard:
+    """Shard of test run tests, tests are distributed between shards by order of collection."""
+
+    index: int
+    count: int
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    @classmethod
+    def parse(cls, value: str) -> "PytestShard":
+        index, count = (int(x) for x in value.split("/"))
+        if not 0 <= index < count:
+            raise ValueError(f"Shard index should be in range from 0 to {count - 1}, but got {index}!")
+        return cls(index=index, count=count)
+
+    def select(self, items: Sequence[TItem]) -> tuple[list[TItem], list[TItem]]:
+        """Split collected items into selected for shard and deselected ones."""
+        selected: list[TItem] = []
+        deselected: list[TItem] = []
+        for number, item in enumerate(items):
+            if number % self.count == self.index:
+                selected.append(item)
+                continue
+            deselected.append(item)
+        return selected, deselected
@@ -1,5 +1,7 @@
+import inspect
 import logging
 from operator import attrgetter
+from pathlib import Path
 from typing import Any, cast
 
 from _pytest.fixtures import FixtureDef
@@ -7,7 +9,7 @@ from _pytest.main import Session
 
 from overhave.entities import StepPrefixesModel
 from overhave.storage import FeatureTypeName
-from overhave.test_execution.objects import BddStepModel, is_public_step
+from overhave.test_execution.objects import BddStepDefinition, BddStepModel, is_public_step
 from overhave.test_execution.settings import OverhaveStepCollectorSettings
 
 _PYTESTBDD_FIXTURE_MARK = "pytestbdd_"
@@ -24,20 +26,36 @@ class BddStepWithoutDocsError(BaseStepCollectorException):
     """Error for situation when pytest_bdd steps declared without docstring."""
 
 
+def _get_module_path(func: Any) -> Path | None:
+    source_file = inspect.getsourcefile(func)
+    if source_file is None:
+        return None
+    return Path(source_file).resolve()
+
+
 class StepCollector:
-    """Class for `pytest-bdd` steps dynamic collection."""
+    """Class for `pytest-bdd` steps dynamic collection.
+
+    Besides steps models for Overhave Admin UI, collector keeps steps definitions with their parsers and modules,
+    which are used for changes impact analysis.
+    """
 
     def __init__(self, settings: OverhaveStepCollectorSettings, step_prefixes: StepPrefixesModel | None) -> None:
         self._settings = settings
         self._step_prefixes = step_prefixes
         self._steps: dict[FeatureTypeName, list[BddStepModel]] = {}
+        self._definitions: dict[FeatureTypeName, list[BddStepDefinition]] = {}
 
-    def _is_bdd_step(self, fixture: FixtureDef[Any]) -> bool:
-        is_bdd_step = (
+    @staticmethod
+    def _is_step_fixture(fixture: FixtureDef[Any]) -> bool:
+        return (
             isinstance(fixture.argname, str)
             and fixture.argname.startswith(_PYTESTBDD_FIXTURE_MARK)
             and not fixture.argname.endswith(_PYTESTBDD_FIXTURE_TRACE_MARK)
         )
+
+    def _is_bdd_step(self, fixture: FixtureDef[Any]) -> bool:
+        is_bdd_step = self._is_step_fixture(fixture)
         logger.debug("Fixture: %s - is_bdd_step=%s", fixture.argname, is_bdd_step)
         if not is_bdd_step:
             return False
@@ -85,6 +103,18 @@ class StepCollector:
             for f in steps
         ]
 
+    def _compile_step_definitions(self, session: Session) -> list[BddStepDefinition]:
+        return [
+            BddStepDefinition(
+                type=f.func._pytest_bdd_step_context.type,  # type: ignore[union-attr]
+                parser=f.func._pytest_bdd_step_context.parser,  # type: ignore[union-attr]
+                module_path=_get_module_path(f.func._pytest_bdd_step_context.step_func),  # type: ignore[union-attr]
+            )
+            for fx_list in session._fixturemanager._arg2fixturedefs.values()
+            for f in fx_list
+            if self._is_step_fixture(f)
+        ]
+
     def collect_steps(self, session: Session, feature_type: FeatureTypeName) -> None:
         logger.debug("Collecting steps for feature_type=%s...", feature_type)
         step_fixtures = self._get_pytestbdd_step_fixtures(session)
@@ -94,6 +124,19 @@ class StepCollector:
         else:
             logger.warning("Feature type '%s' does not have any pytest_bdd steps!", feature_type)
         self._steps[feature_type] = bdd_steps
+        self._definitions[feature_type] = self._compile_step_definitions(session)
 
     def get_steps(self, feature_type: FeatureTypeName) -> list[BddStepModel] | None:
         return self._steps.get(feature_type)
+
+    def get_step_definitions(self, feature_type: FeatureTypeName) -> list[BddStepDefinition] | None:
+        return self._definitions.get(feature_type)
+
+    @property
+    def step_modules(self) -> set[Path]:
+        return {
+            definition.module_path
+            for definitions in self._definitions.values()
+            for definition in definitions
+            if definition.module_path is not None
+        }
@@ -1,9 +1,14 @@
 import logging
 from pathlib import Path
+from typing import Sequence
 
 import pytest
 
+from overhave.test_execution.isolation import PytestProcessResult, run_forked
+from overhave.test_execution.selection import FAIL_FAST_OPTION, SCENARIOS_OPTION
 from overhave.test_execution.settings import OverhaveTestSettings
+from overhave.test_execution.sharding import SHARD_OPTION, PytestShard
+from overhave.test_execution.worker_pool import PytestWorkerPool
 
 logger = logging.getLogger(__name__)
 
@@ -15,20 +20,60 @@ def _extend_cmd_args(cmd: list[str], addoptions: str | None) -> None:
 
 
 class PytestRunner:
-    """Class for running `PyTest` in test and collect-only modes."""
+    """Class for running `PyTest` in test and collect-only modes.
 
-    def __init__(self, settings: OverhaveTestSettings) -> None:
+    Tests are run in the current process, by warm workers of ```worker_pool``` or in forked child process
+    with resources limits, when isolation is enabled.
+    """
+
+    def __init__(self, settings: OverhaveTestSettings, worker_pool: PytestWorkerPool | None = None) -> None:
         self._settings = settings
+        self._worker_pool = worker_pool
+
+    def run(
+        self,
+        fixture_file: str,
+        alluredir: str,
+        workers: int | None = None,
+        shard: PytestShard | None = None,
+        scenarios: Sequence[str] | None = None,
+        fail_fast: bool = False,
+    ) -> PytestProcessResult:
+        """Run tests of fixture file, ```workers``` overrides number of xdist workers from settings.
 
-    def run(self, fixture_file: str, alluredir: str) -> int:
+        Only tests of ```shard``` and of ```scenarios```, which are specified by names or 1-based indices
+        in feature, are run, when they are specified. Run is stopped on the first failure with ```fail_fast```.
+        """
         pytest_cmd = [fixture_file, f"--alluredir={alluredir}"]
+        if shard is not None:
+            pytest_cmd.append(f"{SHARD_OPTION}={shard}")
+        pytest_cmd.extend(f"{SCENARIOS_OPTION}={scenario}" for scenario in scenarios or ())
+        if fail_fast:
+            pytest_cmd.append(FAIL_FAST_OPTION)
+        return self._run(pytest_cmd=pytest_cmd, workers=workers)
+
+    def run_batch(
+        self, fixture_files: Sequence[str], alluredir: str, workers: int | None = None
+    ) -> PytestProcessResult:
+        """Run tests of several fixture files in one session, which continues on collection errors."""
+        return self._run(
+            pytest_cmd=[*fixture_files, f"--alluredir={alluredir}", "--continue-on-collection-errors"], workers=workers
+        )
+
+    def _run(self, pytest_cmd: list[str], workers: int | None) -> PytestProcessResult:
         for addoptions in (self._settings.default_pytest_addoptions, self._settings.extra_pytest_addoptions):
             _extend_cmd_args(cmd=pytest_cmd, addoptions=addoptions)
-        if self._settings.workers is not None:
-            pytest_cmd.extend(["-n", f"{self._settings.workers}"])
+        if workers is None:
+            workers = self._settings.workers
+        if workers:
+            pytest_cmd.extend(["-n", f"{workers}"])
 
         logger.debug("Prepared pytest args: %s", pytest_cmd)
-        return pytest.main(pytest_cmd)
+        if self._worker_pool is not None:
+            return self._worker_pool.run(pytest_cmd)
+        if self._settings.isolation_enabled:
+            return run_forked(pytest_args=pytest_cmd, settings=self._settings)
+        return PytestProcessResult(return_code=pytest.main(pytest_cmd))
 
     def collect_only(self, fixture_file: Path) -> None:
         logger.info("Started tests collection process with '%s'...", fixture_file.name)
@@ -0,0 +1,66 @@
+import importlib
+import logging
+import multiprocessing
+import os
+import threading
+from functools import cached_property
+from importlib.metadata import entry_points
+from multiprocessing.pool import Pool
+
+from overhave.test_execution.isolation import PytestProcessResult, dispose_inherited_engine, run_forked
+from overhave.test_execution.settings import OverhaveTestSettings
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_up_worker() -> None:
+    from overhave.pytest_plugin import get_proxy_manager
+
+    dispose_inherited_engine()
+    for entry_point in entry_points(group="pytest11"):
+        try:
+            entry_point.load()
+        except Exception:
+            logger.warning("Could not preload pytest plugin %s", entry_point.name, exc_info=True)
+    for plugin in get_proxy_manager().plugin_resolver.get_plugins():
+        try:
+            importlib.import_module(plugin)
+        except Exception:
+            logger.warning("Could not preload steps module %s", plugin, exc_info=True)
+    logger.info("Pytest worker %s is warmed up", os.getpid())
+
+
+class PytestWorkerPool:
+    """Pool of warm processes for pytest runs.
+
+    Every worker imports pytest plugins and steps modules once and forks copy-on-write child for every run,
+    so the run does not pay for plugins import and pytest state of runs is not shared. Workers are forked
+    from the current process on the first run and recycled after ```prefork_max_runs_per_worker``` runs.
+    Resources limits of isolation settings are applied to forked children.
+    """
+
+    def __init__(self, settings: OverhaveTestSettings) -> None:
+        self._settings = settings
+        self._lock = threading.Lock()
+
+    @cached_property
+    def _pool(self) -> Pool:
+        processes = self._settings.prefork_workers
+        logger.info("Starting pool of %s warm pytest workers...", processes)
+        return multiprocessing.get_context("fork").Pool(
+            processes=processes,
+            initializer=_warm_up_worker,
+            maxtasksperchild=self._settings.prefork_max_runs_per_worker,
+        )
+
+    def run(self, pytest_args: list[str]) -> PytestProcessResult:
+        with self._lock:
+            pool = self._pool
+        return pool.apply(run_forked, (pytest_args, self._settings))
+
+    def close(self) -> None:
+        if "_pool" not in self.__dict__:
+            return
+        self._pool.close()
+        self._pool.join()
+        del self.__dict__["_pool"]
@@ -0,0 +1,105 @@
+import logging
+import math
+import os
+from functools import cached_property
+from typing import Sequence
+
+from pytest_bdd import types as default_types
+
+from overhave.entities import StepPrefixesModel
+from overhave.scenario.prefix_mixin import PrefixMixin
+from overhave.test_execution.settings import OverhaveTestSettings
+
+logger = logging.getLogger(__name__)
+
+_TABLE_ROW_PREFIX = "|"
+
+
+def _get_available_cpus() -> int:
+    cpu_count = os.cpu_count() or 1
+    try:
+        load = os.getloadavg()[0]
+    except OSError:
+        load = 0.0
+    return max(cpu_count - math.floor(load), 1)
+
+
+class PytestWorkersPlanner(PrefixMixin):
+    """Class for choosing number of xdist workers for test run.
+
+    Number of tests is calculated by scenario text: every scenario is a test and every row of scenario outline
+    examples is a test. Workers are not used for features with less than ```adaptive_workers_min_tests``` tests,
+    otherwise every worker gets at least ```adaptive_workers_min_tests``` tests and number of workers is limited
+    by CPUs, which are not busy by current load average, and ```adaptive_workers_max``` cap.
+    When adaptive sizing is disabled, fixed ```workers``` value is used.
+
+    Test run is split into shards, when every one of at least two shards gets ```shard_min_tests``` tests.
+    """
+
+    def __init__(self, settings: OverhaveTestSettings, step_prefixes: StepPrefixesModel | None) -> None:
+        self._settings = settings
+        self._step_prefixes = step_prefixes
+
+    def _get_prefixes(self, key: str) -> tuple[str, ...]:
+        prefixes = [self._as_prefix(getattr(default_types, key))]
+        if self._step_prefixes is not None:
+            prefixes.append(self._as_prefix(getattr(self._step_prefixes, key)))
+        return tuple(prefixes)
+
+    @cached_property
+    def _scenario_prefixes(self) -> tuple[str, ...]:
+        return self._get_prefixes("SCENARIO")
+
+    @cached_property
+    def _outline_prefixes(self) -> tuple[str, ...]:
+        return self._get_prefixes("SCENARIO_OUTLINE")
+
+    @cached_property
+    def _examples_prefixes(self) -> tuple[str, ...]:
+        return self._get_prefixes("EXAMPLES")
+
+    def count_tests(self, scenario_text: str) -> int:
+        """Count tests of scenario text, first row of every examples table is a header."""
+        tests_count = 0
+        outline_rows: list[int] = []
+        in_examples = False
+        for line in (x.strip() for x in scenario_text.splitlines()):
+            if line.startswith(self._examples_prefixes):
+                if outline_rows:
+                    outline_rows[-1] -= 1
+                in_examples = True
+            elif line.startswith(self._outline_prefixes):
+                outline_rows.append(0)
+                in_examples = False
+            elif line.startswith(self._scenario_prefixes):
+                tests_count += 1
+                in_examples = False
+            elif in_examples and outline_rows and line.startswith(_TABLE_ROW_PREFIX):
+                outline_rows[-1] += 1
+        return tests_count + sum(max(rows, 1) for rows in outline_rows)
+
+    def _get_adaptive_workers(self, tests_count: int) -> int:
+        min_tests = max(self._settings.adaptive_workers_min_tests, 1)
+        workers = min(tests_count // min_tests, _get_available_cpus())
+        if self._settings.adaptive_workers_max is not None:
+            workers = min(workers, self._settings.adaptive_workers_max)
+        if workers < 2:
+            return 0
+        return workers
+
+    def get_workers(self, scenario_texts: Sequence[str]) -> int | None:
+        """Get number of xdist workers for scenarios of test run, 0 means that xdist is not used."""
+        if not self._settings.adaptive_workers:
+            return self._settings.workers
+        tests_count = sum(self.count_tests(text) for text in scenario_texts)
+        workers = self._get_adaptive_workers(tests_count)
+        logger.debug("Chosen %s xdist workers for %s tests", workers, tests_count)
+        return workers
+
+    def get_shards(self, scenario_text: str) -> int:
+        """Get number of shards for scenario of test run, 0 means that test run is not sharded."""
+        min_tests = max(self._settings.shard_min_tests, 1)
+        shards = min(self.count_tests(scenario_text) // min_tests, self._settings.shards_max)
+        if shards < 2:
+            return 0
+        return shards
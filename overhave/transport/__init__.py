@@ -1,4 +1,5 @@
 # flake8: noqa
+from .base import ITaskConsumer, ITaskProducer
 from .http import (
     GitlabHttpClient,
     GitlabMrCreationResponse,
@@ -20,22 +21,44 @@ from .http import (
     StashReviewerInfo,
 )
 from .ldap import LDAPAuthenticator, OverhaveLdapClientSettings
-from .redis import (
+from .local import (
+    LocalConsumer,
+    LocalProducer,
+    LocalStreamBroker,
+    LocalStreamEntry,
+    LocalTransportError,
+    OverhaveLocalTransportSettings,
+)
+from .objects import (
     AnyRedisTask,
-    BaseRedisSettings,
     BaseRedisTask,
     EmulationData,
     EmulationTask,
-    OverhaveRedisSentinelSettings,
-    OverhaveRedisSettings,
     PublicationData,
     PublicationTask,
-    RedisConsumer,
-    RedisConsumerRunner,
-    RedisProducer,
+    RedisMessageFormat,
     RedisStream,
     TestRunData,
+    TestRunPriority,
+    TestRunShardData,
     TestRunTask,
     TRedisTask,
+    UnsupportedRedisMessageError,
+)
+from .redis import (
+    AsyncRedisConsumerRunner,
+    BaseRedisSettings,
+    OverhaveRedisSentinelSettings,
+    OverhaveRedisSettings,
+    RedisAdmissionController,
+    RedisAdmissionDecision,
+    RedisConsumer,
+    RedisConsumerRunner,
+    RedisConsumerSupervisor,
+    RedisLanesConsumer,
+    RedisProducer,
+    RedisStreamTrimmer,
+    WeightedRoundRobin,
 )
 from .s3 import OverhaveS3ManagerSettings, S3Manager
+from .settings import BaseStreamSettings, RedisDeliveryMode
@@ -0,0 +1,66 @@
+import abc
+import logging
+from types import TracebackType
+from typing import Iterator, Sequence
+
+from overhave.transport.objects import BaseRedisTask, RedisStream, RedisUnreadData
+
+logger = logging.getLogger(__name__)
+
+
+class ITaskProducer(abc.ABC):
+    """Abstract class for producers of tasks into streams."""
+
+    @abc.abstractmethod
+    def add_task(self, task: BaseRedisTask) -> bool:
+        pass
+
+    @abc.abstractmethod
+    def add_tasks(self, tasks: Sequence[BaseRedisTask]) -> list[bool]:
+        pass
+
+
+class ITaskConsumer(abc.ABC):
+    """Abstract class for consumers of tasks from streams with consumer group semantics."""
+
+    @property
+    @abc.abstractmethod
+    def stream_name(self) -> RedisStream:
+        pass
+
+    @property
+    @abc.abstractmethod
+    def stream_key(self) -> str:
+        pass
+
+    @property
+    @abc.abstractmethod
+    def batch_size(self) -> int:
+        pass
+
+    @abc.abstractmethod
+    def read(self, count: int | None = None, block: bool = True) -> Sequence[RedisUnreadData]:
+        pass
+
+    @abc.abstractmethod
+    def acknowledge(self, data: RedisUnreadData) -> None:
+        pass
+
+    @abc.abstractmethod
+    def __enter__(self) -> None:
+        pass
+
+    @abc.abstractmethod
+    def __exit__(self, exc_type: type[Exception], exc_val: Exception, exc_tb: TracebackType) -> None:
+        pass
+
+    def __iter__(self) -> Iterator[Sequence[RedisUnreadData]]:
+        while True:
+            try:
+                messages = self.read()
+                if messages:
+                    yield messages
+                continue
+            except Exception:
+                logger.exception("Error while trying to consume message from %s!", self.stream_key)
+            raise StopIteration()
@@ -0,0 +1,5 @@
+# flake8: noqa
+from .broker import LocalStreamBroker, LocalStreamEntry, LocalTransportError
+from .consumer import LocalConsumer
+from .producer import LocalProducer
+from .settings import OverhaveLocalTransportSettings
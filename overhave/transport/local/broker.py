@@ -0,0 +1,220 @@
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from functools import cached_property
+from typing import Iterator, NamedTuple, Sequence
+
+import orjson
+
+from overhave.transport.local.settings import OverhaveLocalTransportSettings
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stream_entry (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    stream TEXT NOT NULL,
+    message BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_stream_entry_stream ON stream_entry (stream, id);
+CREATE TABLE IF NOT EXISTS consumer_group (
+    stream TEXT NOT NULL,
+    name TEXT NOT NULL,
+    last_delivered_id INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (stream, name)
+);
+CREATE TABLE IF NOT EXISTS pending_entry (
+    stream TEXT NOT NULL,
+    group_name TEXT NOT NULL,
+    entry_id INTEGER NOT NULL,
+    consumer TEXT NOT NULL,
+    delivered_at REAL NOT NULL,
+    times_delivered INTEGER NOT NULL,
+    PRIMARY KEY (stream, group_name, entry_id)
+);
+"""
+
+
+class LocalTransportError(Exception):
+    """Exception for errors of local transport."""
+
+
+class LocalStreamEntry(NamedTuple):
+    """Entry of local stream with count of its deliveries to consumer group."""
+
+    message_id: bytes
+    message: dict[bytes, bytes]
+    times_delivered: int
+
+
+def _format_id(entry_id: int) -> bytes:
+    return f"{entry_id}-0".encode()
+
+
+def _parse_id(message_id: bytes | str) -> int:
+    if isinstance(message_id, bytes):
+        message_id = message_id.decode()
+    return int(message_id.partition("-")[0])
+
+
+def _dump_message(message: dict[bytes, bytes]) -> bytes:
+    return orjson.dumps({key.decode(): value.decode() for key, value in message.items()})
+
+
+def _load_message(raw: bytes) -> dict[bytes, bytes]:
+    return {key.encode(): value.encode() for key, value in orjson.loads(raw).items()}
+
+
+class LocalStreamBroker:
+    """Class for streams with consumer groups semantics of Redis streams, which are stored in SQLite.
+
+    Every consumer group reads entries of stream after its last delivered entry. Delivered entries are pending
+    until acknowledgement and could be claimed by another consumer after idle time. Entries, which are delivered
+    to all consumer groups and acknowledged, are deleted.
+    """
+
+    def __init__(self, settings: OverhaveLocalTransportSettings) -> None:
+        self._settings = settings
+        self._lock = threading.RLock()
+
+    @cached_property
+    def _connection(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._settings.database,
+            timeout=self._settings.lock_timeout.total_seconds(),
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        if self._settings.database != ":memory:":
+            connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+        logger.info("Local transport uses database %s", self._settings.database)
+        return connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def add(self, stream: str, message: dict[bytes, bytes]) -> bytes:
+        return self.add_many([(stream, message)])[0]
+
+    def add_many(self, entries: Sequence[tuple[str, dict[bytes, bytes]]]) -> list[bytes]:
+        """Add entries into streams with one transaction and return their IDs."""
+        message_ids: list[bytes] = []
+        with self._transaction() as connection:
+            for stream, message in entries:
+                cursor = connection.execute(
+                    "INSERT INTO stream_entry (stream, message) VALUES (?, ?)", (stream, _dump_message(message))
+                )
+                message_ids.append(_format_id(cursor.lastrowid or 0))
+        return message_ids
+
+    def create_group(self, stream: str, group: str) -> None:
+        with self._transaction() as connection:
+            connection.execute("INSERT OR IGNORE INTO consumer_group (stream, name) VALUES (?, ?)", (stream, group))
+
+    def _read_new(self, stream: str, group: str, consumer: str, count: int) -> list[LocalStreamEntry]:
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT last_delivered_id FROM consumer_group WHERE stream = ? AND name = ?", (stream, group)
+            ).fetchone()
+            if row is None:
+                raise LocalTransportError(f"Consumer group {group} of stream {stream} does not exist!")
+            rows = connection.execute(
+                "SELECT id, message FROM stream_entry WHERE stream = ? AND id > ? ORDER BY id LIMIT ?",
+                (stream, row[0], count),
+            ).fetchall()
+            if not rows:
+                return []
+            now = time.time()
+            connection.executemany(
+                "INSERT OR REPLACE INTO pending_entry "
+                "(stream, group_name, entry_id, consumer, delivered_at, times_delivered) VALUES (?, ?, ?, ?, ?, 1)",
+                [(stream, group, entry_id, consumer, now) for entry_id, _ in rows],
+            )
+            connection.execute(
+                "UPDATE consumer_group SET last_delivered_id = ? WHERE stream = ? AND name = ?",
+                (rows[-1][0], stream, group),
+            )
+        return [LocalStreamEntry(_format_id(entry_id), _load_message(message), 1) for entry_id, message in rows]
+
+    def read_group(
+        self, stream: str, group: str, consumer: str, count: int, block: timedelta | None = None
+    ) -> list[LocalStreamEntry]:
+        """Read not more than ```count``` new entries of ```stream``` by ```consumer``` of consumer ```group```.
+
+        Entries become pending for the consumer. When there are no new entries, reading is blocked
+        for ```block``` timeout.
+        """
+        deadline = time.monotonic()
+        if block is not None:
+            deadline += block.total_seconds()
+        while True:
+            entries = self._read_new(stream=stream, group=group, consumer=consumer, count=count)
+            remaining = deadline - time.monotonic()
+            if entries or remaining <= 0:
+                return entries
+            time.sleep(min(self._settings.poll_interval.total_seconds(), remaining))
+
+    def claim_idle(
+        self, stream: str, group: str, consumer: str, min_idle_time: timedelta, count: int
+    ) -> list[LocalStreamEntry]:
+        """Transfer pending entries, which are idle for ```min_idle_time```, to ```consumer``` and deliver them."""
+        now = time.time()
+        with self._transaction() as connection:
+            rows = connection.execute(
+                "SELECT p.entry_id, e.message, p.times_delivered FROM pending_entry p "
+                "JOIN stream_entry e ON e.id = p.entry_id "
+                "WHERE p.stream = ? AND p.group_name = ? AND p.delivered_at <= ? ORDER BY p.entry_id LIMIT ?",
+                (stream, group, now - min_idle_time.total_seconds(), count),
+            ).fetchall()
+            connection.executemany(
+                "UPDATE pending_entry SET consumer = ?, delivered_at = ?, times_delivered = times_delivered + 1 "
+                "WHERE stream = ? AND group_name = ? AND entry_id = ?",
+                [(consumer, now, stream, group, entry_id) for entry_id, _, _ in rows],
+            )
+        return [
+            LocalStreamEntry(_format_id(entry_id), _load_message(message), times_delivered + 1)
+            for entry_id, message, times_delivered in rows
+        ]
+
+    def ack(self, stream: str, group: str, *message_ids: bytes | str) -> int:
+        """Acknowledge pending entries and delete entries, which are processed by all consumer groups."""
+        with self._transaction() as connection:
+            cursor = connection.executemany(
+                "DELETE FROM pending_entry WHERE stream = ? AND group_name = ? AND entry_id = ?",
+                [(stream, group, _parse_id(message_id)) for message_id in message_ids],
+            )
+            connection.execute(
+                "DELETE FROM stream_entry WHERE stream = ? "
+                "AND id <= (SELECT MIN(last_delivered_id) FROM consumer_group WHERE stream = ?) "
+                "AND id NOT IN (SELECT entry_id FROM pending_entry WHERE stream = ?)",
+                (stream, stream, stream),
+            )
+            return cursor.rowcount
+
+    def pending_count(self, stream: str, group: str, consumer: str | None = None) -> int:
+        query = "SELECT COUNT(*) FROM pending_entry WHERE stream = ? AND group_name = ?"
+        params: tuple[str, ...] = (stream, group)
+        if consumer is not None:
+            query += " AND consumer = ?"
+            params += (consumer,)
+        with self._lock:
+            return int(self._connection.execute(query, params).fetchone()[0])
+
+    def length(self, stream: str) -> int:
+        with self._lock:
+            return int(
+                self._connection.execute("SELECT COUNT(*) FROM stream_entry WHERE stream = ?", (stream,)).fetchone()[0]
+            )
@@ -0,0 +1,125 @@
+import logging
+import time
+from types import TracebackType
+from typing import Sequence
+
+from overhave.metrics import BaseOverhaveMetricContainer
+from overhave.transport.base import ITaskConsumer
+from overhave.transport.local.broker import LocalStreamBroker, LocalStreamEntry
+from overhave.transport.objects import RedisStream, RedisUnreadData
+from overhave.transport.settings import BaseStreamSettings
+
+logger = logging.getLogger(__name__)
+
+
+class LocalConsumer(ITaskConsumer):
+    """Class for consuming tasks from stream of :class:`LocalStreamBroker`.
+
+    Consumer has the same semantics as :class:`RedisConsumer`: it is member of `cg-<stream>` consumer group,
+    follows ```delivery_mode```, reclaims idle pending messages and moves messages with exceeded
+    ```max_deliveries``` to the dead-letter stream.
+    """
+
+    def __init__(
+        self,
+        settings: BaseStreamSettings,
+        stream_name: RedisStream,
+        broker: LocalStreamBroker,
+        metric_container: BaseOverhaveMetricContainer,
+        stream_key: str | None = None,
+    ):
+        self._settings = settings
+        self._stream_name = stream_name
+        self._stream_key = stream_key or stream_name.value
+        self._group = f"cg-{stream_name}"
+        self._broker = broker
+        self._metric_container = metric_container
+        self._consumer_name = settings.get_consumer_name()
+        self._last_reclaim_time: float | None = None
+
+    @property
+    def stream_name(self) -> RedisStream:
+        return self._stream_name
+
+    @property
+    def stream_key(self) -> str:
+        return self._stream_key
+
+    @property
+    def batch_size(self) -> int:
+        return self._settings.read_count
+
+    def _to_unread_data(self, entry: LocalStreamEntry) -> RedisUnreadData:
+        return RedisUnreadData(entry.message_id, entry.message, stream_key=self._stream_key)
+
+    def _reclaim_required(self) -> bool:
+        if self._last_reclaim_time is None:
+            return True
+        return time.monotonic() - self._last_reclaim_time >= self._settings.reclaim_interval.total_seconds()
+
+    def _reclaim(self, count: int) -> list[RedisUnreadData]:
+        entries = self._broker.claim_idle(
+            self._stream_key,
+            self._group,
+            self._consumer_name,
+            min_idle_time=self._settings.reclaim_idle_time,
+            count=count,
+        )
+        if len(entries) < count:
+            self._last_reclaim_time = time.monotonic()
+        objects: list[RedisUnreadData] = []
+        for entry in entries:
+            data = self._to_unread_data(entry)
+            if entry.times_delivered > self._settings.max_deliveries:
+                dead_letter_stream = f"{self._stream_key}{self._settings.dead_letter_postfix}"
+                logger.error(
+                    "Message %s has been delivered %s times, move it to stream %s",
+                    data.message_id,
+                    entry.times_delivered,
+                    dead_letter_stream,
+                )
+                self._broker.add(dead_letter_stream, data.message)
+                self._broker.ack(self._stream_key, self._group, data.message_id)
+                self._metric_container.dead_letter_redis_task(task_type=self._stream_name.value)
+                continue
+            logger.info("Reclaimed pending message %s", data)
+            objects.append(data)
+        return objects
+
+    def read(self, count: int | None = None, block: bool = True) -> Sequence[RedisUnreadData]:
+        """Read not more than ```count``` messages (```read_count``` by default) with optional blocking timeout."""
+        count = count or self._settings.read_count
+        if self._settings.ack_after_processing and self._reclaim_required():
+            reclaimed = self._reclaim(count)
+            if reclaimed:
+                self._metric_container.consume_redis_task(task_type=self._stream_name.value, count=len(reclaimed))
+                return reclaimed
+        block_timeout = None
+        if block:
+            block_timeout = self._settings.block_timeout
+        entries = self._broker.read_group(
+            self._stream_key, self._group, self._consumer_name, count=count, block=block_timeout
+        )
+        messages = [self._to_unread_data(entry) for entry in entries]
+        if not messages:
+            return messages
+        if not self._settings.ack_after_processing:
+            self._broker.ack(self._stream_key, self._group, *(data.message_id for data in messages))
+        self._metric_container.consume_redis_task(task_type=self._stream_name.value, count=len(messages))
+        return messages
+
+    def acknowledge(self, data: RedisUnreadData) -> None:
+        """Acknowledge successfully processed message in `at_least_once` delivery mode."""
+        if not self._settings.ack_after_processing:
+            return
+        self._broker.ack(self._stream_key, self._group, data.message_id)
+        logger.debug("Acknowledged message %s", data.message_id)
+
+    def __enter__(self) -> None:
+        logger.info("Starting consuming from local stream %s as %s...", self._stream_key, self._consumer_name)
+        self._broker.create_group(self._stream_key, self._group)
+
+    def __exit__(self, exc_type: type[Exception], exc_val: Exception, exc_tb: TracebackType) -> None:
+        pending = self._broker.pending_count(self._stream_key, self._group, consumer=self._consumer_name)
+        if pending:
+            logger.info("Consumer %s has %s pending messages, they will be reclaimed", self._consumer_name, pending)
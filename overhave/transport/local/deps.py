@@ -0,0 +1,14 @@
+from functools import cache
+
+from overhave.transport.local.broker import LocalStreamBroker
+from overhave.transport.local.settings import OverhaveLocalTransportSettings
+
+
+@cache
+def get_local_transport_settings() -> OverhaveLocalTransportSettings:
+    return OverhaveLocalTransportSettings()
+
+
+@cache
+def get_local_broker() -> LocalStreamBroker:
+    return LocalStreamBroker(settings=get_local_transport_settings())
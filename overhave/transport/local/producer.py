@@ -0,0 +1,52 @@
+import logging
+from collections import Counter
+from typing import Sequence
+
+from overhave.metrics import BaseOverhaveMetricContainer
+from overhave.transport.base import ITaskProducer
+from overhave.transport.local.broker import LocalStreamBroker
+from overhave.transport.objects import BaseRedisTask, RedisStream
+from overhave.transport.settings import BaseStreamSettings
+
+logger = logging.getLogger(__name__)
+
+
+class LocalProducer(ITaskProducer):
+    """Class for producing tasks into streams of :class:`LocalStreamBroker`.
+
+    Streams are specified by ```mapping``` in the same way as for :class:`RedisProducer`.
+    """
+
+    def __init__(
+        self,
+        settings: BaseStreamSettings,
+        mapping: dict[type[BaseRedisTask], RedisStream],
+        broker: LocalStreamBroker,
+        metric_container: BaseOverhaveMetricContainer,
+    ):
+        self._settings = settings
+        self._mapping = mapping
+        self._broker = broker
+        self._metric_container = metric_container
+
+    def _get_stream_key(self, task: BaseRedisTask) -> str:
+        return f"{self._mapping[type(task)]}{task.stream_postfix}"
+
+    def add_task(self, task: BaseRedisTask) -> bool:
+        return self.add_tasks([task])[0]
+
+    def add_tasks(self, tasks: Sequence[BaseRedisTask]) -> list[bool]:
+        if not tasks:
+            return []
+        try:
+            self._broker.add_many(
+                [(self._get_stream_key(task), task.get_message(self._settings.message_format)) for task in tasks]
+            )
+        except Exception:
+            logger.exception("Could not add %s tasks to local transport!", len(tasks))
+            return [False] * len(tasks)
+        produced = Counter(self._mapping[type(task)].value for task in tasks)
+        for task_type, count in produced.items():
+            self._metric_container.produce_redis_task(task_type=task_type, count=count)
+        logger.info("Added %s local tasks", len(tasks))
+        return [True] * len(tasks)
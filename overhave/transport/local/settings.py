@@ -0,0 +1,22 @@
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class OverhaveLocalTransportSettings(BaseSettings):
+    """Settings for local transport, which replaces Redis streams on single node.
+
+    Streams are stored in SQLite ```database```, so producers and consumers of different processes
+    on the same node share them. Use `:memory:` for streams inside one process, for example for benchmarks.
+    """
+
+    model_config = SettingsConfigDict(env_prefix="OVERHAVE_LOCAL_TRANSPORT_")
+
+    enabled: bool = False
+    database: str = str(Path(tempfile.gettempdir()) / "overhave-streams.sqlite3")
+    # Interval of polling for new messages while reading is blocked
+    poll_interval: timedelta = timedelta(milliseconds=50)
+    # Timeout of waiting for SQLite database lock, which is held by another process
+    lock_timeout: timedelta = timedelta(seconds=30)
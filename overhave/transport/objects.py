@@ -0,0 +1,227 @@
+import abc
+import enum
+import json
+from typing import Any, ClassVar, TypeVar, get_args
+
+import orjson
+from pydantic.main import BaseModel
+
+
+class RedisStream(enum.StrEnum):
+    """Enum that declares Redis streams."""
+
+    TEST = "test"
+    PUBLICATION = "publication"
+    EMULATION = "emulation"
+
+    @property
+    def with_dunder(self) -> str:
+        return self.value.replace("-", "_")
+
+
+class TestRunPriority(enum.StrEnum):
+    """Enum for priority lanes of test runs.
+
+    Interactive runs are started by users, scheduled and bulk runs are created by API. Every lane is backed
+    by its own Redis stream `test-<priority>`, interactive lane uses the `test` stream itself.
+    """
+
+    __test__ = False
+
+    INTERACTIVE = "interactive"
+    SCHEDULED = "scheduled"
+    BULK = "bulk"
+
+    @property
+    def stream_postfix(self) -> str:
+        if self is TestRunPriority.INTERACTIVE:
+            return ""
+        return f"-{self.value}"
+
+    @classmethod
+    def from_stream_key(cls, stream_key: str | None) -> "TestRunPriority":
+        """Priority of lane, which is backed by stream ```stream_key```."""
+        for priority in cls:
+            if stream_key is not None and priority.stream_postfix and stream_key.endswith(priority.stream_postfix):
+                return priority
+        return cls.INTERACTIVE
+
+
+class RedisMessageFormat(enum.StrEnum):
+    """Enum for formats of Redis stream messages.
+
+    Legacy - JSON of task data in `data` field, task type is resolved by trial validation of declared models.
+    Envelope - versioned envelope with explicit task type in `t` field and orjson-encoded task data in `d` field.
+    """
+
+    LEGACY = "legacy"
+    ENVELOPE = "envelope"
+
+
+class UnsupportedRedisMessageError(ValueError):
+    """Exception for Redis stream message with unknown envelope version or task type."""
+
+
+ENVELOPE_VERSION = b"1"
+
+
+class _IRedisTask(BaseModel, abc.ABC):
+    @property
+    @abc.abstractmethod
+    def message(self) -> dict[bytes, bytes]:
+        pass
+
+
+class BaseRedisTask(_IRedisTask):
+    """Base task for Redis streams."""
+
+    task_type: ClassVar[bytes] = b""
+
+    data: BaseModel
+
+    @property
+    def message(self) -> dict[bytes, bytes]:
+        return {b"v": ENVELOPE_VERSION, b"t": self.task_type, b"d": orjson.dumps(self.data.model_dump())}
+
+    @property
+    def legacy_message(self) -> dict[bytes, bytes]:
+        return {b"data": self.data.model_dump_json().encode("utf-8")}
+
+    def get_message(self, message_format: RedisMessageFormat) -> dict[bytes, bytes]:
+        if message_format is RedisMessageFormat.LEGACY:
+            return self.legacy_message
+        return self.message
+
+    @property
+    def stream_postfix(self) -> str:
+        return ""
+
+
+class TestRunShardData(BaseModel):
+    """Shard of test run, which is run by its own consumer."""
+
+    __test__ = False
+
+    index: int
+    count: int
+
+
+class TestRunData(BaseModel):
+    """Specific data for test run."""
+
+    __test__ = False
+
+    test_run_id: int
+    shard: TestRunShardData | None = None
+
+
+class TestRunTask(BaseRedisTask):
+    """Redis stream task for test run."""
+
+    __test__ = False
+
+    task_type: ClassVar[bytes] = b"test_run"
+
+    data: TestRunData
+    priority: TestRunPriority = TestRunPriority.INTERACTIVE
+
+    @property
+    def stream_postfix(self) -> str:
+        return self.priority.stream_postfix
+
+
+class PublicationData(BaseModel):
+    """Specific data for test run."""
+
+    draft_id: int
+
+
+class PublicationTask(BaseRedisTask):
+    """Redis stream task for test run."""
+
+    task_type: ClassVar[bytes] = b"publication"
+
+    data: PublicationData
+
+
+class EmulationData(BaseModel):
+    """Specific data for emulation run."""
+
+    emulation_run_id: int
+
+
+class EmulationTask(BaseRedisTask):
+    """Redis stream task for emulation run."""
+
+    task_type: ClassVar[bytes] = b"emulation"
+
+    data: EmulationData
+
+
+TRedisTask = TypeVar("TRedisTask", TestRunTask, EmulationTask, PublicationTask, covariant=True)
+AnyRedisTask = TestRunTask | PublicationTask | EmulationTask
+
+_TASK_TYPES: dict[bytes, type[AnyRedisTask]] = {task_cls.task_type: task_cls for task_cls in get_args(AnyRedisTask)}
+
+
+class RedisPendingData(BaseModel):
+    """Class that describes pending data from Redis stream."""
+
+    message_id: str
+    consumer: str
+    time_since_delivered: int
+    times_delivered: int
+
+
+class RedisUnreadData:
+    """Class for unread data from Redis stream."""
+
+    def __init__(self, message_id: bytes, message: dict[bytes, bytes], stream_key: str | None = None) -> None:
+        self.message_id = message_id.decode()
+        self.message = message
+        self.stream_key = stream_key
+
+    @property
+    def is_envelope(self) -> bool:
+        return b"v" in self.message
+
+    @property
+    def decoded_message(self) -> dict[str, Any]:
+        if self.is_envelope:
+            return {"data": orjson.loads(self.message[b"d"])}
+        return {key.decode(): json.loads(value.decode("utf-8")) for key, value in self.message.items()}
+
+    def decode_task(self) -> AnyRedisTask:
+        """Decode task from message.
+
+        Envelope is dispatched straight to the model of its task type, legacy message is parsed
+        with :class:`RedisContainer`. Priority of test run task is not written into message,
+        so it is taken from the lane stream ```stream_key```.
+        """
+        task = self._decode_message()
+        if isinstance(task, TestRunTask):
+            task.priority = TestRunPriority.from_stream_key(self.stream_key)
+        return task
+
+    def _decode_message(self) -> AnyRedisTask:
+        if not self.is_envelope:
+            return RedisContainer(task=self.decoded_message).task
+        if self.message[b"v"] != ENVELOPE_VERSION:
+            raise UnsupportedRedisMessageError(f"Unsupported envelope version {self.message[b'v']!r}!")
+        task_cls = _TASK_TYPES.get(self.message[b"t"])
+        if task_cls is None:
+            raise UnsupportedRedisMessageError(f"Unsupported task type {self.message[b't']!r}!")
+        data_cls: type[BaseModel] = task_cls.model_fields["data"].annotation  # type: ignore[assignment]
+        return task_cls(data=data_cls.model_validate_json(self.message[b"d"]))
+
+    def __str__(self) -> str:
+        return f"{RedisUnreadData.__name__}(id={self.message_id}, message='{self.message}')"
+
+
+class RedisContainer(BaseModel):
+    """Class for parsing instance of :class:`RedisUnreadData` from Redis stream.
+
+    ```task``` will be parsed to one of declared models.
+    """
+
+    task: AnyRedisTask
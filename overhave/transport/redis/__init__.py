@@ -1,17 +1,10 @@
 # flake8: noqa
+from .admission import RedisAdmissionController, RedisAdmissionDecision
+from .async_runner import AsyncRedisConsumerRunner
 from .consumer import RedisConsumer
-from .objects import (
-    AnyRedisTask,
-    BaseRedisTask,
-    EmulationData,
-    EmulationTask,
-    PublicationData,
-    PublicationTask,
-    RedisStream,
-    TestRunData,
-    TestRunTask,
-    TRedisTask,
-)
+from .lanes import RedisLanesConsumer, WeightedRoundRobin
 from .producer import RedisProducer
 from .runner import RedisConsumerRunner
 from .settings import BaseRedisSettings, OverhaveRedisSentinelSettings, OverhaveRedisSettings
+from .supervisor import RedisConsumerSupervisor
+from .trimmer import RedisStreamTrimmer
@@ -0,0 +1,135 @@
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, NamedTuple, Sequence
+
+import walrus
+
+from overhave.metrics import BaseOverhaveMetricContainer
+from overhave.transport.redis.settings import BaseRedisSettings
+
+logger = logging.getLogger(__name__)
+
+
+class RedisStreamBacklog(NamedTuple):
+    """Backlog of Redis stream: count of entries, which are not processed by the slowest consumer group."""
+
+    lag: int
+    pending: int
+    completed: int | None
+
+    @property
+    def total(self) -> int:
+        return self.lag + self.pending
+
+
+class RedisAdmissionDecision(NamedTuple):
+    """Decision of admission control with estimated seconds to wait before retry of rejected request."""
+
+    admitted: bool
+    backlog: int
+    retry_after: int
+
+
+class _ThroughputSample(NamedTuple):
+    timestamp: float
+    completed: int
+
+
+class RedisAdmissionController:
+    """Class for admission control of new tasks by backlog of Redis ```streams```.
+
+    Backlog is calculated from lag and pending counts of consumer groups (XINFO GROUPS) and cached
+    for ```admission_cache_ttl```. When backlog is above ```admission_max_backlog```, new tasks are rejected
+    with estimation of time, which consumers need to process the excess with throughput
+    observed during ```admission_throughput_window```.
+    """
+
+    def __init__(
+        self,
+        settings: BaseRedisSettings,
+        task_type: str,
+        streams: Sequence[str],
+        database: walrus.Database,
+        metric_container: BaseOverhaveMetricContainer,
+    ) -> None:
+        self._settings = settings
+        self._task_type = task_type
+        self._streams = streams
+        self._database = database
+        self._metric_container = metric_container
+        self._lock = threading.Lock()
+        self._samples: deque[_ThroughputSample] = deque()
+        self._backlog = 0
+        self._throughput: float | None = None
+        self._expires_at = 0.0
+
+    def _get_stream_backlog(self, stream: str) -> RedisStreamBacklog:
+        if not self._database.exists(stream):
+            return RedisStreamBacklog(lag=0, pending=0, completed=0)
+        groups: list[dict[str, Any]] = self._database.xinfo_groups(stream)
+        if not groups:
+            return RedisStreamBacklog(lag=int(self._database.xlen(stream)), pending=0, completed=None)
+        backlogs: list[RedisStreamBacklog] = []
+        for group in groups:
+            lag = group.get("lag")
+            if lag is None:
+                # Lag is unknown for Redis before 7.0 and after deletion of entries, so stream length is used as bound
+                lag = self._database.xlen(stream)
+            completed = None
+            if group.get("entries-read") is not None:
+                completed = int(group["entries-read"]) - int(group["pending"])
+            backlogs.append(RedisStreamBacklog(lag=int(lag), pending=int(group["pending"]), completed=completed))
+        return max(backlogs, key=lambda x: x.total)
+
+    def _observe_throughput(self, completed: int) -> float | None:
+        now = time.monotonic()
+        self._samples.append(_ThroughputSample(timestamp=now, completed=completed))
+        window_seconds = self._settings.admission_throughput_window.total_seconds()
+        while len(self._samples) > 2 and now - self._samples[1].timestamp >= window_seconds:
+            self._samples.popleft()
+        first, last = self._samples[0], self._samples[-1]
+        if last.timestamp <= first.timestamp or last.completed <= first.completed:
+            return None
+        return (last.completed - first.completed) / (last.timestamp - first.timestamp)
+
+    def _refresh(self) -> None:
+        backlog = 0
+        completed: int | None = 0
+        for stream in self._streams:
+            stream_backlog = self._get_stream_backlog(stream)
+            self._metric_container.observe_redis_backlog(task_type=stream, backlog=stream_backlog.total)
+            backlog += stream_backlog.total
+            if completed is None or stream_backlog.completed is None:
+                completed = None
+                continue
+            completed += stream_backlog.completed
+        self._backlog = backlog
+        self._throughput = None
+        if completed is not None:
+            self._throughput = self._observe_throughput(completed)
+        self._expires_at = time.monotonic() + self._settings.admission_cache_ttl.total_seconds()
+
+    def _get_retry_after(self, excess: int) -> int:
+        if self._throughput is None:
+            return int(self._settings.admission_default_retry_after.total_seconds())
+        return max(math.ceil(excess / self._throughput), 1)
+
+    def check(self, count: int = 1) -> RedisAdmissionDecision:
+        """Check backlog of streams and decide whether ```count``` new tasks could be admitted."""
+        max_backlog = self._settings.admission_max_backlog
+        if max_backlog is None:
+            return RedisAdmissionDecision(admitted=True, backlog=0, retry_after=0)
+        with self._lock:
+            if time.monotonic() >= self._expires_at:
+                self._refresh()
+            backlog = self._backlog
+        self._metric_container.observe_redis_backlog_threshold(task_type=self._task_type, threshold=max_backlog)
+        if backlog <= max_backlog:
+            return RedisAdmissionDecision(admitted=True, backlog=backlog, retry_after=0)
+        retry_after = self._get_retry_after(backlog - max_backlog)
+        self._metric_container.reject_redis_tasks(task_type=self._task_type, count=count)
+        logger.warning("Backlog of %s tasks is %s, retry after %s seconds", self._task_type, backlog, retry_after)
+        return RedisAdmissionDecision(admitted=False, backlog=backlog, retry_after=retry_after)
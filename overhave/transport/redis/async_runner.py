@@ -0,0 +1,248 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Sequence
+
+import redis
+from redis import asyncio as aioredis
+
+from overhave.metrics import BaseOverhaveMetricContainer
+from overhave.transport.objects import AnyRedisTask, RedisStream, RedisUnreadData
+from overhave.transport.redis.lanes import WeightedRoundRobin
+from overhave.transport.redis.reclaim import RECLAIM_START_ID, DeadLetter, get_claimed_messages, split_reclaimed
+from overhave.transport.redis.runner import RedisConsumerRunnerException
+from overhave.transport.redis.settings import BaseRedisSettings
+
+logger = logging.getLogger(__name__)
+
+_StreamMessage = tuple[RedisStream, RedisUnreadData]
+
+
+class AsyncRedisConsumerRunner:
+    """Class for running tasks specified by ```mapping``` from several Redis streams in one asyncio event loop.
+
+    Every consumer group is read by one coroutine: with ```multiplexed_group``` all streams are read with single
+    XREADGROUP call, otherwise every stream is read from its own `cg-<stream>` group. Number of tasks in flight
+    is limited per stream by ```concurrency``` settings, streams without free slots are not read. Priority lanes
+    of stream are polled without blocking in weighted round-robin order before blocking read.
+    Handlers are blocking, so they are offloaded to the thread pool executor. Specified ```concurrency```
+    of streams overrides concurrency settings.
+    """
+
+    def __init__(
+        self,
+        settings: BaseRedisSettings,
+        streams: Sequence[RedisStream],
+        redis: aioredis.Redis,
+        mapping: dict[type[AnyRedisTask], Callable[[AnyRedisTask], None]],
+        metric_container: BaseOverhaveMetricContainer,
+        concurrency: dict[RedisStream, int] | None = None,
+    ) -> None:
+        self._settings = settings
+        self._redis = redis
+        self._mapping = mapping
+        self._metric_container = metric_container
+        self._consumer_name = settings.get_consumer_name()
+        concurrency = concurrency or {}
+        self._free_slots = {
+            stream: max(concurrency.get(stream, settings.get_concurrency(stream)), 1) for stream in streams
+        }
+        self._lane_weights = {stream: settings.get_lane_weights(stream) for stream in streams}
+        self._lane_streams = {
+            stream_key: stream for stream, lane_weights in self._lane_weights.items() for stream_key in lane_weights
+        }
+        self._round_robins = {
+            stream: WeightedRoundRobin(lane_weights)
+            for stream, lane_weights in self._lane_weights.items()
+            if len(lane_weights) > 1
+        }
+        self._last_reclaim_time: dict[str, float] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def _groups(self) -> dict[str, list[RedisStream]]:
+        if self._settings.multiplexed_group is not None:
+            return {self._settings.multiplexed_group: list(self._free_slots)}
+        return {f"cg-{stream}": [stream] for stream in self._free_slots}
+
+    def run(self) -> None:
+        try:
+            with ThreadPoolExecutor(
+                max_workers=sum(self._free_slots.values()), thread_name_prefix="async-consumer"
+            ) as executor:
+                asyncio.run(self._run(executor))
+        except Exception as e:
+            raise RedisConsumerRunnerException from e
+
+        logger.info("Shutdown event reached")
+
+    async def _run(self, executor: ThreadPoolExecutor) -> None:
+        condition = asyncio.Condition()
+        try:
+            for group, streams in self._groups.items():
+                await self._create_group(group, streams)
+            async with asyncio.TaskGroup() as task_group:
+                for group, streams in self._groups.items():
+                    task_group.create_task(self._consume_group(group, streams, condition, executor))
+        finally:
+            if self._tasks:
+                logger.info("Waiting for %s tasks in flight...", len(self._tasks))
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+            await self._redis.aclose()
+
+    async def _create_group(self, group: str, streams: Sequence[RedisStream]) -> None:
+        for stream_key in (stream_key for stream in streams for stream_key in self._lane_weights[stream]):
+            try:
+                await self._redis.xgroup_create(stream_key, group, mkstream=True)
+            except redis.exceptions.ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+        logger.info("Starting consuming from %s as %s of group %s...", streams, self._consumer_name, group)
+
+    async def _wait_free_streams(
+        self, streams: Sequence[RedisStream], condition: asyncio.Condition
+    ) -> list[RedisStream]:
+        async with condition:
+            await condition.wait_for(lambda: any(self._free_slots[stream] > 0 for stream in streams))
+        return [stream for stream in streams if self._free_slots[stream] > 0]
+
+    async def _consume_group(
+        self,
+        group: str,
+        streams: Sequence[RedisStream],
+        condition: asyncio.Condition,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        while True:
+            free_streams = await self._wait_free_streams(streams, condition)
+            count = min(self._settings.read_count, *(self._free_slots[stream] for stream in free_streams))
+            messages = await self._read(group, free_streams, count)
+            for stream, data in messages:
+                self._free_slots[stream] -= 1
+                task = asyncio.create_task(self._process(group, stream, data, condition, executor))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    def _reclaim_required(self, group: str) -> bool:
+        last_reclaim_time = self._last_reclaim_time.get(group)
+        if last_reclaim_time is None:
+            return True
+        return time.monotonic() - last_reclaim_time >= self._settings.reclaim_interval.total_seconds()
+
+    async def _read_streams(
+        self, group: str, stream_keys: Sequence[str], count: int, block: bool
+    ) -> list[_StreamMessage]:
+        block_milliseconds: int | None = None
+        if block:
+            block_milliseconds = self._settings.timeout_milliseconds
+        response: list[Any] = await self._redis.xreadgroup(
+            group,
+            self._consumer_name,
+            dict.fromkeys(stream_keys, ">"),
+            count=count,
+            block=block_milliseconds,
+        )
+        messages: list[_StreamMessage] = []
+        for stream_key, stream_messages in response or []:
+            stream_key = stream_key.decode()
+            stream = self._lane_streams[stream_key]
+            objects = [RedisUnreadData(msg[0], msg[1], stream_key=stream_key) for msg in stream_messages]
+            if not objects:
+                continue
+            logger.debug("Has %s messages from %s", len(objects), stream_key)
+            if not self._settings.ack_after_processing:
+                await self._redis.xack(stream_key, group, *(data.message_id for data in objects))
+            self._metric_container.consume_redis_task(task_type=stream.value, count=len(objects))
+            messages.extend((stream, data) for data in objects)
+        return messages
+
+    async def _read_lanes(self, group: str, streams: Sequence[RedisStream], count: int) -> list[_StreamMessage]:
+        messages: list[_StreamMessage] = []
+        for stream in streams:
+            round_robin = self._round_robins.get(stream)
+            if round_robin is None:
+                continue
+            for stream_key in round_robin.order():
+                lane_messages = await self._read_streams(group, [stream_key], count, block=False)
+                if lane_messages:
+                    messages.extend(lane_messages)
+                    break
+        return messages
+
+    async def _read(self, group: str, streams: Sequence[RedisStream], count: int) -> list[_StreamMessage]:
+        messages: list[_StreamMessage] = []
+        if self._settings.ack_after_processing and self._reclaim_required(group):
+            self._last_reclaim_time[group] = time.monotonic()
+            for stream in streams:
+                remaining = count
+                for stream_key in self._lane_weights[stream]:
+                    if remaining <= 0:
+                        break
+                    reclaimed = await self._reclaim(group, stream, stream_key, remaining)
+                    remaining -= len(reclaimed)
+                    messages.extend(reclaimed)
+            if messages:
+                return messages
+        messages = await self._read_lanes(group, streams, count)
+        if not messages:
+            return await self._read_streams(group, [stream.value for stream in streams], count, block=True)
+        other_stream_keys = [stream.value for stream in streams if stream not in self._round_robins]
+        if other_stream_keys:
+            messages.extend(await self._read_streams(group, other_stream_keys, count, block=False))
+        return messages
+
+    async def _reclaim(self, group: str, stream: RedisStream, stream_key: str, count: int) -> list[_StreamMessage]:
+        response: list[Any] = await self._redis.xautoclaim(
+            stream_key,
+            group,
+            self._consumer_name,
+            min_idle_time=self._settings.reclaim_idle_milliseconds,
+            start_id=RECLAIM_START_ID,
+            count=count,
+        )
+        claimed = get_claimed_messages(response, stream_key=stream_key)
+        if not claimed:
+            return []
+        reclaimed = split_reclaimed(
+            settings=self._settings,
+            claimed=claimed,
+            pending_messages=await self._redis.xpending_range(
+                stream_key,
+                group,
+                min=claimed[0].message_id,
+                max=claimed[-1].message_id,
+                count=len(claimed),
+                consumername=self._consumer_name,
+            ),
+        )
+        for dead_letter in reclaimed.dead_letters:
+            await self._move_to_dead_letter(group, stream, dead_letter)
+        return [(stream, data) for data in reclaimed.messages]
+
+    async def _move_to_dead_letter(self, group: str, stream: RedisStream, dead_letter: DeadLetter) -> None:
+        await self._redis.xadd(dead_letter.stream_key, dead_letter.data.message)  # type: ignore[arg-type]
+        await self._redis.xack(dead_letter.data.stream_key or stream, group, dead_letter.data.message_id)
+        self._metric_container.dead_letter_redis_task(task_type=stream.value)
+
+    async def _process(
+        self,
+        group: str,
+        stream: RedisStream,
+        data: RedisUnreadData,
+        condition: asyncio.Condition,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        try:
+            task = data.decode_task()
+            logger.info("Gotten ready for %s BaseRedisTask: %s", stream, task)
+            await asyncio.get_running_loop().run_in_executor(executor, self._mapping[type(task)], task)
+            if self._settings.ack_after_processing:
+                await self._redis.xack(data.stream_key or stream, group, data.message_id)
+                logger.debug("Acknowledged message %s", data.message_id)
+        except Exception:
+            logger.exception("Error while processing message %s!", data)
+        finally:
+            async with condition:
+                self._free_slots[stream] += 1
+                condition.notify_all()
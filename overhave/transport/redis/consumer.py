@@ -1,18 +1,29 @@
 import logging
+import time
+from functools import cached_property
 from types import TracebackType
-from typing import Iterator, Sequence
+from typing import Any, Sequence, cast
 
+import redis
 import walrus
 
 from overhave.metrics import BaseOverhaveMetricContainer
-from overhave.transport.redis.objects import RedisPendingData, RedisStream, RedisUnreadData
+from overhave.transport.base import ITaskConsumer
+from overhave.transport.objects import RedisPendingData, RedisStream, RedisUnreadData
+from overhave.transport.redis.reclaim import RECLAIM_START_ID, DeadLetter, get_claimed_messages, split_reclaimed
 from overhave.transport.redis.settings import BaseRedisSettings
 
 logger = logging.getLogger(__name__)
 
 
-class RedisConsumer:
-    """Class for consuming tasks from Redis stream ```stream_name```."""
+class RedisConsumer(ITaskConsumer):
+    """Class for consuming tasks from Redis stream ```stream_name```.
+
+    Consumer reads Redis stream ```stream_key``` (```stream_name``` by default, or one of the stream lanes)
+    as unique named member of `cg-<stream>` consumer group. In `at_least_once` delivery mode
+    messages are acknowledged after processing, pending messages of crashed consumers are reclaimed with XAUTOCLAIM
+    and messages with exceeded ```max_deliveries``` are moved to the dead-letter stream.
+    """
 
     def __init__(
         self,
@@ -20,21 +31,28 @@ class RedisConsumer:
         stream_name: RedisStream,
         database: walrus.Database,
         metric_container: BaseOverhaveMetricContainer,
+        stream_key: str | None = None,
     ):
         self._settings = settings
         self._stream_name = stream_name
+        self._stream_key = stream_key or stream_name.value
         self._database = database
         self._metric_container = metric_container
+        self._consumer_name = settings.get_consumer_name()
+        self._reclaim_cursor = RECLAIM_START_ID
+        self._last_reclaim_time: float | None = None
 
-    @property
+    @cached_property
     def _consumer_group(self) -> walrus.ConsumerGroup:
-        consumer_group = self._database.consumer_group(f"cg-{self._stream_name}", (self._stream_name,))
+        consumer_group = self._database.consumer_group(
+            f"cg-{self._stream_name}", (self._stream_key,), consumer=self._consumer_name
+        )
         consumer_group.create()
         return consumer_group
 
     @property
     def _stream(self) -> walrus.containers.ConsumerGroupStream:
-        return getattr(self._consumer_group, self._stream_name.with_dunder)
+        return cast(walrus.containers.ConsumerGroupStream, self._consumer_group.streams[self._stream_key])
 
     def _clean_pending(self) -> None:
         pending_messages = self._stream.pending()
@@ -43,35 +61,109 @@ class RedisConsumer:
             message_ids = [x.message_id for x in models]
             self._stream.claim(*message_ids)
             self._stream.ack(*message_ids)
-            logger.info("Clean all pending messages for stream %s: %s", self._stream_name, models)
+            logger.info("Clean all pending messages for stream %s: %s", self._stream_key, models)
+
+    @property
+    def stream_name(self) -> RedisStream:
+        return self._stream_name
+
+    @property
+    def stream_key(self) -> str:
+        return self._stream_key
+
+    @property
+    def consumer_name(self) -> str:
+        return self._consumer_name
 
-    def _consume(self) -> Sequence[RedisUnreadData]:
-        messages = self._stream.read(count=self._settings.read_count, block=self._settings.timeout_milliseconds)
+    @property
+    def batch_size(self) -> int:
+        return self._settings.read_count
+
+    def _reclaim_required(self) -> bool:
+        if self._reclaim_cursor != RECLAIM_START_ID or self._last_reclaim_time is None:
+            return True
+        return time.monotonic() - self._last_reclaim_time >= self._settings.reclaim_interval.total_seconds()
+
+    def _move_to_dead_letter(self, dead_letter: DeadLetter) -> None:
+        self._database.xadd(dead_letter.stream_key, dead_letter.data.message)
+        self._stream.ack(dead_letter.data.message_id)
+        self._metric_container.dead_letter_redis_task(task_type=self._stream_name.value)
+
+    def _reclaim(self, count: int) -> list[RedisUnreadData]:
+        response: list[Any] = self._stream.autoclaim(
+            self._consumer_name,
+            min_idle_time=self._settings.reclaim_idle_milliseconds,
+            start_id=self._reclaim_cursor,
+            count=count,
+        )
+        next_id = response[0]
+        if isinstance(next_id, bytes):
+            next_id = next_id.decode()
+        self._reclaim_cursor = str(next_id)
+        if self._reclaim_cursor == RECLAIM_START_ID:
+            self._last_reclaim_time = time.monotonic()
+        claimed = get_claimed_messages(response, stream_key=self._stream_key)
+        if not claimed:
+            return []
+        reclaimed = split_reclaimed(
+            settings=self._settings,
+            claimed=claimed,
+            pending_messages=self._stream.pending(
+                start=claimed[0].message_id,
+                stop=claimed[-1].message_id,
+                count=len(claimed),
+                consumer=self._consumer_name,
+            ),
+        )
+        for dead_letter in reclaimed.dead_letters:
+            self._move_to_dead_letter(dead_letter)
+        return reclaimed.messages
+
+    def _consume(self, count: int | None = None, block: bool = True) -> Sequence[RedisUnreadData]:
+        count = count or self._settings.read_count
+        if self._settings.ack_after_processing and self._reclaim_required():
+            reclaimed = self._reclaim(count)
+            if reclaimed:
+                return reclaimed
+        block_milliseconds: int | None = None
+        if block:
+            block_milliseconds = self._settings.timeout_milliseconds
+        messages = self._stream.read(count=count, block=block_milliseconds)
         objects: list[RedisUnreadData] = []
         for msg in messages:
-            data = RedisUnreadData(*msg)
+            data = RedisUnreadData(msg[0], msg[1], stream_key=self._stream_key)
             logger.debug("Message from redis: %s", data)
-            self._stream.ack(data.message_id)
+            if not self._settings.ack_after_processing:
+                self._stream.ack(data.message_id)
             objects.append(data)
         return objects
 
+    def acknowledge(self, data: RedisUnreadData) -> None:
+        """Acknowledge successfully processed message in `at_least_once` delivery mode."""
+        if not self._settings.ack_after_processing:
+            return
+        self._stream.ack(data.message_id)
+        logger.debug("Acknowledged message %s", data.message_id)
+
     def __enter__(self) -> None:
-        logger.info("Starting consuming from %s...", self._stream_name)
-        self._clean_pending()
-
-    def __iter__(self) -> Iterator[Sequence[RedisUnreadData]]:
-        while True:
-            try:
-                logger.debug("Check messages...")
-                messages = self._consume()
-                if messages:
-                    logger.debug("Has messages, return them")
-                    self._metric_container.consume_redis_task(task_type=self._stream_name.value)
-                    yield messages
-                continue
-            except Exception:
-                logger.exception("Error while trying to consume message from redis!")
-            raise StopIteration()
+        logger.info("Starting consuming from %s as %s...", self._stream_key, self._consumer_name)
+        if not self._settings.ack_after_processing:
+            self._clean_pending()
+
+    def read(self, count: int | None = None, block: bool = True) -> Sequence[RedisUnreadData]:
+        """Read not more than ```count``` messages (```read_count``` by default) with optional blocking timeout."""
+        logger.debug("Check messages...")
+        messages = self._consume(count, block=block)
+        if messages:
+            logger.debug("Has %s messages, return them", len(messages))
+            self._metric_container.consume_redis_task(task_type=self._stream_name.value, count=len(messages))
+        return messages
 
     def __exit__(self, exc_type: type[Exception], exc_val: Exception, exc_tb: TracebackType) -> None:
-        pass  # no actions on exit required
+        try:
+            if self._stream.pending(count=1, consumer=self._consumer_name):
+                return  # pending messages will be reclaimed by another consumers
+            self._stream.delete_consumer()
+            logger.info("Consumer %s removed from group of stream %s", self._consumer_name, self._stream_key)
+        except redis.exceptions.RedisError:
+            logger.exception("Could not remove consumer %s from group!", self._consumer_name)
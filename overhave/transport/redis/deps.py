@@ -3,6 +3,7 @@ from functools import cache
 from typing import cast
 
 from redis import Redis
+from redis import asyncio as aioredis
 from redis.sentinel import Sentinel
 
 from overhave.transport.redis.settings import BaseRedisSettings, OverhaveRedisSentinelSettings, OverhaveRedisSettings
@@ -35,6 +36,33 @@ def make_redis(redis_settings: BaseRedisSettings) -> Redis:
     raise RuntimeError("redis_settings is not any instance of OverhaveRedisSentinelSettings, OverhaveRedisSettings")
 
 
+def make_async_redis(redis_settings: BaseRedisSettings) -> aioredis.Redis:
+    if isinstance(redis_settings, OverhaveRedisSentinelSettings):
+        logger.info("Connecting to redis through sentinel %s", redis_settings.urls)
+        url_tuples = [
+            (url.host, url.port) for url in redis_settings.urls if url.host is not None and url.port is not None
+        ]
+        sentinel = aioredis.sentinel.Sentinel(
+            url_tuples, socket_timeout=redis_settings.socket_timeout.total_seconds(), retry_on_timeout=True
+        )
+        return cast(
+            aioredis.Redis,
+            sentinel.master_for(redis_settings.master_set, password=redis_settings.password, db=redis_settings.db),
+        )
+
+    if isinstance(redis_settings, OverhaveRedisSettings):
+        return cast(
+            aioredis.Redis,
+            aioredis.Redis.from_url(
+                redis_settings.url.human_repr(),
+                db=redis_settings.db,
+                socket_timeout=redis_settings.socket_timeout.total_seconds(),
+            ),
+        )
+
+    raise RuntimeError("redis_settings is not any instance of OverhaveRedisSentinelSettings, OverhaveRedisSettings")
+
+
 @cache
 def get_redis_settings() -> BaseRedisSettings:
     sentinel_settings = OverhaveRedisSentinelSettings()
@@ -0,0 +1,78 @@
+from contextlib import ExitStack
+from types import TracebackType
+from typing import Generic, Sequence, TypeVar
+
+from overhave.transport.base import ITaskConsumer
+from overhave.transport.objects import RedisStream, RedisUnreadData
+
+TLane = TypeVar("TLane")
+
+
+class WeightedRoundRobin(Generic[TLane]):
+    """Smooth weighted round-robin order of ```lanes```, which are declared in order of priority.
+
+    Every call of :meth:`order` returns lanes starting with the selected one, other lanes follow in order
+    of priority. Lanes are selected in proportion to their weights without bursts.
+    """
+
+    def __init__(self, lanes: dict[TLane, int]) -> None:
+        self._weights = {lane: max(weight, 1) for lane, weight in lanes.items()}
+        self._total_weight = sum(self._weights.values())
+        self._current_weights = dict.fromkeys(self._weights, 0)
+
+    def order(self) -> list[TLane]:
+        for lane, weight in self._weights.items():
+            self._current_weights[lane] += weight
+        selected = max(self._current_weights, key=lambda x: self._current_weights[x])
+        self._current_weights[selected] -= self._total_weight
+        return [selected, *(lane for lane in self._weights if lane != selected)]
+
+
+class RedisLanesConsumer(ITaskConsumer):
+    """Class for weighted fair consuming of tasks from priority lanes of Redis stream.
+
+    Every lane is read by its own consumer from ```consumers```, which are declared
+    in order of priority. Lanes are polled without blocking in weighted round-robin order, so lower lanes get
+    their share of reads even while higher lanes are busy. When all lanes are empty, reading blocks on
+    the highest priority lane.
+    """
+
+    def __init__(self, consumers: Sequence[ITaskConsumer], weights: Sequence[int]) -> None:
+        self._consumers = {consumer.stream_key: consumer for consumer in consumers}
+        self._primary_consumer = consumers[0]
+        self._round_robin = WeightedRoundRobin(dict(zip(self._consumers, weights)))
+        self._exit_stack = ExitStack()
+
+    @property
+    def stream_name(self) -> RedisStream:
+        return self._primary_consumer.stream_name
+
+    @property
+    def stream_key(self) -> str:
+        return self._primary_consumer.stream_key
+
+    @property
+    def batch_size(self) -> int:
+        return self._primary_consumer.batch_size
+
+    def read(self, count: int | None = None, block: bool = True) -> Sequence[RedisUnreadData]:
+        for stream_key in self._round_robin.order():
+            messages = self._consumers[stream_key].read(count, block=False)
+            if messages:
+                return messages
+        if not block:
+            return []
+        return self._primary_consumer.read(count)
+
+    def acknowledge(self, data: RedisUnreadData) -> None:
+        consumer = self._primary_consumer
+        if data.stream_key is not None:
+            consumer = self._consumers[data.stream_key]
+        consumer.acknowledge(data)
+
+    def __enter__(self) -> None:
+        for consumer in self._consumers.values():
+            self._exit_stack.enter_context(consumer)  # type: ignore[arg-type]
+
+    def __exit__(self, exc_type: type[Exception], exc_val: Exception, exc_tb: TracebackType) -> None:
+        self._exit_stack.close()
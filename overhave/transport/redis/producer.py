@@ -1,19 +1,23 @@
 import logging
+from collections import Counter
+from typing import Sequence
 
 import redis
 import walrus
 
 from overhave.metrics import BaseOverhaveMetricContainer
-from overhave.transport.redis.objects import BaseRedisTask, RedisStream
+from overhave.transport.base import ITaskProducer
+from overhave.transport.objects import BaseRedisTask, RedisStream
 from overhave.transport.redis.settings import BaseRedisSettings
 
 logger = logging.getLogger(__name__)
 
 
-class RedisProducer:
+class RedisProducer(ITaskProducer):
     """Class for producing tasks.
 
-    Producer send tasks into Redis stream specified by ```mapping``.
+    Producer send tasks into Redis stream specified by ```mapping``, or into the lane of this stream
+    according to the task ```stream_postfix```.
     """
 
     def __init__(
@@ -24,17 +28,39 @@ class RedisProducer:
         metric_container: BaseOverhaveMetricContainer,
     ):
         self._settings = settings
-        self._streams = {task: database.Stream(stream.value) for task, stream in mapping.items()}
+        self._database = database
         self._mapping = mapping
         self._metric_container = metric_container
 
+    def _get_stream_key(self, task: BaseRedisTask) -> str:
+        return f"{self._mapping[type(task)]}{task.stream_postfix}"
+
     def add_task(self, task: BaseRedisTask) -> bool:
-        stream = self._streams[type(task)]
+        stream = self._database.Stream(self._get_stream_key(task))
         logger.info("Added Redis task %s", task)
         try:
-            stream.add(task.message)
+            stream.add(task.get_message(self._settings.message_format))
             self._metric_container.produce_redis_task(task_type=self._mapping[type(task)].value)
             return True
         except redis.exceptions.ConnectionError:
             logger.exception("Could not add %s to Redis!", type(task).__name__)
             return False
+
+    def add_tasks(self, tasks: Sequence[BaseRedisTask]) -> list[bool]:
+        """Add ```tasks``` with one pipeline round trip and return sending result for each of them."""
+        if not tasks:
+            return []
+        pipeline = self._database.pipeline(transaction=False)
+        for task in tasks:
+            pipeline.xadd(self._get_stream_key(task), task.get_message(self._settings.message_format))
+        try:
+            results = pipeline.execute(raise_on_error=False)
+        except redis.exceptions.ConnectionError:
+            logger.exception("Could not add %s tasks to Redis!", len(tasks))
+            return [False] * len(tasks)
+        statuses = [not isinstance(result, Exception) for result in results]
+        produced = Counter(self._mapping[type(task)].value for task, added in zip(tasks, statuses) if added)
+        for task_type, count in produced.items():
+            self._metric_container.produce_redis_task(task_type=task_type, count=count)
+        logger.info("Added %s of %s Redis tasks", produced.total(), len(tasks))
+        return statuses
@@ -0,0 +1,56 @@
+import logging
+from typing import Any, Iterable, NamedTuple, Sequence
+
+from overhave.transport.objects import RedisPendingData, RedisUnreadData
+from overhave.transport.redis.settings import BaseRedisSettings
+
+logger = logging.getLogger(__name__)
+
+RECLAIM_START_ID = "0-0"
+
+
+class DeadLetter(NamedTuple):
+    """Reclaimed message with exceeded ```max_deliveries```, which should be moved to ```stream_key```."""
+
+    data: RedisUnreadData
+    pending: RedisPendingData
+    stream_key: str
+
+
+class ReclaimedMessages(NamedTuple):
+    """Messages reclaimed with XAUTOCLAIM, which are split into messages to process and dead letters."""
+
+    messages: list[RedisUnreadData]
+    dead_letters: list[DeadLetter]
+
+
+def get_claimed_messages(response: Sequence[Any], stream_key: str) -> list[RedisUnreadData]:
+    """Get messages from XAUTOCLAIM response, messages deleted from stream are skipped."""
+    return [RedisUnreadData(msg[0], msg[1], stream_key=stream_key) for msg in response[1] if msg[1] is not None]
+
+
+def split_reclaimed(
+    settings: BaseRedisSettings, claimed: Sequence[RedisUnreadData], pending_messages: Iterable[Any]
+) -> ReclaimedMessages:
+    """Split claimed messages by deliveries count from XPENDING entries of their range."""
+    pending_models = {
+        model.message_id: model for model in (RedisPendingData.model_validate(msg) for msg in pending_messages)
+    }
+    reclaimed = ReclaimedMessages(messages=[], dead_letters=[])
+    for data in claimed:
+        pending = pending_models.get(data.message_id)
+        if pending is not None and pending.times_delivered > settings.max_deliveries:
+            dead_letter = DeadLetter(
+                data=data, pending=pending, stream_key=f"{data.stream_key}{settings.dead_letter_postfix}"
+            )
+            logger.error(
+                "Message %s has been delivered %s times, move it to stream %s",
+                data.message_id,
+                pending.times_delivered,
+                dead_letter.stream_key,
+            )
+            reclaimed.dead_letters.append(dead_letter)
+            continue
+        logger.info("Reclaimed pending message %s", data)
+        reclaimed.messages.append(data)
+    return reclaimed
@@ -1,8 +1,11 @@
 import logging
-from typing import Callable
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Sequence
 
-from overhave.transport.redis.consumer import RedisConsumer
-from overhave.transport.redis.objects import AnyRedisTask, RedisContainer, RedisUnreadData
+from overhave.transport.base import ITaskConsumer
+from overhave.transport.objects import AnyRedisTask, RedisUnreadData
+from overhave.utils import get_current_rss
 
 logger = logging.getLogger(__name__)
 
@@ -16,30 +19,146 @@ class RedisConsumerRunnerException(Exception):
 class RedisConsumerRunner:
     """Class for running tasks specified by ```mapping```.
 
-    Runner tasks launch with instance of :class:`RedisConsumer` ```consumer```.
+    Runner tasks launch with ```consumer```, for example :class:`RedisConsumer` or :class:`RedisLanesConsumer`.
+    When ```concurrency``` is greater than 1, runner reads batches of messages and dispatches them
+    to the bounded pool of workers. New messages are not read while all workers are busy.
+    Otherwise, when ```batch_size``` is greater than 1, runner reads batches of messages and passes tasks
+    of types from ```batch_mapping``` to their handlers all at once.
+
+    Runner stops reading of new messages after ```max_tasks``` consumed tasks or when resident set size
+    of process exceeds ```max_rss``` bytes: already read messages are processed and :meth:`run` returns,
+    so process could be recycled by its supervisor.
     """
 
     def __init__(
-        self, consumer: RedisConsumer, mapping: dict[type[AnyRedisTask], Callable[[AnyRedisTask], None]]
+        self,
+        consumer: ITaskConsumer,
+        mapping: dict[type[AnyRedisTask], Callable[[AnyRedisTask], None]],
+        concurrency: int = 1,
+        batch_mapping: dict[type[AnyRedisTask], Callable[[Sequence[AnyRedisTask]], None]] | None = None,
+        batch_size: int = 1,
+        max_tasks: int | None = None,
+        max_rss: int | None = None,
     ) -> None:
         self._consumer = consumer
         self._mapping = mapping
+        self._concurrency = max(concurrency, 1)
+        self._batch_mapping = batch_mapping or {}
+        self._batch_size = max(batch_size, 1)
+        self._max_tasks = max_tasks
+        self._max_rss = max_rss
+        self._consumed_tasks = 0
 
     def run(self) -> None:
         try:
-            self._run()
+            if self._concurrency > 1:
+                self._run_concurrently()
+            elif self._batch_mapping and self._batch_size > 1:
+                self._run_batched()
+            else:
+                self._run()
         except Exception as e:
             raise RedisConsumerRunnerException from e
 
         logger.info("Shutdown event reached")
 
+    @property
+    def consumed_tasks(self) -> int:
+        return self._consumed_tasks
+
+    def _count_consumed(self, count: int) -> None:
+        self._consumed_tasks += count
+
+    def _recycling_required(self) -> bool:
+        if self._max_tasks is not None and self._consumed_tasks >= self._max_tasks:
+            logger.info("Consumer has consumed %s tasks, so it should be recycled", self._consumed_tasks)
+            return True
+        if self._max_rss is not None and (rss := get_current_rss()) >= self._max_rss:
+            logger.info("Consumer resident set size %s bytes exceeds limit, so it should be recycled", rss)
+            return True
+        return False
+
     def _run(self) -> None:
         with self._consumer:
             for message_sequence in self._consumer:
+                self._count_consumed(len(message_sequence))
                 for msg in message_sequence:
                     self._process(msg)
+                if self._recycling_required():
+                    return
+
+    def _run_batched(self) -> None:
+        logger.info("Run consumer with batches of %s tasks", self._batch_size)
+        with self._consumer:
+            while not self._recycling_required():
+                messages = self._consumer.read(count=self._batch_size)
+                self._count_consumed(len(messages))
+                self._process_batch(messages)
+
+    def _process_batch(self, messages: Sequence[RedisUnreadData]) -> None:
+        batches: dict[type[AnyRedisTask], list[tuple[AnyRedisTask, RedisUnreadData]]] = {}
+        for data in messages:
+            task = data.decode_task()
+            if type(task) in self._batch_mapping:
+                batches.setdefault(type(task), []).append((task, data))
+                continue
+            self._handle(task, data)
+        for task_type, items in batches.items():
+            logger.info("Gotten ready for test_execution batch of %s tasks: %s", len(items), task_type.__name__)
+            self._batch_mapping[task_type]([task for task, _ in items])
+            for _, data in items:
+                self._consumer.acknowledge(data)
+
+    @staticmethod
+    def _acquire_slots(slots: threading.BoundedSemaphore, limit: int) -> int:
+        slots.acquire()
+        acquired = 1
+        while acquired < limit and slots.acquire(blocking=False):
+            acquired += 1
+        return acquired
+
+    @staticmethod
+    def _release_slots(slots: threading.BoundedSemaphore, count: int) -> None:
+        for _ in range(count):
+            slots.release()
+
+    def _run_concurrently(self) -> None:
+        logger.info("Run consumer with concurrency=%s", self._concurrency)
+        slots = threading.BoundedSemaphore(self._concurrency)
+        batch_size = min(self._consumer.batch_size, self._concurrency)
+        with (
+            self._consumer,
+            ThreadPoolExecutor(
+                max_workers=self._concurrency, thread_name_prefix=f"consumer-{self._consumer.stream_name}"
+            ) as executor,
+        ):
+            while True:
+                free_slots = self._acquire_slots(slots, limit=batch_size)
+                if self._recycling_required():
+                    self._release_slots(slots, count=free_slots)
+                    return
+                try:
+                    messages = self._consumer.read(count=free_slots)
+                except Exception:
+                    self._release_slots(slots, count=free_slots)
+                    raise
+                self._release_slots(slots, count=free_slots - len(messages))
+                self._count_consumed(len(messages))
+                for msg in messages:
+                    executor.submit(self._process_in_slot, msg, slots)
+
+    def _process_in_slot(self, data: RedisUnreadData, slots: threading.BoundedSemaphore) -> None:
+        try:
+            self._process(data)
+        except Exception:
+            logger.exception("Error while processing message %s!", data)
+        finally:
+            slots.release()
 
     def _process(self, data: RedisUnreadData) -> None:
-        container = RedisContainer(task=data.decoded_message)
-        logger.info("Gotten ready for test_execution BaseRedisTask: %s", container.task)
-        self._mapping[type(container.task)](container.task)
+        self._handle(data.decode_task(), data)
+
+    def _handle(self, task: AnyRedisTask, data: RedisUnreadData) -> None:
+        logger.info("Gotten ready for test_execution BaseRedisTask: %s", task)
+        self._mapping[type(task)](task)
+        self._consumer.acknowledge(data)
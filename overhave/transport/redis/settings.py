@@ -2,23 +2,89 @@ from datetime import timedelta
 
 import yarl
 from pydantic import field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import SettingsConfigDict
 
+from overhave.transport.objects import RedisStream, TestRunPriority
+from overhave.transport.settings import BaseStreamSettings
 
-class BaseRedisSettings(BaseSettings):
+
+class BaseRedisSettings(BaseStreamSettings):
     """Base settings for Redis entities, which use for work with different framework tasks."""
 
     model_config = SettingsConfigDict(env_prefix="OVERHAVE_REDIS_")
 
     db: int = 0
-    block_timeout: timedelta = timedelta(seconds=1)
-    read_count: int = 1
     socket_timeout: timedelta = timedelta(seconds=5)
 
+    # Number of tasks, which are processed simultaneously by one consumer process.
+    # When it is greater than 1, :class:`RedisConsumerRunner` reads batches of ```read_count``` messages
+    # and dispatches them to the pool of workers. Reading stops while all workers are busy.
+    concurrency: int = 1
+    # Specific concurrency for streams, for example `{"test": 4, "emulation": 1}`
+    stream_concurrency: dict[str, int] = {}
+
+    # Number of consumed tasks and resident set size in bytes, after which consumer process finishes already read
+    # tasks and exits without reading new ones, so supervisor of `consumer` command starts fresh process instead.
+    # Recycling is disabled by default.
+    consumer_max_tasks: int | None = None
+    consumer_max_rss: int | None = None
+    # Number of consumer processes of `consumer` command, which are kept alive by its supervisor
+    consumer_processes: int = 1
+
+    # Weights of test run priority lanes for weighted fair consumption of `test` stream
+    test_priority_weights: dict[TestRunPriority, int] = {
+        TestRunPriority.INTERACTIVE: 8,
+        TestRunPriority.SCHEDULED: 3,
+        TestRunPriority.BULK: 1,
+    }
+
+    # Maximum length of stream and time window of stream entries. Oldest entries beyond them are trimmed
+    # by :class:`RedisStreamTrimmer` with MINID, entries which are pending or not delivered to any consumer group
+    # are never trimmed.
+    stream_max_length: int | None = None
+    stream_retention: timedelta | None = None
+    # Interval of stream trimming and observation of stream length and memory gauges
+    trim_interval: timedelta = timedelta(minutes=1)
+
+    # Common consumer group for all streams of :class:`AsyncRedisConsumerRunner`, which is read with single
+    # XREADGROUP call. By default every stream is read from its own `cg-<stream>` consumer group, so asyncio
+    # runtime could be used together with regular consumers. Do not mix these modes for one Redis database.
+    multiplexed_group: str | None = None
+
+    # Backlog of test stream lanes (lag and pending entries of the slowest consumer group), above which API rejects
+    # new test runs with 429 status. Admission control is disabled by default.
+    admission_max_backlog: int | None = None
+    # Time to live of cached backlog, so XINFO GROUPS is not called on every request
+    admission_cache_ttl: timedelta = timedelta(seconds=2)
+    # Time window of consumers throughput, which is used for estimation of Retry-After header
+    admission_throughput_window: timedelta = timedelta(minutes=5)
+    # Retry-After for rejected requests, when throughput of consumers is unknown
+    admission_default_retry_after: timedelta = timedelta(minutes=1)
+
     @property
     def timeout_milliseconds(self) -> int:
         return int(self.block_timeout.total_seconds() * 1000)
 
+    @property
+    def reclaim_idle_milliseconds(self) -> int:
+        return int(self.reclaim_idle_time.total_seconds() * 1000)
+
+    @property
+    def consumer_recycling_enabled(self) -> bool:
+        return self.consumer_max_tasks is not None or self.consumer_max_rss is not None
+
+    def get_concurrency(self, stream_name: str) -> int:
+        return max(self.stream_concurrency.get(stream_name, self.concurrency), 1)
+
+    def get_lane_weights(self, stream_name: RedisStream) -> dict[str, int]:
+        """Weights of Redis streams, which back lanes of ```stream_name```, in order of priority."""
+        if stream_name is not RedisStream.TEST:
+            return {stream_name.value: 1}
+        return {
+            f"{stream_name}{priority.stream_postfix}": max(self.test_priority_weights.get(priority, 1), 1)
+            for priority in TestRunPriority
+        }
+
 
 class OverhaveRedisSettings(BaseRedisSettings):
     """Settings for Redis entities, which use for work with different framework tasks."""
@@ -0,0 +1,81 @@
+import logging
+import multiprocessing
+import signal
+import threading
+from datetime import timedelta
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from types import FrameType
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+_RESTART_DELAY = timedelta(seconds=1)
+_STOP_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+def _run_target(target: Callable[[], None]) -> None:
+    for signum in _STOP_SIGNALS:
+        signal.signal(signum, signal.SIG_DFL)
+    target()
+
+
+class RedisConsumerSupervisor:
+    """Supervisor, which keeps ```processes``` consumer processes alive.
+
+    Consumers are forked from the supervisor process, which does not open any connections, so every
+    restarted consumer begins with fresh memory. Consumers, which exited after recycling, are restarted
+    at once, crashed ones - after ```restart_delay```. SIGINT and SIGTERM stop supervisor with its consumers.
+    """
+
+    def __init__(self, target: Callable[[], None], processes: int, restart_delay: timedelta = _RESTART_DELAY) -> None:
+        self._target = target
+        self._processes = max(processes, 1)
+        self._restart_delay = restart_delay
+        self._context = multiprocessing.get_context("fork")
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def _handle_signal(self, signum: int, frame: FrameType | None) -> None:
+        logger.info("Got signal %s, stop consumers...", signal.Signals(signum).name)
+        self.stop()
+
+    def _start(self) -> BaseProcess:
+        process = self._context.Process(target=_run_target, args=(self._target,))
+        process.start()
+        logger.info("Started consumer process %s", process.pid)
+        return process
+
+    def _restart(self, process: BaseProcess) -> BaseProcess:
+        process.join()
+        if process.exitcode != 0:
+            logger.warning("Consumer process %s crashed with exit code %s", process.pid, process.exitcode)
+            self._stop_event.wait(self._restart_delay.total_seconds())
+        else:
+            logger.info("Consumer process %s has been recycled", process.pid)
+        return self._start()
+
+    def _supervise(self, processes: list[BaseProcess]) -> None:
+        while not self._stop_event.is_set():
+            wait([process.sentinel for process in processes], timeout=self._restart_delay.total_seconds())
+            for index, process in enumerate(processes):
+                if process.is_alive() or self._stop_event.is_set():
+                    continue
+                processes[index] = self._restart(process)
+
+    def run(self) -> None:
+        if threading.current_thread() is threading.main_thread():
+            for signum in _STOP_SIGNALS:
+                signal.signal(signum, self._handle_signal)
+        logger.info("Start supervisor of %s consumer processes", self._processes)
+        processes = [self._start() for _ in range(self._processes)]
+        try:
+            self._supervise(processes)
+        finally:
+            for process in processes:
+                process.terminate()
+            for process in processes:
+                process.join()
+        logger.info("Supervisor has stopped consumers")
@@ -0,0 +1,135 @@
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, NamedTuple, Sequence
+
+import redis
+import walrus
+
+from overhave.metrics import BaseOverhaveMetricContainer
+from overhave.transport.redis.settings import BaseRedisSettings
+
+logger = logging.getLogger(__name__)
+
+
+class StreamEntryId(NamedTuple):
+    """Class for comparable ID of Redis stream entry."""
+
+    milliseconds: int
+    sequence: int
+
+    @classmethod
+    def parse(cls, value: bytes | str) -> "StreamEntryId":
+        if isinstance(value, bytes):
+            value = value.decode()
+        milliseconds, _, sequence = value.partition("-")
+        return cls(int(milliseconds), int(sequence or 0))
+
+    @classmethod
+    def from_datetime(cls, value: datetime) -> "StreamEntryId":
+        return cls(int(value.timestamp() * 1000), 0)
+
+    @property
+    def next(self) -> "StreamEntryId":
+        return StreamEntryId(self.milliseconds, self.sequence + 1)
+
+    def __str__(self) -> str:
+        return f"{self.milliseconds}-{self.sequence}"
+
+
+class RedisStreamTrimmer:
+    """Class for trimming of Redis streams according to retention policy.
+
+    Entries older than ```stream_retention``` and oldest entries beyond ```stream_max_length``` are trimmed
+    with XTRIM MINID. Trimming boundary never exceeds
+    the oldest pending entry or the first not delivered entry of any consumer group, so unprocessed tasks are kept.
+    Also trimmer observes length and memory usage of ```streams```, which could be names of stream lanes.
+    """
+
+    def __init__(
+        self,
+        settings: BaseRedisSettings,
+        streams: Sequence[str],
+        database: walrus.Database,
+        metric_container: BaseOverhaveMetricContainer,
+    ) -> None:
+        self._settings = settings
+        self._streams = streams
+        self._database = database
+        self._metric_container = metric_container
+
+    def _get_unprocessed_min_id(self, stream: str) -> StreamEntryId | None:
+        groups: list[dict[str, Any]] = self._database.xinfo_groups(stream)
+        if not groups:
+            return None
+        entry_ids: list[StreamEntryId] = []
+        for group in groups:
+            if group["pending"]:
+                pending_summary: dict[str, Any] = self._database.xpending(stream, group["name"])
+                entry_ids.append(StreamEntryId.parse(pending_summary["min"]))
+                continue
+            entry_ids.append(StreamEntryId.parse(group["last-delivered-id"]).next)
+        return min(entry_ids)
+
+    def _get_length_min_id(self, stream: str) -> StreamEntryId | None:
+        if self._settings.stream_max_length is None:
+            return None
+        excess = int(self._database.xlen(stream)) - self._settings.stream_max_length
+        if excess <= 0:
+            return None
+        entries: list[Any] = self._database.xrange(stream, count=excess + 1)
+        return StreamEntryId.parse(entries[-1][0])
+
+    def _get_policy_min_id(self, stream: str) -> StreamEntryId | None:
+        min_ids: list[StreamEntryId] = []
+        if self._settings.stream_retention is not None:
+            min_ids.append(StreamEntryId.from_datetime(datetime.now() - self._settings.stream_retention))
+        length_min_id = self._get_length_min_id(stream)
+        if length_min_id is not None:
+            min_ids.append(length_min_id)
+        if not min_ids:
+            return None
+        return max(min_ids)
+
+    def trim(self, stream: str) -> int:
+        """Trim entries of ```stream```, which are out of retention policy, and return their count."""
+        if self._settings.stream_retention is None and self._settings.stream_max_length is None:
+            return 0
+        if not self._database.exists(stream):
+            return 0
+        unprocessed_min_id = self._get_unprocessed_min_id(stream)
+        if unprocessed_min_id is None:
+            logger.debug("Stream %s has no consumer groups, skip trimming", stream)
+            return 0
+        policy_min_id = self._get_policy_min_id(stream)
+        if policy_min_id is None:
+            return 0
+        min_id = min(policy_min_id, unprocessed_min_id)
+        trimmed = int(self._database.xtrim(stream, minid=str(min_id), approximate=True))
+        if trimmed:
+            logger.info("Trimmed %s entries of stream %s before %s", trimmed, stream, min_id)
+            self._metric_container.trim_redis_tasks(task_type=str(stream), count=trimmed)
+        return trimmed
+
+    def _observe(self, stream: str) -> None:
+        self._metric_container.observe_redis_stream(
+            task_type=str(stream),
+            length=self._database.xlen(stream),
+            memory=self._database.memory_usage(stream) or 0,
+        )
+
+    def run(self) -> None:
+        while True:
+            for stream in self._streams:
+                try:
+                    self.trim(stream)
+                    self._observe(stream)
+                except redis.exceptions.RedisError:
+                    logger.exception("Error while trying to trim stream %s!", stream)
+            time.sleep(self._settings.trim_interval.total_seconds())
+
+    def start(self) -> None:
+        """Start trimming in background daemon thread."""
+        threading.Thread(target=self.run, name="redis-stream-trimmer", daemon=True).start()
+        logger.info("Started trimming of streams %s", list(self._streams))
@@ -0,0 +1,50 @@
+import enum
+import os
+import socket
+from datetime import timedelta
+
+from pydantic_settings import BaseSettings
+
+from overhave.transport.objects import RedisMessageFormat
+
+
+class RedisDeliveryMode(enum.StrEnum):
+    """Enum for delivery modes of stream messages.
+
+    At most once - message is acknowledged right after reading, so work in flight is lost in case of consumer crash.
+    At least once - message is acknowledged after successful processing. Pending messages of crashed consumers
+    are reclaimed by another consumers after ```reclaim_idle_time```.
+    """
+
+    AT_MOST_ONCE = "at_most_once"
+    AT_LEAST_ONCE = "at_least_once"
+
+
+class BaseStreamSettings(BaseSettings):
+    """Base settings for producers and consumers of task streams, which do not depend on transport."""
+
+    block_timeout: timedelta = timedelta(seconds=1)
+    read_count: int = 1
+    # Format of produced messages. Consumers read both formats, but consumers of previous versions read only
+    # `legacy` messages, so `envelope` should be enabled for producers after all consumers are updated.
+    message_format: RedisMessageFormat = RedisMessageFormat.LEGACY
+
+    delivery_mode: RedisDeliveryMode = RedisDeliveryMode.AT_MOST_ONCE
+    # Unique consumer name inside `cg-<stream>` consumer group, by default - `<hostname>-<pid>`
+    consumer_name: str | None = None
+    # Idle time of pending message, after which it could be reclaimed. Should be greater than maximum task duration.
+    reclaim_idle_time: timedelta = timedelta(hours=1)
+    # Interval between scans of pending messages for reclaiming
+    reclaim_interval: timedelta = timedelta(seconds=30)
+    # Maximum deliveries count of message, after which it is moved to dead-letter stream `<stream>-dead-letter`
+    max_deliveries: int = 3
+    dead_letter_postfix: str = "-dead-letter"
+
+    @property
+    def ack_after_processing(self) -> bool:
+        return self.delivery_mode is RedisDeliveryMode.AT_LEAST_ONCE
+
+    def get_consumer_name(self) -> str:
+        if self.consumer_name is not None:
+            return self.consumer_name
+        return f"{socket.gethostname()}-{os.getpid()}"
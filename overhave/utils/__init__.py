@@ -1,4 +1,5 @@
 # flake8: noqa
+from .memory import get_current_rss
 from .mocks import ANY_INT
 from .time import get_current_time
 from .url import make_url
@@ -0,0 +1,16 @@
+import os
+import resource
+from pathlib import Path
+
+_STATM_PATH = Path("/proc/self/statm")
+
+
+def get_current_rss() -> int:
+    """Get resident set size of the current process in bytes.
+
+    Peak resident set size is returned, when the current one is not available (not Linux system).
+    """
+    try:
+        return int(_STATM_PATH.read_text().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
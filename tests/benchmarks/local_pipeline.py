@@ -0,0 +1,65 @@
+# Benchmark of produce, consume and dispatch pipeline with local transport, no external services are required.
+# Run with `python -m tests.benchmarks.local_pipeline`.
+import tempfile
+import time
+from pathlib import Path
+
+import typer
+from prometheus_client import CollectorRegistry
+
+from overhave.metrics import BaseOverhaveMetricContainer
+from overhave.transport import (
+    LocalConsumer,
+    LocalProducer,
+    LocalStreamBroker,
+    OverhaveLocalTransportSettings,
+    OverhaveRedisSettings,
+    RedisDeliveryMode,
+    RedisStream,
+    TestRunData,
+    TestRunTask,
+)
+
+_TASKS_COUNT = 10_000
+_BATCH_SIZE = 100
+
+
+def main() -> None:
+    metric_container = BaseOverhaveMetricContainer(registry=CollectorRegistry())
+    settings = OverhaveRedisSettings(delivery_mode=RedisDeliveryMode.AT_LEAST_ONCE, read_count=_BATCH_SIZE)
+    with tempfile.TemporaryDirectory() as directory:
+        for database in (":memory:", str(Path(directory) / "streams.sqlite3")):
+            broker = LocalStreamBroker(OverhaveLocalTransportSettings(enabled=True, database=database))
+            producer = LocalProducer(
+                settings=settings,
+                mapping={TestRunTask: RedisStream.TEST},
+                broker=broker,
+                metric_container=metric_container,
+            )
+            consumer = LocalConsumer(
+                settings=settings, stream_name=RedisStream.TEST, broker=broker, metric_container=metric_container
+            )
+            batches = [
+                [TestRunTask(data=TestRunData(test_run_id=x)) for x in range(start, start + _BATCH_SIZE)]
+                for start in range(0, _TASKS_COUNT, _BATCH_SIZE)
+            ]
+            with consumer:
+                started_at = time.perf_counter()
+                for batch in batches:
+                    producer.add_tasks(batch)
+                produced_at = time.perf_counter()
+                consumed = 0
+                while messages := consumer.read(block=False):
+                    for data in messages:
+                        data.decode_task()
+                        consumer.acknowledge(data)
+                    consumed += len(messages)
+                consumed_at = time.perf_counter()
+            typer.echo(
+                f"{database}: produced {_TASKS_COUNT} tasks with {_TASKS_COUNT / (produced_at - started_at):.0f} "
+                f"tasks/s, consumed {consumed} tasks with {consumed / (consumed_at - produced_at):.0f} tasks/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# Microbenchmark of decoding and dispatch of Redis stream messages.
+# Run with `python -m tests.benchmarks.redis_messages`.
+import timeit
+
+import typer
+
+from overhave.transport import (
+    EmulationData,
+    EmulationTask,
+    PublicationData,
+    PublicationTask,
+    RedisMessageFormat,
+    TestRunData,
+    TestRunTask,
+)
+from overhave.transport.objects import RedisUnreadData
+
+_NUMBER = 100_000
+_TASKS = {
+    "TestRunTask": TestRunTask(data=TestRunData(test_run_id=1)),
+    "PublicationTask": PublicationTask(data=PublicationData(draft_id=1)),
+    "EmulationTask": EmulationTask(data=EmulationData(emulation_run_id=1)),
+}
+
+
+def main() -> None:
+    typer.echo(f"{'task':<16}{'format':<10}{'size, bytes':>12}{'decode, us':>12}")
+    for name, task in _TASKS.items():
+        for message_format in RedisMessageFormat:
+            message = task.get_message(message_format)
+            data = RedisUnreadData(message_id=b"1-0", message=message)
+            assert data.decode_task() == task
+            seconds = timeit.timeit(data.decode_task, number=_NUMBER)
+            size = sum(len(key) + len(value) for key, value in message.items())
+            typer.echo(f"{name:<16}{message_format:<10}{size:>12}{seconds / _NUMBER * 1_000_000:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
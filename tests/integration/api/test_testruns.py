@@ -67,6 +67,27 @@ class TestTestRunAPI:
             test_run = TestRunModel.model_validate(response_test_run.json())
             assert test_run.status == TestRunStatus.STARTED
 
+    @pytest.mark.parametrize("test_severity", [allure.severity_level.NORMAL], indirect=True)
+    def test_run_selected_scenarios_by_tag_handler(
+        self,
+        test_api_client: TestClient,
+        test_api_bearer_auth: BearerAuth,
+        test_tag: TagModel,
+        test_feature_with_tag: FeatureModel,
+        test_scenario: ScenarioModel,
+        flask_urlfor_handler_mock: mock.MagicMock,
+    ) -> None:
+        response = test_api_client.post(
+            f"/test_run/create/?tag_value={test_tag.value}&scenarios=2&scenarios=Login&fail_fast=true",
+            auth=test_api_bearer_auth,
+        )
+        assert response.status_code == 200
+        test_run_id = cast(list[int], response.json())
+        response_test_run = test_api_client.get(f"/test_run/?test_run_id={test_run_id[0]}", auth=test_api_bearer_auth)
+        test_run = TestRunModel.model_validate(response_test_run.json())
+        assert test_run.scenarios == ["2", "Login"]
+        assert test_run.fail_fast
+
     def test_get_test_run_handler_not_found(
         self,
         test_api_client: TestClient,
@@ -44,8 +44,6 @@ def gitlab_version_publisher_without_context(
 @pytest.fixture()
 def simple_gitlab_version_publisher(
     test_project_settings,
-    test_feature_storage,
-    test_scenario_storage,
     test_run_storage,
     test_draft_storage,
     mocked_file_manager,
@@ -57,8 +55,6 @@ def simple_gitlab_version_publisher(
 ) -> GitlabVersionPublisher:
     return GitlabVersionPublisher(
         project_settings=test_project_settings,
-        feature_storage=test_feature_storage,
-        scenario_storage=test_scenario_storage,
         test_run_storage=test_run_storage,
         draft_storage=test_draft_storage,
         file_manager=mocked_file_manager,
@@ -88,8 +84,6 @@ def stash_version_publisher_without_context(simple_stash_version_publisher) -> S
 @pytest.fixture()
 def simple_stash_version_publisher(
     test_project_settings,
-    test_feature_storage,
-    test_scenario_storage,
     test_run_storage,
     test_draft_storage,
     mocked_file_manager,
@@ -100,8 +94,6 @@ def simple_stash_version_publisher(
 ) -> StashVersionPublisher:
     return StashVersionPublisher(
         project_settings=test_project_settings,
-        feature_storage=test_feature_storage,
-        scenario_storage=test_scenario_storage,
         test_run_storage=test_run_storage,
         draft_storage=test_draft_storage,
         file_manager=mocked_file_manager,
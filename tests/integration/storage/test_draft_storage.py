@@ -6,7 +6,7 @@ import sqlalchemy as sa
 from faker import Faker
 
 from overhave import db
-from overhave.storage import DraftModel, DraftStorage, FeatureModel, SystemUserModel
+from overhave.storage import DraftModel, DraftStorage, FeatureModel, ScenarioModel, SystemUserModel
 from overhave.storage.draft_storage import DraftNotFoundError, NullableScenarioError
 from overhave.utils import get_current_time
 from tests.db_utils import count_queries, create_test_session
@@ -28,6 +28,22 @@ class TestDraftStorage:
         assert draft_model.feature_id == test_draft.feature_id
         assert draft_model.test_run_id == test_draft.test_run_id
 
+    @pytest.mark.parametrize("test_severity", [allure.severity_level.NORMAL], indirect=True)
+    def test_draft_context_by_id(
+        self,
+        test_draft_storage: DraftStorage,
+        test_draft: DraftModel,
+        test_feature: FeatureModel,
+        test_scenario: ScenarioModel,
+    ) -> None:
+        with count_queries(1):
+            with db.create_session() as session:
+                draft_model, context = test_draft_storage.draft_context_by_id(session=session, draft_id=test_draft.id)
+        assert draft_model == test_draft
+        assert context.test_run.id == test_draft.test_run_id
+        assert context.scenario == test_scenario
+        assert context.feature == test_feature
+
     @pytest.mark.parametrize("test_severity", [allure.severity_level.NORMAL], indirect=True)
     @pytest.mark.parametrize("draft_status", [db.DraftStatus.REQUESTED])
     def test_create_new_draft(
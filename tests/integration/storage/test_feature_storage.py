@@ -10,6 +10,7 @@ from overhave.storage import (
     FeatureStorage,
     FeatureTagStorage,
     FeatureTypeModel,
+    ScenarioModel,
     SystemUserStorage,
     TagModel,
 )
@@ -123,3 +124,14 @@ class TestFeatureStorage:
             found_features = test_feature_storage.get_features_by_tag(test_tag.id)
         assert len(found_features) == 1
         assert found_features[0] == test_feature_with_tag
+
+    def test_get_features_with_scenarios(
+        self,
+        test_feature_storage: FeatureStorage,
+        test_feature_type: FeatureTypeModel,
+        test_feature: FeatureModel,
+        test_scenario: ScenarioModel,
+    ) -> None:
+        with count_queries(1):
+            features = test_feature_storage.get_features_with_scenarios(test_feature_type.name)
+        assert features == [(test_feature, test_scenario)]
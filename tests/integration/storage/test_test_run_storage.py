@@ -1,10 +1,12 @@
+from datetime import timedelta
+
 import allure
 import pytest
 from faker import Faker
 
 from overhave import db
 from overhave.db import TestReportStatus, TestRunStatus
-from overhave.storage import FeatureModel, ScenarioModel, TestRunModel, TestRunStorage
+from overhave.storage import FeatureModel, ScenarioModel, TestRunModel, TestRunResultModel, TestRunStorage
 from tests.db_utils import count_queries, create_test_session
 
 
@@ -64,17 +66,144 @@ class TestTestRunStorage:
             assert updated_test_run.report_status == report_status
             assert updated_test_run.report == test_report
 
-    def test_testrun_by_id(
+    def test_start_and_finish_run(self, test_run_storage: TestRunStorage, test_created_test_run_id: int) -> None:
+        with count_queries(1):
+            with db.create_session() as session:
+                assert test_run_storage.start_run(session=session, run_id=test_created_test_run_id)
+        with count_queries(1):
+            assert test_run_storage.finish_run(
+                run_id=test_created_test_run_id,
+                result=TestRunResultModel(
+                    status=TestRunStatus.SUCCESS,
+                    report_status=TestReportStatus.GENERATED,
+                    report="report",
+                    peak_rss=1024**3,
+                    cpu_time=timedelta(seconds=1.5),
+                    workers=2,
+                ),
+            )
+        with create_test_session() as session:
+            test_run = session.get(db.TestRun, test_created_test_run_id)
+            assert test_run is not None
+            assert test_run.status == TestRunStatus.SUCCESS
+            assert test_run.start is not None
+            assert test_run.end is not None
+            assert test_run.report_status == TestReportStatus.GENERATED
+            assert test_run.report == "report"
+            assert test_run.peak_rss == 1024**3
+            assert test_run.cpu_time == timedelta(seconds=1.5)
+            assert test_run.workers == 2
+
+    def test_finished_run_transitions_are_idempotent(
+        self, test_run_storage: TestRunStorage, test_created_test_run_id: int
+    ) -> None:
+        with count_queries(4):
+            assert not test_run_storage.finish_run(
+                run_id=test_created_test_run_id, result=TestRunResultModel(status=TestRunStatus.SUCCESS)
+            )
+            assert test_run_storage.finish_run(
+                run_id=test_created_test_run_id, result=TestRunResultModel(status=TestRunStatus.INTERNAL_ERROR)
+            )
+            assert not test_run_storage.finish_run(
+                run_id=test_created_test_run_id, result=TestRunResultModel(status=TestRunStatus.INTERNAL_ERROR)
+            )
+            with db.create_session() as session:
+                assert not test_run_storage.start_run(session=session, run_id=test_created_test_run_id)
+
+    def test_running_run_is_started_again_after_lease(
+        self, test_run_storage: TestRunStorage, test_created_test_run_id: int
+    ) -> None:
+        with count_queries(4):
+            with db.create_session() as session:
+                assert test_run_storage.start_run(session=session, run_id=test_created_test_run_id, lease=timedelta())
+                assert test_run_storage.start_run(
+                    session=session, run_id=test_created_test_run_id, lease=timedelta(hours=1)
+                )
+                assert not test_run_storage.start_run(session=session, run_id=test_created_test_run_id)
+            with create_test_session() as session:
+                test_run = session.get(db.TestRun, test_created_test_run_id)
+                assert test_run is not None
+                assert test_run.status == TestRunStatus.RUNNING
+                assert test_run.lease_until is not None
+
+    def test_running_run_without_lease_is_not_started_again(
+        self, test_run_storage: TestRunStorage, test_created_test_run_id: int
+    ) -> None:
+        with db.create_session() as session:
+            assert test_run_storage.start_run(session=session, run_id=test_created_test_run_id)
+            assert not test_run_storage.start_run(session=session, run_id=test_created_test_run_id)
+
+    def test_sharded_run_is_finished_by_last_shard(
+        self, test_run_storage: TestRunStorage, test_created_test_run_id: int
+    ) -> None:
+        with db.create_session() as session:
+            assert test_run_storage.start_run(session=session, run_id=test_created_test_run_id)
+        assert test_run_storage.start_sharding(run_id=test_created_test_run_id, shards=3)
+        assert not test_run_storage.start_sharding(run_id=test_created_test_run_id, shards=3)
+        with count_queries(4):
+            assert test_run_storage.finish_shard(run_id=test_created_test_run_id, shard=2, failed=True) is None
+            assert test_run_storage.finish_shard(run_id=test_created_test_run_id, shard=0, failed=False) is None
+            assert test_run_storage.finish_shard(run_id=test_created_test_run_id, shard=0, failed=False) is None
+            assert (
+                test_run_storage.finish_shard(run_id=test_created_test_run_id, shard=1, failed=False)
+                is TestRunStatus.FAILED
+            )
+
+    def test_create_rerun_of_failed_scenarios(
         self, test_run_storage: TestRunStorage, test_feature: FeatureModel, test_created_test_run_id: int
+    ) -> None:
+        assert test_run_storage.create_rerun(run_id=test_created_test_run_id, executed_by=test_feature.author) is None
+        with db.create_session() as session:
+            assert test_run_storage.start_run(session=session, run_id=test_created_test_run_id)
+        assert test_run_storage.finish_run(
+            run_id=test_created_test_run_id,
+            result=TestRunResultModel(status=TestRunStatus.FAILED, failed_scenarios=["Login as admin"]),
+        )
+        with count_queries(2):
+            rerun_id = test_run_storage.create_rerun(run_id=test_created_test_run_id, executed_by=test_feature.author)
+        assert rerun_id is not None
+        rerun = test_run_storage.get_testrun_model(rerun_id)
+        assert rerun is not None
+        assert rerun.status == TestRunStatus.STARTED
+        assert rerun.rerun_of == test_created_test_run_id
+        assert rerun.scenarios == ["Login as admin"]
+        assert not rerun.fail_fast
+        assert rerun.failed_scenarios is None
+
+    def test_get_memoized_testrun(self, test_run_storage: TestRunStorage, test_created_test_run_id: int) -> None:
+        memo_key = "memo-key"
+        with db.create_session() as session:
+            assert test_run_storage.start_run(session=session, run_id=test_created_test_run_id)
+        assert test_run_storage.finish_run(
+            run_id=test_created_test_run_id,
+            result=TestRunResultModel(
+                status=TestRunStatus.SUCCESS,
+                report_status=TestReportStatus.GENERATED,
+                report="report",
+                memo_key=memo_key,
+            ),
+        )
+        with count_queries(1):
+            memoized_run = test_run_storage.get_memoized_testrun(memo_key=memo_key, max_age=timedelta(hours=1))
+        assert memoized_run is not None
+        assert memoized_run.id == test_created_test_run_id
+        assert memoized_run.report == "report"
+        assert test_run_storage.get_memoized_testrun(memo_key="other-key", max_age=timedelta(hours=1)) is None
+        assert test_run_storage.get_memoized_testrun(memo_key=memo_key, max_age=timedelta()) is None
+
+    def test_executor_context_by_id(
+        self,
+        test_run_storage: TestRunStorage,
+        test_feature: FeatureModel,
+        test_scenario: ScenarioModel,
+        test_created_test_run_id: int,
     ) -> None:
         with count_queries(1):
             with db.create_session() as session:
-                test_run = test_run_storage.testrun_model_by_id(session=session, run_id=test_created_test_run_id)
-        assert isinstance(test_run, TestRunModel)
-        assert test_run.id == test_created_test_run_id
-        assert test_run.status == TestRunStatus.STARTED
-        assert test_run.executed_by == test_feature.author
-        assert test_run.report_status == db.TestReportStatus.EMPTY
+                context = test_run_storage.executor_context_by_id(session=session, run_id=test_created_test_run_id)
+        assert context.test_run.id == test_created_test_run_id
+        assert context.scenario == test_scenario
+        assert context.feature == test_feature
 
     def test_get_test_run(
         self, test_run_storage: TestRunStorage, test_feature: FeatureModel, test_created_test_run_id: int
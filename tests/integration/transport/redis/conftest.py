@@ -1,5 +1,7 @@
 import logging
+from datetime import timedelta
 from functools import cache
+from typing import Callable
 
 import pytest
 import walrus
@@ -14,6 +16,8 @@ from overhave.transport import (
     BaseRedisSettings,
     OverhaveRedisSentinelSettings,
     OverhaveRedisSettings,
+    RedisConsumer,
+    RedisDeliveryMode,
     RedisProducer,
     RedisStream,
     TestRunTask,
@@ -117,3 +121,28 @@ def redis_consumer_factory(
 @pytest.fixture()
 def run_id(faker: Faker) -> int:
     return faker.random_int()
+
+
+@pytest.fixture()
+def at_least_once_redis_settings() -> OverhaveRedisSettings:
+    return OverhaveRedisSettings(
+        db=_get_initial_redis_settings().db,
+        delivery_mode=RedisDeliveryMode.AT_LEAST_ONCE,
+        reclaim_idle_time=timedelta(0),
+        max_deliveries=2,
+    )
+
+
+@pytest.fixture()
+def make_redis_consumer(
+    at_least_once_redis_settings: OverhaveRedisSettings, base_container: BaseOverhaveMetricContainer, redisdb
+) -> Callable[[str], RedisConsumer]:
+    def _make_consumer(name: str) -> RedisConsumer:
+        return RedisConsumer(
+            settings=at_least_once_redis_settings.model_copy(update={"consumer_name": name}),
+            stream_name=RedisStream.TEST,
+            database=walrus.Database(connection_pool=redisdb.connection_pool),
+            metric_container=base_container,
+        )
+
+    return _make_consumer
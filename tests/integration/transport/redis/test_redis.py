@@ -1,7 +1,10 @@
+from typing import Callable, cast
+
 import pytest
+from faker import Faker
 
 from overhave.factory import ConsumerFactory
-from overhave.transport import RedisProducer, RedisStream, TestRunData, TestRunTask
+from overhave.transport import RedisConsumer, RedisProducer, RedisStream, TestRunData, TestRunPriority, TestRunTask
 
 
 @pytest.mark.usefixtures("redisdb")
@@ -13,7 +16,7 @@ class TestRedisConsumerAndProducer:
         self,
         redis_consumer_factory: ConsumerFactory,
     ) -> None:
-        redis_consumer = redis_consumer_factory._consumer
+        redis_consumer = cast(RedisConsumer, redis_consumer_factory._consumer)
         with redis_consumer:
             consumer_group = redis_consumer._consumer_group
             assert consumer_group.keys.get(RedisStream.TEST)
@@ -25,10 +28,80 @@ class TestRedisConsumerAndProducer:
         redis_producer: RedisProducer,
         run_id: int,
     ) -> None:
-        redis_consumer = redis_consumer_factory._consumer
+        redis_consumer = cast(RedisConsumer, redis_consumer_factory._consumer)
         with redis_consumer:
             task = TestRunTask(data=TestRunData(test_run_id=run_id))
             assert redis_producer.add_task(task)
             task_from_consumer = redis_consumer._consume()[-1]
             run_id_from_task = task_from_consumer.decoded_message["data"]["test_run_id"]
             assert run_id_from_task == run_id
+
+    @pytest.mark.parametrize("enable_sentinel", [False], indirect=True)
+    def test_ack_after_processing_and_reclaim(
+        self,
+        make_redis_consumer: Callable[[str], RedisConsumer],
+        redis_producer: RedisProducer,
+        run_id: int,
+    ) -> None:
+        crashed_consumer = make_redis_consumer("crashed")
+        with crashed_consumer:
+            assert redis_producer.add_task(TestRunTask(data=TestRunData(test_run_id=run_id)))
+            message = crashed_consumer._consume()[-1]
+        assert crashed_consumer._stream.pending(consumer="crashed")
+
+        alive_consumer = make_redis_consumer("alive")
+        with alive_consumer:
+            reclaimed = alive_consumer._consume()
+            assert [x.message_id for x in reclaimed] == [message.message_id]
+            alive_consumer.acknowledge(reclaimed[0])
+            assert not alive_consumer._stream.pending()
+
+    @pytest.mark.parametrize("enable_sentinel", [False], indirect=True)
+    def test_poison_message_moved_to_dead_letter(
+        self,
+        make_redis_consumer: Callable[[str], RedisConsumer],
+        redis_producer: RedisProducer,
+        run_id: int,
+    ) -> None:
+        consumer = make_redis_consumer("poisoned")
+        with consumer:
+            assert redis_producer.add_task(TestRunTask(data=TestRunData(test_run_id=run_id)))
+            consumer._consume()
+            for _ in range(2):
+                consumer._reclaim_cursor = "0-0"
+                consumer._last_reclaim_time = None
+                consumer._consume()
+            assert not consumer._stream.pending()
+        assert consumer._database.xlen(f"{RedisStream.TEST}-dead-letter") == 1
+
+    @pytest.mark.parametrize("enable_sentinel", [False], indirect=True)
+    def test_add_tasks_in_bulk(
+        self,
+        redis_consumer_factory: ConsumerFactory,
+        redis_producer: RedisProducer,
+        faker: Faker,
+    ) -> None:
+        run_ids = [faker.random_int() for _ in range(5)]
+        redis_consumer = cast(RedisConsumer, redis_consumer_factory._consumer)
+        with redis_consumer:
+            results = redis_producer.add_tasks([TestRunTask(data=TestRunData(test_run_id=x)) for x in run_ids])
+            assert results == [True] * len(run_ids)
+            messages = redis_consumer._consume(count=len(run_ids))
+            assert [x.decoded_message["data"]["test_run_id"] for x in messages] == run_ids
+
+    @pytest.mark.parametrize("enable_sentinel", [False], indirect=True)
+    def test_consume_priority_lanes(
+        self,
+        redis_consumer_factory: ConsumerFactory,
+        redis_producer: RedisProducer,
+        faker: Faker,
+    ) -> None:
+        bulk_run_id, interactive_run_id = faker.random_int(), faker.random_int()
+        lanes_consumer = redis_consumer_factory._lanes_consumer
+        with lanes_consumer:
+            assert redis_producer.add_task(
+                TestRunTask(data=TestRunData(test_run_id=bulk_run_id), priority=TestRunPriority.BULK)
+            )
+            assert redis_producer.add_task(TestRunTask(data=TestRunData(test_run_id=interactive_run_id)))
+            run_ids = [lanes_consumer.read()[0].decoded_message["data"]["test_run_id"] for _ in range(2)]
+        assert run_ids == [interactive_run_id, bulk_run_id]
@@ -68,6 +68,6 @@ def test_executed_testruntask_id(
     test_resolved_testexecution_proxy_manager: IProxyManager,
     test_testruntask: TestRunTask,
 ) -> int:
-    with count_queries(8):
+    with count_queries(3):
         test_resolved_testexecution_proxy_manager.factory.process_task(test_testruntask)
     return test_testruntask.data.test_run_id
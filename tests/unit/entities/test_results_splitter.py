@@ -0,0 +1,73 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from overhave.entities import get_failed_scenarios, split_allure_results
+
+_TEST_MODULE = """
+import allure
+
+def test_first():
+    allure.attach("{run}", name="log")
+
+def test_second():
+    assert {passed}
+"""
+
+
+class TestSplitAllureResults:
+    """Unit tests for :func:`split_allure_results`."""
+
+    def test_split_batch_results(self, tmp_path: Path) -> None:
+        results_dir = tmp_path / "results"
+        module_mapping = {}
+        for run_id, passed in ((1, True), (2, False)):
+            module = tmp_path / f"{run_id}_fixture.py"
+            module.write_text(_TEST_MODULE.format(run=run_id, passed=passed))
+            module_mapping[module.stem] = run_id
+        (results_dir / "environment.properties").parent.mkdir()
+        (results_dir / "environment.properties").write_text("key=value")
+        pytest.main(
+            [
+                *(x.as_posix() for x in sorted(tmp_path.glob("*.py"))),
+                f"--alluredir={results_dir}",
+                "-q",
+                "-p",
+                "no:logging",
+            ]
+        )
+
+        run_results = split_allure_results(results_dir=results_dir, module_mapping=module_mapping)
+
+        assert [(x.tests_count, x.failed_count, x.passed) for x in run_results.values()] == [
+            (2, 0, True),
+            (2, 1, False),
+        ]
+        for run_id, results in run_results.items():
+            assert (results.results_dir / "environment.properties").exists()
+            attachments = list(results.results_dir.glob("*-attachment*"))
+            assert [x.read_text() for x in attachments] == [str(run_id)]
+            for result_file in results.results_dir.glob("*-result.json"):
+                assert json.loads(result_file.read_bytes())["fullName"].startswith(f"{run_id}_fixture#")
+
+    def test_run_without_results_is_not_passed(self, tmp_path: Path) -> None:
+        run_results = split_allure_results(results_dir=tmp_path, module_mapping={"1_fixture": 1})
+        assert not run_results[1].passed
+        assert run_results[1].results_dir.exists()
+
+
+class TestGetFailedScenarios:
+    """Unit tests for :func:`get_failed_scenarios`."""
+
+    def test_failed_scenarios(self, tmp_path: Path) -> None:
+        module = tmp_path / "test_fixture.py"
+        module.write_text(
+            "import allure\nimport pytest\n\n"
+            "@allure.title('Scenario')\ndef test_scenario():\n    pass\n\n"
+            "@allure.title('Outline')\n@pytest.mark.parametrize('value', [1, 2, 3])\n"
+            "def test_outline(value):\n    assert value == 1\n"
+        )
+        results_dir = tmp_path / "results"
+        pytest.main([module.as_posix(), f"--alluredir={results_dir}", "-q", "-p", "no:logging"])
+        assert get_failed_scenarios(results_dir) == ["Outline"]
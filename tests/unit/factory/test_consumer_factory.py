@@ -0,0 +1,74 @@
+from unittest import mock
+
+import pytest
+
+from overhave.factory import AsyncConsumerFactory, ConsumerFactory
+from overhave.metrics import get_common_metric_container
+from overhave.test_execution import OverhaveTestSettings
+from overhave.transport import LocalTransportError, OverhaveLocalTransportSettings, OverhaveRedisSettings, RedisStream
+
+
+@pytest.fixture()
+def redis_settings() -> OverhaveRedisSettings:
+    return OverhaveRedisSettings(stream_concurrency={RedisStream.TEST: 4, RedisStream.PUBLICATION: 2})
+
+
+@pytest.fixture()
+def consumer_factory(redis_settings: OverhaveRedisSettings, test_settings: OverhaveTestSettings) -> ConsumerFactory:
+    factory = ConsumerFactory(stream=RedisStream.TEST, metric_container=get_common_metric_container())
+    test_execution_factory = mock.MagicMock()
+    test_execution_factory.context.test_settings = test_settings
+    factory.__dict__["_test_execution_factory"] = test_execution_factory
+    return factory
+
+
+@pytest.fixture()
+def async_consumer_factory(consumer_factory: ConsumerFactory) -> AsyncConsumerFactory:
+    factory = AsyncConsumerFactory(
+        streams=[RedisStream.TEST, RedisStream.PUBLICATION], metric_container=get_common_metric_container()
+    )
+    factory.__dict__["_test_execution_factory"] = consumer_factory._test_execution_factory
+    factory.__dict__["_mapping"] = {}
+    return factory
+
+
+class TestConsumerFactory:
+    """Unit tests for :class:`ConsumerFactory`."""
+
+    @pytest.mark.parametrize(
+        ("test_settings", "expected"),
+        [
+            (OverhaveTestSettings(), 1),
+            (OverhaveTestSettings(isolation_enabled=True), 4),
+            (OverhaveTestSettings(prefork_workers=2), 4),
+        ],
+    )
+    def test_test_stream_concurrency(
+        self, consumer_factory: ConsumerFactory, redis_settings: OverhaveRedisSettings, expected: int
+    ) -> None:
+        with mock.patch("overhave.factory.consumer_factory.get_redis_settings", return_value=redis_settings):
+            assert consumer_factory._get_concurrency(RedisStream.TEST) == expected
+            assert consumer_factory._get_concurrency(RedisStream.PUBLICATION) == 2
+
+    @pytest.mark.parametrize("test_settings", [OverhaveTestSettings()])
+    def test_async_runner_concurrency(
+        self, async_consumer_factory: AsyncConsumerFactory, redis_settings: OverhaveRedisSettings
+    ) -> None:
+        with (
+            mock.patch("overhave.factory.consumer_factory.get_redis_settings", return_value=redis_settings),
+            mock.patch("overhave.factory.consumer_factory.make_async_redis"),
+            mock.patch("overhave.factory.consumer_factory.AsyncRedisConsumerRunner") as runner,
+        ):
+            assert async_consumer_factory.runner is runner.return_value
+        assert runner.call_args.kwargs["concurrency"] == {RedisStream.TEST: 1, RedisStream.PUBLICATION: 2}
+
+    @pytest.mark.parametrize("test_settings", [OverhaveTestSettings()])
+    def test_async_runner_rejects_local_transport(self, async_consumer_factory: AsyncConsumerFactory) -> None:
+        with (
+            mock.patch(
+                "overhave.factory.consumer_factory.get_local_transport_settings",
+                return_value=OverhaveLocalTransportSettings(enabled=True),
+            ),
+            pytest.raises(LocalTransportError, match="not supported by asyncio consumer"),
+        ):
+            async_consumer_factory.runner
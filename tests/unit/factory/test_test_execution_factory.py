@@ -0,0 +1,33 @@
+from unittest import mock
+
+import pytest
+
+from overhave.factory import TestExecutionFactory
+from overhave.factory.context.base_context import BaseFactoryContext
+from overhave.test_execution import OverhaveTestSettings, TestExecutor
+
+
+@pytest.fixture()
+def test_execution_factory(mocked_context: BaseFactoryContext) -> TestExecutionFactory:
+    mocked_context.test_settings = OverhaveTestSettings(shards_max=4)  # type: ignore[misc]
+    factory = TestExecutionFactory()
+    factory.set_context(mocked_context)  # type: ignore[arg-type]
+    return factory
+
+
+class TestTestExecutionFactory:
+    """Unit tests for :class:`TestExecutionFactory`."""
+
+    def test_test_executor_shards_runs(self, test_execution_factory: TestExecutionFactory) -> None:
+        with (
+            mock.patch("overhave.factory.components.test_execution_factory.make_redis"),
+            mock.patch("overhave.factory.components.test_execution_factory.walrus"),
+        ):
+            executor = test_execution_factory.test_executor
+        assert isinstance(executor, TestExecutor)
+        assert executor._task_producer is not None
+
+    def test_local_test_executor_does_not_shard_runs(self, test_execution_factory: TestExecutionFactory) -> None:
+        executor = test_execution_factory.local_test_executor
+        assert isinstance(executor, TestExecutor)
+        assert executor._task_producer is None
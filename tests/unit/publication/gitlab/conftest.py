@@ -11,7 +11,7 @@ from overhave.metrics import PublicationOverhaveMetricContainer
 from overhave.publication.gitlab import GitlabVersionPublisher, OverhaveGitlabPublisherSettings
 from overhave.publication.gitlab.tokenizer import TokenizerClient, TokenizerClientSettings
 from overhave.scenario import FileManager
-from overhave.storage import FeatureTypeName, IDraftStorage, IFeatureStorage, IScenarioStorage, ITestRunStorage
+from overhave.storage import FeatureTypeName, IDraftStorage, ITestRunStorage
 from overhave.transport import GitlabHttpClient
 
 
@@ -92,8 +92,6 @@ def test_gitlab_publisher_with_default_reviewers(
 ) -> GitlabVersionPublisher:
     return GitlabVersionPublisher(
         project_settings=test_project_settings,
-        feature_storage=mocker.create_autospec(IFeatureStorage),
-        scenario_storage=mocker.create_autospec(IScenarioStorage),
         test_run_storage=mocker.create_autospec(ITestRunStorage),
         draft_storage=mocker.create_autospec(IDraftStorage),
         file_manager=mocked_file_manager,
@@ -119,8 +117,6 @@ def test_gitlab_publisher_with_reviewers_mapping(
 ) -> GitlabVersionPublisher:
     return GitlabVersionPublisher(
         project_settings=test_project_settings,
-        feature_storage=mocker.create_autospec(IFeatureStorage),
-        scenario_storage=mocker.create_autospec(IScenarioStorage),
         test_run_storage=mocker.create_autospec(ITestRunStorage),
         draft_storage=mocker.create_autospec(IDraftStorage),
         file_manager=mocked_file_manager,
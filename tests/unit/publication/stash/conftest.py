@@ -9,7 +9,7 @@ from overhave.metrics import PublicationOverhaveMetricContainer
 from overhave.publication import StashVersionPublisher
 from overhave.publication.stash import OverhaveStashPublisherSettings
 from overhave.scenario import FileManager
-from overhave.storage import FeatureTypeName, IDraftStorage, IFeatureStorage, IScenarioStorage, ITestRunStorage
+from overhave.storage import FeatureTypeName, IDraftStorage, ITestRunStorage
 from overhave.transport import StashHttpClient
 
 
@@ -61,8 +61,6 @@ def test_stash_publisher_with_default_reviewers(
 ) -> StashVersionPublisher:
     return StashVersionPublisher(
         project_settings=test_project_settings,
-        feature_storage=mocker.create_autospec(IFeatureStorage),
-        scenario_storage=mocker.create_autospec(IScenarioStorage),
         test_run_storage=mocker.create_autospec(ITestRunStorage),
         draft_storage=mocker.create_autospec(IDraftStorage),
         file_manager=mocked_file_manager,
@@ -86,8 +84,6 @@ def test_stash_publisher_with_reviewers_mapping(
 ) -> StashVersionPublisher:
     return StashVersionPublisher(
         project_settings=test_project_settings,
-        feature_storage=mocker.create_autospec(IFeatureStorage),
-        scenario_storage=mocker.create_autospec(IScenarioStorage),
         test_run_storage=mocker.create_autospec(ITestRunStorage),
         draft_storage=mocker.create_autospec(IDraftStorage),
         file_manager=mocked_file_manager,
@@ -0,0 +1,76 @@
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, cast
+from unittest import mock
+
+import allure
+import pytest
+from _pytest.cacheprovider import Cache
+
+from overhave.pytest_plugin.helpers import FeatureInfoCache
+from overhave.scenario import FeatureInfo, ScenarioParser
+from overhave.storage import FeatureTypeName
+
+_FEATURE_INFO = FeatureInfo(
+    id=1,
+    name="feature",
+    type=FeatureTypeName("feature_type"),
+    tags=["tag"],
+    severity=allure.severity_level.MINOR,
+    author="author",
+    last_edited_by="author",
+    last_edited_at=datetime(2024, 1, 1, 12, 0),
+    tasks=["TASK-1"],
+    scenarios="Scenario: test\n",
+)
+
+
+@pytest.fixture()
+def feature_file(tmp_path: Path) -> Path:
+    feature_file = tmp_path / "feature.feature"
+    feature_file.write_text("Feature: feature")
+    return feature_file
+
+
+@pytest.fixture()
+def scenario_parser() -> mock.MagicMock:
+    parser: mock.MagicMock = mock.create_autospec(ScenarioParser, instance=True)
+    parser.parse.return_value = _FEATURE_INFO
+    parser.fingerprint = "fingerprint"
+    return parser
+
+
+@pytest.fixture()
+def pytest_cache() -> Cache:
+    values: dict[str, Any] = {}
+    cache = mock.create_autospec(Cache, instance=True)
+    cache.get.side_effect = lambda key, default: values.get(key, default)
+    cache.set.side_effect = values.__setitem__
+    return cast(Cache, cache)
+
+
+class TestFeatureInfoCache:
+    """Unit tests for :class:`FeatureInfoCache`."""
+
+    def test_feature_file_is_parsed_once(self, feature_file: Path, scenario_parser: mock.MagicMock) -> None:
+        cache = FeatureInfoCache()
+        feature_info = cache.get(feature_file, scenario_parser=scenario_parser)
+        assert cache.get(feature_file, scenario_parser=scenario_parser) is feature_info
+        scenario_parser.parse.assert_called_once_with("Feature: feature")
+
+    def test_changed_feature_file_is_parsed_again(self, feature_file: Path, scenario_parser: mock.MagicMock) -> None:
+        cache = FeatureInfoCache()
+        cache.get(feature_file, scenario_parser=scenario_parser)
+        mtime_ns = feature_file.stat().st_mtime_ns + 1
+        os.utime(feature_file, ns=(mtime_ns, mtime_ns))
+        cache.get(feature_file, scenario_parser=scenario_parser)
+        assert scenario_parser.parse.call_count == 2
+
+    def test_feature_info_is_shared_by_pytest_cache(
+        self, feature_file: Path, scenario_parser: mock.MagicMock, pytest_cache: Cache
+    ) -> None:
+        FeatureInfoCache().get(feature_file, scenario_parser=scenario_parser, cache=pytest_cache)
+        feature_info = FeatureInfoCache().get(feature_file, scenario_parser=scenario_parser, cache=pytest_cache)
+        assert feature_info == _FEATURE_INFO
+        scenario_parser.parse.assert_called_once()
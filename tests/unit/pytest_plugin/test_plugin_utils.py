@@ -15,6 +15,7 @@ from overhave.pytest_plugin.helpers import (
     add_admin_feature_link_to_report,
     add_scenario_title_to_report,
     add_task_links_to_report,
+    clear_feature_info_cache,
     get_feature_info_from_item,
     get_full_step_name,
     is_pytest_bdd_item,
@@ -22,7 +23,13 @@ from overhave.pytest_plugin.helpers import (
     set_git_project_url_if_necessary,
     set_severity_level,
 )
-from overhave.scenario import EmptyTaskTrackerURLError, OverhaveProjectSettings
+from overhave.scenario import (
+    EmptyTaskTrackerURLError,
+    FeatureInfo,
+    OverhaveProjectSettings,
+    ScenarioParser,
+    save_feature_info,
+)
 
 
 class TestPluginUtils:
@@ -39,6 +46,26 @@ class TestPluginUtils:
     def test_not_pytest_bdd_item(self, test_clean_item: Item) -> None:
         assert not is_pytest_bdd_item(test_clean_item)
 
+    @pytest.mark.parametrize("test_severity", [None], indirect=True)
+    def test_set_feature_info_from_sidecar(
+        self, tmp_path: Path, test_pytest_bdd_scenario: Scenario, test_pytest_bdd_item: Item
+    ) -> None:
+        feature_file = tmp_path / "feature.feature"
+        feature_file.write_text("")
+        feature_info = FeatureInfo(id=1, name="feature", severity=allure.severity_level.MINOR)
+        save_feature_info(feature_info, feature_file=feature_file)
+        setattr(test_pytest_bdd_scenario.feature, "filename", feature_file.as_posix())
+        scenario_parser = mock.create_autospec(ScenarioParser, instance=True)
+        try:
+            set_feature_info_for_item(item=test_pytest_bdd_item, scenario_parser=scenario_parser)
+            item_feature_info = get_feature_info_from_item(test_pytest_bdd_item)
+            set_feature_info_for_item(item=test_pytest_bdd_item, scenario_parser=scenario_parser)
+        finally:
+            clear_feature_info_cache()
+        assert item_feature_info == feature_info
+        assert get_feature_info_from_item(test_pytest_bdd_item) is item_feature_info
+        scenario_parser.parse.assert_not_called()
+
     @pytest.mark.parametrize("tasks_keyword", ["Tasks"])
     @pytest.mark.parametrize("task_tracker_url", ["https://overhave.readthedocs.io/"], indirect=True)
     @pytest.mark.parametrize("test_severity", [allure.severity_level.NORMAL], indirect=True)
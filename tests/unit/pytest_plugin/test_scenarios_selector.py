@@ -0,0 +1,94 @@
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from overhave.entities import get_failed_scenarios
+from overhave.pytest_plugin.plugin import ScenariosSelector
+from overhave.test_execution import SCENARIOS_OPTION, OverhaveTestSettings, PytestRunner, is_selected_scenario
+
+_FEATURE = """Feature: Selection
+  Scenario: First
+    Given step 'first'
+    Given failed step
+
+  Scenario: Second
+    Given step 'second'
+
+  Scenario: Third
+    Given step 'third'
+"""
+
+_TEST_MODULE = """import pathlib
+from pytest_bdd import given, parsers, scenarios
+
+scenarios('selection.feature')
+
+@given(parsers.parse("step '{name}'"))
+def step(name):
+    pathlib.Path(__file__).with_name(f'{name}.done').touch()
+
+@given("failed step")
+def failed_step():
+    assert False
+"""
+
+
+@pytest.fixture()
+def test_file(tmp_path: Path) -> Path:
+    (tmp_path / "selection.feature").write_text(_FEATURE)
+    # Modules are imported by pytest sessions of one process, so their names should be unique
+    path = tmp_path / f"test_{tmp_path.name}.py"
+    path.write_text(_TEST_MODULE)
+    return path
+
+
+class TestScenariosSelector:
+    """Unit tests for :class:`ScenariosSelector`."""
+
+    @pytest.mark.parametrize(
+        ("name", "index", "expected"),
+        [("First", 1, True), ("Second", 2, True), ("Third", 3, False)],
+    )
+    def test_is_selected_scenario(self, name: str, index: int, expected: bool) -> None:
+        assert is_selected_scenario(name=name, index=index, scenarios=["First", "2"]) is expected
+
+    @pytest.mark.parametrize(
+        ("args", "expected_done"),
+        [([], ["first", "third"]), (["-x"], ["first"])],
+    )
+    def test_selected_scenarios_are_run(
+        self, tmp_path: Path, test_file: Path, args: list[str], expected_done: list[str]
+    ) -> None:
+        return_code = pytest.main(
+            [test_file.as_posix(), "-q", "-p", "no:cacheprovider", *args],
+            plugins=[ScenariosSelector(["3", "First"])],
+        )
+        assert return_code == 1
+        assert sorted(x.stem for x in tmp_path.glob("*.done")) == expected_done
+
+    @mock.patch("overhave.pytest_plugin.plugin.get_step_context_runner")
+    def test_failed_scenarios_are_rerun_by_plugin(
+        self, mocked_step_context_runner: mock.MagicMock, tmp_path: Path, test_file: Path
+    ) -> None:
+        args = [test_file.as_posix(), "-q", "-p", "no:cacheprovider", "-p", "overhave.pytest_plugin.plugin"]
+        results_dir = tmp_path / "results"
+        assert pytest.main([*args, f"--alluredir={results_dir}"]) == 1
+        failed_scenarios = get_failed_scenarios(results_dir)
+        assert failed_scenarios == ["First"]
+        for done_file in tmp_path.glob("*.done"):
+            done_file.unlink()
+        assert pytest.main([*args, *(f"{SCENARIOS_OPTION}={name}" for name in failed_scenarios)]) == 1
+        assert [x.stem for x in tmp_path.glob("*.done")] == ["first"]
+
+    def test_runner_passes_selection(self, test_file: Path) -> None:
+        runner = PytestRunner(settings=OverhaveTestSettings())
+        with mock.patch("pytest.main", return_value=0) as pytest_main:
+            runner.run(fixture_file=test_file.as_posix(), alluredir="allure", scenarios=["First", "3"], fail_fast=True)
+        assert pytest_main.call_args.args[0][:5] == [
+            test_file.as_posix(),
+            "--alluredir=allure",
+            "--overhave-scenario=First",
+            "--overhave-scenario=3",
+            "-x",
+        ]
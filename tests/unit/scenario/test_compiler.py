@@ -73,3 +73,13 @@ class TestScenarioCompiler:
         else:
             assert parsed_info.tasks is None
         assert parsed_info.scenarios == test_scenario.text
+
+    @pytest.mark.parametrize("feature_tags", [[], ["tag1", "tag2"]])
+    def test_get_feature_info(
+        self,
+        test_scenario_compiler: ScenarioCompiler,
+        test_scenario_parser: ScenarioParser,
+        test_executor_ctx: TestExecutorContext,
+    ) -> None:
+        feature_txt = test_scenario_compiler.compile(context=test_executor_ctx)
+        assert test_scenario_compiler.get_feature_info(test_executor_ctx) == test_scenario_parser.parse(feature_txt)
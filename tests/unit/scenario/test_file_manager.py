@@ -5,7 +5,13 @@ import pytest
 
 from overhave import OverhaveFileSettings, OverhaveLanguageSettings
 from overhave.entities import FeatureExtractor
-from overhave.scenario import FileManager, OverhaveProjectSettings, ScenarioCompiler
+from overhave.scenario import (
+    FileManager,
+    OverhaveProjectSettings,
+    ScenarioCompiler,
+    get_feature_info_path,
+    load_feature_info,
+)
 from overhave.storage import TestExecutorContext
 
 
@@ -29,6 +35,8 @@ class TestFileManager:
             file_path = Path(tmp_feature_file.name)
             assert file_path.is_relative_to(test_file_settings.tmp_features_dir)
             assert file_path.read_text() == test_scenario_compiler.compile(test_executor_ctx)
+            assert load_feature_info(file_path) == test_scenario_compiler.get_feature_info(test_executor_ctx)
+        assert not get_feature_info_path(file_path).exists()
 
     def test_tmp_fixture_file(
         self,
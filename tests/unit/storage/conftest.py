@@ -0,0 +1,39 @@
+from datetime import timedelta
+from typing import cast
+from unittest import mock
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+
+from overhave.entities import OverhaveTestRunCoalescingSettings
+from overhave.storage import ITestRunStorage, TestRunCoalescingStorage
+
+
+@pytest.fixture()
+def test_run_storage() -> mock.MagicMock:
+    storage: mock.MagicMock = mock.create_autospec(ITestRunStorage, instance=True)
+    storage.create_testrun.return_value = 1
+    return storage
+
+
+@pytest.fixture()
+def coalescing_window(request: FixtureRequest) -> timedelta | None:
+    if hasattr(request, "param"):
+        return cast(timedelta | None, request.param)
+    return timedelta(minutes=1)
+
+
+@pytest.fixture()
+def mocked_redis() -> mock.MagicMock:
+    return mock.MagicMock()
+
+
+@pytest.fixture()
+def test_run_coalescing_storage(
+    coalescing_window: timedelta | None, mocked_redis: mock.MagicMock, test_run_storage: mock.MagicMock
+) -> TestRunCoalescingStorage:
+    return TestRunCoalescingStorage(
+        settings=OverhaveTestRunCoalescingSettings(test_run_coalescing_window=coalescing_window),
+        redis=mocked_redis,
+        test_run_storage=test_run_storage,
+    )
@@ -0,0 +1,90 @@
+from unittest import mock
+
+import pytest
+
+from overhave import db
+from overhave.storage import CoalescedTestRun, TestRunCoalescingStorage
+
+
+class TestTestRunCoalescingStorage:
+    """Unit tests for :class:`TestRunCoalescingStorage`."""
+
+    @pytest.mark.parametrize("coalescing_window", [None], indirect=True)
+    def test_disabled_coalescing(
+        self, test_run_coalescing_storage: TestRunCoalescingStorage, mocked_redis: mock.MagicMock
+    ) -> None:
+        assert test_run_coalescing_storage.get_or_create_testrun(1, "text", "user") == CoalescedTestRun(
+            test_run_id=1, created=True
+        )
+        mocked_redis.set.assert_not_called()
+
+    def test_create_canonical_testrun(
+        self,
+        test_run_coalescing_storage: TestRunCoalescingStorage,
+        mocked_redis: mock.MagicMock,
+        test_run_storage: mock.MagicMock,
+    ) -> None:
+        mocked_redis.set.return_value = True
+        assert test_run_coalescing_storage.get_or_create_testrun(1, "text", "user") == CoalescedTestRun(
+            test_run_id=1, created=True
+        )
+        test_run_storage.create_testrun.assert_called_once_with(
+            scenario_id=1, executed_by="user", scenarios=None, fail_fast=False
+        )
+        key = mocked_redis.set.call_args_list[0].args[0]
+        assert mocked_redis.set.call_args_list == [
+            mock.call(key, b"pending", nx=True, px=60000),
+            mock.call(key, 1, xx=True, px=60000),
+        ]
+
+    def test_attach_to_running_testrun(
+        self,
+        test_run_coalescing_storage: TestRunCoalescingStorage,
+        mocked_redis: mock.MagicMock,
+        test_run_storage: mock.MagicMock,
+    ) -> None:
+        mocked_redis.set.return_value = None
+        mocked_redis.get.return_value = b"5"
+        test_run_storage.get_testrun_model.return_value = mock.MagicMock(id=5, status=db.TestRunStatus.RUNNING)
+        assert test_run_coalescing_storage.get_or_create_testrun(1, "text", "user") == CoalescedTestRun(
+            test_run_id=5, created=False
+        )
+        test_run_storage.create_testrun.assert_not_called()
+
+    def test_replace_finished_testrun(
+        self,
+        test_run_coalescing_storage: TestRunCoalescingStorage,
+        mocked_redis: mock.MagicMock,
+        test_run_storage: mock.MagicMock,
+    ) -> None:
+        mocked_redis.set.side_effect = [None, True, True]
+        mocked_redis.get.return_value = b"5"
+        mocked_redis.pipeline.return_value.__enter__.return_value.get.return_value = b"5"
+        test_run_storage.get_testrun_model.return_value = mock.MagicMock(id=5, status=db.TestRunStatus.SUCCESS)
+        assert test_run_coalescing_storage.get_or_create_testrun(1, "text", "user") == CoalescedTestRun(
+            test_run_id=1, created=True
+        )
+        mocked_redis.pipeline.return_value.__enter__.return_value.delete.assert_called_once()
+
+    def test_different_texts_have_different_keys(
+        self,
+        test_run_coalescing_storage: TestRunCoalescingStorage,
+        mocked_redis: mock.MagicMock,
+        test_run_storage: mock.MagicMock,
+    ) -> None:
+        mocked_redis.set.return_value = True
+        test_run_coalescing_storage.get_or_create_testrun(1, "text", "user")
+        test_run_coalescing_storage.get_or_create_testrun(1, "other text", "user")
+        assert mocked_redis.set.call_args_list[0].args[0] != mocked_redis.set.call_args_list[2].args[0]
+
+    def test_different_selections_have_different_keys(
+        self,
+        test_run_coalescing_storage: TestRunCoalescingStorage,
+        mocked_redis: mock.MagicMock,
+        test_run_storage: mock.MagicMock,
+    ) -> None:
+        mocked_redis.set.return_value = True
+        test_run_coalescing_storage.get_or_create_testrun(1, "text", "user")
+        test_run_coalescing_storage.get_or_create_testrun(1, "text", "user", scenarios=["1"])
+        test_run_coalescing_storage.get_or_create_testrun(1, "text", "user", scenarios=["1"], fail_fast=True)
+        assert len({x.args[0] for x in mocked_redis.set.call_args_list}) == 3
@@ -0,0 +1,170 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import cast
+from unittest import mock
+
+import allure
+import pytest
+import pytz
+from _pytest.fixtures import FixtureRequest
+from faker import Faker
+from pytest_mock import MockFixture
+
+from overhave import OverhaveLanguageSettings, OverhaveScenarioCompilerSettings
+from overhave.db import TestRunStatus
+from overhave.entities import OverhaveFileSettings, ReportManager
+from overhave.metrics import TestRunOverhaveMetricContainer
+from overhave.scenario import FileManager, ScenarioCompiler
+from overhave.storage import (
+    FeatureModel,
+    FeatureTypeModel,
+    ITestRunStorage,
+    ScenarioModel,
+    TestExecutorContext,
+    TestRunModel,
+)
+from overhave.test_execution import (
+    OverhaveTestSettings,
+    PytestRunner,
+    PytestWorkersPlanner,
+    TestExecutor,
+    TestResultMemoizer,
+)
+from overhave.transport import ITaskProducer
+
+
+@pytest.fixture()
+def mocked_test_run_storage(mocker: MockFixture) -> mock.MagicMock:
+    return cast(mock.MagicMock, mocker.create_autospec(ITestRunStorage))
+
+
+@pytest.fixture()
+def mocked_task_producer(mocker: MockFixture) -> mock.MagicMock:
+    return cast(mock.MagicMock, mocker.create_autospec(ITaskProducer))
+
+
+@pytest.fixture()
+def mocked_test_runner(mocker: MockFixture) -> mock.MagicMock:
+    return cast(mock.MagicMock, mocker.create_autospec(PytestRunner))
+
+
+@pytest.fixture()
+def mocked_report_manager(mocker: MockFixture) -> mock.MagicMock:
+    return cast(mock.MagicMock, mocker.create_autospec(ReportManager))
+
+
+@pytest.fixture()
+def shards_count() -> int:
+    return 2
+
+
+@pytest.fixture()
+def mocked_workers_planner(mocker: MockFixture, shards_count: int) -> mock.MagicMock:
+    planner = cast(mock.MagicMock, mocker.create_autospec(PytestWorkersPlanner))
+    planner.get_shards.return_value = shards_count
+    return planner
+
+
+@pytest.fixture()
+def test_executor(
+    mocker: MockFixture,
+    tmp_path: Path,
+    mocked_test_run_storage: mock.MagicMock,
+    mocked_task_producer: mock.MagicMock,
+    mocked_test_runner: mock.MagicMock,
+    mocked_report_manager: mock.MagicMock,
+    mocked_workers_planner: mock.MagicMock,
+) -> TestExecutor:
+    return TestExecutor(
+        file_settings=mocker.create_autospec(OverhaveFileSettings),
+        test_run_storage=mocked_test_run_storage,
+        file_manager=mocker.MagicMock(spec=FileManager),
+        test_runner=mocked_test_runner,
+        report_manager=mocked_report_manager,
+        metric_container=mocker.create_autospec(TestRunOverhaveMetricContainer),
+        workers_planner=mocked_workers_planner,
+        task_producer=mocked_task_producer,
+        shards_results_dir=tmp_path / "shards",
+    )
+
+
+@pytest.fixture()
+def mocked_executor_context(faker: Faker) -> mock.MagicMock:
+    context = mock.MagicMock()
+    context.test_run.id = faker.random_int()
+    context.test_run.status = TestRunStatus.RUNNING
+    context.test_run.scenarios = None
+    context.test_run.fail_fast = False
+    return context
+
+
+@pytest.fixture()
+def memoized_feature_type(request: FixtureRequest) -> str:
+    if hasattr(request, "param"):
+        return cast(str, request.param)
+    return "feature_type"
+
+
+@pytest.fixture()
+def steps_dir(tmp_path: Path, memoized_feature_type: str) -> Path:
+    for module in ("conftest.py", f"{memoized_feature_type}/steps.py", "other_type/steps.py"):
+        path = tmp_path / module
+        path.parent.mkdir(exist_ok=True)
+        path.write_text("")
+    return tmp_path
+
+
+@pytest.fixture()
+def memoizer(steps_dir: Path) -> TestResultMemoizer:
+    return TestResultMemoizer(
+        settings=OverhaveTestSettings(
+            memoization_max_age=timedelta(hours=1), memoization_excluded_feature_types=["excluded_type"]
+        ),
+        scenario_compiler=ScenarioCompiler(
+            compilation_settings=OverhaveScenarioCompilerSettings(),
+            language_settings=OverhaveLanguageSettings(),
+            tasks_keyword=None,
+        ),
+        fixture_content=["{feature_file_path}"],
+        steps_dir=steps_dir,
+    )
+
+
+@pytest.fixture()
+def test_run_time() -> datetime:
+    return datetime(2024, 1, 1, 12, tzinfo=pytz.UTC)
+
+
+@pytest.fixture()
+def test_executor_context(memoized_feature_type: str, test_run_time: datetime) -> TestExecutorContext:
+    return TestExecutorContext(
+        feature=FeatureModel(
+            id=1,
+            created_at=test_run_time,
+            name="feature",
+            author="author",
+            type_id=1,
+            task=[],
+            last_edited_by="author",
+            last_edited_at=test_run_time,
+            released=False,
+            feature_type=FeatureTypeModel(id=1, name=memoized_feature_type),
+            feature_tags=[],
+            file_path="feature",
+            severity=allure.severity_level.NORMAL,
+        ),
+        scenario=ScenarioModel(id=1, feature_id=1, text="Scenario: test\n    Given step"),
+        test_run=TestRunModel(
+            id=1,
+            created_at=test_run_time,
+            scenario_id=1,
+            name="feature",
+            start=test_run_time,
+            end=None,
+            executed_by="executor",
+            status="RUNNING",
+            report_status="EMPTY",
+            report=None,
+            traceback=None,
+        ),
+    )
@@ -0,0 +1,99 @@
+import subprocess  # noqa: S404
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from pytest_bdd import parsers
+
+from overhave.extra import RUSSIAN_PREFIXES
+from overhave.storage import FeatureTypeName
+from overhave.test_execution import (
+    BddStepDefinition,
+    ChangeImpactAnalyzer,
+    GitDiffError,
+    StepCollector,
+    get_changed_files,
+)
+
+_FEATURE_TYPE = FeatureTypeName("feature_type")
+
+_SCENARIOS = {
+    1: "Scenario: login\n    Given user 'admin'\n    When I login\n    Then I see 'index'",
+    2: "Scenario: logout\n    Given user 'admin'\n    When I logout",
+    3: "Scenario: unknown\n    Given user 'admin'\n    And something unknown",
+    4: "Сценарий: выход\n    Дано пользователь 'admin'\n    Когда I logout",
+}
+
+
+@pytest.fixture()
+def steps_dir(tmp_path: Path) -> Path:
+    steps_dir = tmp_path / "steps"
+    steps_dir.mkdir()
+    return steps_dir
+
+
+@pytest.fixture()
+def analyzer(steps_dir: Path) -> ChangeImpactAnalyzer:
+    definitions = [
+        BddStepDefinition(type="given", parser=parsers.parse("user '{name}'"), module_path=steps_dir / "users.py"),
+        BddStepDefinition(
+            type="given", parser=parsers.parse("пользователь '{name}'"), module_path=steps_dir / "users.py"
+        ),
+        BddStepDefinition(type="when", parser=parsers.parse("I login"), module_path=steps_dir / "auth.py"),
+        BddStepDefinition(type="when", parser=parsers.parse("I logout"), module_path=steps_dir / "auth.py"),
+        BddStepDefinition(type="then", parser=parsers.parse("I see '{page}'"), module_path=steps_dir / "pages.py"),
+    ]
+    step_collector = mock.create_autospec(StepCollector, instance=True)
+    step_collector.get_step_definitions.return_value = definitions
+    step_collector.step_modules = {x.module_path for x in definitions}
+    return ChangeImpactAnalyzer(step_collector=step_collector, step_prefixes=RUSSIAN_PREFIXES, steps_dir=steps_dir)
+
+
+class TestChangeImpactAnalyzer:
+    """Unit tests for :class:`ChangeImpactAnalyzer`."""
+
+    def test_build_index(self, analyzer: ChangeImpactAnalyzer, steps_dir: Path) -> None:
+        index = analyzer.build_index(feature_type=_FEATURE_TYPE, scenarios=_SCENARIOS)
+        assert index.modules == {
+            steps_dir / "users.py": {1, 2, 3, 4},
+            steps_dir / "auth.py": {1, 2, 4},
+            steps_dir / "pages.py": {1},
+        }
+        assert index.unresolved == {3}
+
+    @pytest.mark.parametrize(
+        ("changed_modules", "expected_features"),
+        [
+            (["pages.py"], {1, 3}),
+            (["auth.py"], {1, 2, 3, 4}),
+            (["helpers.py"], {1, 2, 3, 4}),
+            (["README.md"], set()),
+        ],
+    )
+    def test_get_impacted_features(
+        self,
+        analyzer: ChangeImpactAnalyzer,
+        steps_dir: Path,
+        changed_modules: list[str],
+        expected_features: set[int],
+    ) -> None:
+        impacted = analyzer.get_impacted_features(
+            feature_type=_FEATURE_TYPE,
+            scenarios=_SCENARIOS,
+            changed_files=[steps_dir / x for x in changed_modules],
+        )
+        assert impacted == expected_features
+
+    def test_get_changed_files(self, steps_dir: Path) -> None:
+        repository_dir = steps_dir.parent
+        for args in (["init", "-q"], ["config", "user.email", "user@overhave.dev"], ["config", "user.name", "user"]):
+            subprocess.run(["git", *args], cwd=repository_dir, check=True)  # noqa: S603, S607
+        (steps_dir / "auth.py").write_text("")
+        (repository_dir / "README.md").write_text("")
+        subprocess.run(["git", "add", "."], cwd=repository_dir, check=True)  # noqa: S603, S607
+        subprocess.run(["git", "commit", "-q", "-m", "init"], cwd=repository_dir, check=True)  # noqa: S603, S607
+        (steps_dir / "auth.py").write_text("# changed")
+        (repository_dir / "README.md").write_text("changed")
+        assert get_changed_files("HEAD", steps_dir=steps_dir) == [(steps_dir / "auth.py").resolve()]
+        with pytest.raises(GitDiffError):
+            get_changed_files("unknown..HEAD", steps_dir=steps_dir)
@@ -0,0 +1,156 @@
+import json
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from overhave.db import TestReportStatus, TestRunStatus
+from overhave.storage import TestRunResultModel
+from overhave.test_execution import PytestProcessResult, PytestShard, TestExecutor
+from overhave.transport import RedisMessageFormat, TestRunData, TestRunPriority, TestRunTask
+from overhave.transport.objects import RedisUnreadData
+
+
+def _write_result(alluredir: str, name: str, status: str) -> None:
+    Path(alluredir, f"{name}-result.json").write_text(json.dumps({"name": name, "status": status}))
+
+
+class TestTestExecutorSharding:
+    """Unit tests for sharding of test runs by :class:`TestExecutor`."""
+
+    def test_shard(
+        self,
+        test_executor: TestExecutor,
+        mocked_executor_context: mock.MagicMock,
+        mocked_test_run_storage: mock.MagicMock,
+        mocked_task_producer: mock.MagicMock,
+        shards_count: int,
+    ) -> None:
+        mocked_test_run_storage.start_sharding.return_value = True
+        mocked_task_producer.add_tasks.return_value = [True] * shards_count
+        assert test_executor._shard(mocked_executor_context, priority=TestRunPriority.BULK)
+        tasks = mocked_task_producer.add_tasks.call_args.args[0]
+        assert [(task.data.shard.index, task.data.shard.count) for task in tasks] == [(0, 2), (1, 2)]
+        assert all(task.data.test_run_id == mocked_executor_context.test_run.id for task in tasks)
+        mocked_test_run_storage.finish_run.assert_not_called()
+
+    @pytest.mark.parametrize("message_format", list(RedisMessageFormat))
+    def test_decoded_bulk_task_is_sharded_as_bulk(
+        self,
+        test_executor: TestExecutor,
+        mocked_executor_context: mock.MagicMock,
+        mocked_test_run_storage: mock.MagicMock,
+        mocked_task_producer: mock.MagicMock,
+        shards_count: int,
+        message_format: RedisMessageFormat,
+    ) -> None:
+        mocked_test_run_storage.start_run.return_value = True
+        mocked_test_run_storage.executor_context_by_id.return_value = mocked_executor_context
+        mocked_test_run_storage.start_sharding.return_value = True
+        mocked_task_producer.add_tasks.return_value = [True] * shards_count
+        task = TestRunTask(
+            data=TestRunData(test_run_id=mocked_executor_context.test_run.id), priority=TestRunPriority.BULK
+        )
+        data = RedisUnreadData(message_id=b"1-0", message=task.get_message(message_format), stream_key="test-bulk")
+        decoded_task = data.decode_task()
+        assert isinstance(decoded_task, TestRunTask)
+        with mock.patch("overhave.test_execution.executor.db.create_session"):
+            test_executor.process_test_task(decoded_task)
+        tasks = mocked_task_producer.add_tasks.call_args.args[0]
+        assert len(tasks) == shards_count
+        assert all(task.priority is TestRunPriority.BULK for task in tasks)
+
+    def test_shard_skips_sharded_run(
+        self,
+        test_executor: TestExecutor,
+        mocked_executor_context: mock.MagicMock,
+        mocked_test_run_storage: mock.MagicMock,
+        mocked_task_producer: mock.MagicMock,
+    ) -> None:
+        mocked_test_run_storage.start_sharding.return_value = False
+        assert test_executor._shard(mocked_executor_context, priority=TestRunPriority.BULK)
+        mocked_task_producer.add_tasks.assert_not_called()
+
+    def test_shard_producer_failure(
+        self,
+        test_executor: TestExecutor,
+        mocked_executor_context: mock.MagicMock,
+        mocked_test_run_storage: mock.MagicMock,
+        mocked_task_producer: mock.MagicMock,
+    ) -> None:
+        mocked_test_run_storage.start_sharding.return_value = True
+        mocked_task_producer.add_tasks.return_value = [True, False]
+        assert test_executor._shard(mocked_executor_context, priority=TestRunPriority.BULK)
+        finish_kwargs = mocked_test_run_storage.finish_run.call_args.kwargs
+        assert finish_kwargs["run_id"] == mocked_executor_context.test_run.id
+        assert finish_kwargs["result"].status is TestRunStatus.INTERNAL_ERROR
+
+    @pytest.mark.parametrize("shards_count", [0])
+    def test_shard_skips_small_run(
+        self,
+        test_executor: TestExecutor,
+        mocked_executor_context: mock.MagicMock,
+        mocked_test_run_storage: mock.MagicMock,
+    ) -> None:
+        assert not test_executor._shard(mocked_executor_context, priority=TestRunPriority.BULK)
+        mocked_test_run_storage.start_sharding.assert_not_called()
+
+    def test_last_shard_merges_results(
+        self,
+        tmp_path: Path,
+        test_executor: TestExecutor,
+        mocked_executor_context: mock.MagicMock,
+        mocked_test_run_storage: mock.MagicMock,
+        mocked_test_runner: mock.MagicMock,
+        mocked_report_manager: mock.MagicMock,
+    ) -> None:
+        merged_results: list[list[str]] = []
+
+        def _run(alluredir: str, shard: PytestShard, **kwargs: Any) -> PytestProcessResult:
+            if shard.index == 0:
+                _write_result(alluredir, name="First", status="passed")
+                return PytestProcessResult(return_code=0)
+            _write_result(alluredir, name="Second", status="failed")
+            return PytestProcessResult(return_code=1)
+
+        def _generate_report(results_dir: Path) -> str:
+            merged_results.append(sorted(x.name for x in results_dir.iterdir()))
+            return "report"
+
+        mocked_test_runner.run.side_effect = _run
+        mocked_report_manager.generate_allure_report.side_effect = _generate_report
+        mocked_test_run_storage.executor_context_by_id.return_value = mocked_executor_context
+        mocked_test_run_storage.finish_shard.side_effect = [None, TestRunStatus.FAILED]
+        mocked_test_run_storage.finish_run.return_value = True
+        test_run_id = mocked_executor_context.test_run.id
+
+        with mock.patch("overhave.test_execution.executor.db.create_session"):
+            test_executor._execute_shard(test_run_id, shard=PytestShard(index=0, count=2))
+            mocked_test_run_storage.finish_run.assert_not_called()
+            test_executor._execute_shard(test_run_id, shard=PytestShard(index=1, count=2))
+
+        assert [call.kwargs["failed"] for call in mocked_test_run_storage.finish_shard.call_args_list] == [False, True]
+        assert merged_results == [["First-result.json", "Second-result.json"]]
+        assert mocked_test_run_storage.finish_run.call_args.kwargs["result"] == TestRunResultModel(
+            status=TestRunStatus.FAILED,
+            report_status=TestReportStatus.GENERATED,
+            report="report",
+            failed_scenarios=["Second"],
+            traceback="Test run failed!",
+        )
+        assert not (tmp_path / "shards" / f"test-run-{test_run_id}").exists()
+
+    def test_shard_of_finished_run_is_skipped(
+        self,
+        test_executor: TestExecutor,
+        mocked_executor_context: mock.MagicMock,
+        mocked_test_run_storage: mock.MagicMock,
+        mocked_test_runner: mock.MagicMock,
+    ) -> None:
+        mocked_executor_context.test_run.status = TestRunStatus.FAILED
+        mocked_test_run_storage.executor_context_by_id.return_value = mocked_executor_context
+        with mock.patch("overhave.test_execution.executor.db.create_session"):
+            test_executor._execute_shard(mocked_executor_context.test_run.id, shard=PytestShard(index=0, count=2))
+        mocked_test_runner.run.assert_not_called()
+        mocked_test_run_storage.finish_shard.assert_not_called()
@@ -0,0 +1,53 @@
+import os
+import resource
+import signal
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from overhave.test_execution import OverhaveTestSettings, run_forked
+
+_TEST_MODULE = """
+import time
+
+def test_allocate():
+    data = bytearray({size})
+
+def test_sleep():
+    time.sleep({sleep})
+"""
+
+
+def _write_test_module(tmp_path: Path, size: int = 1024, sleep: float = 0) -> str:
+    path = tmp_path / "test_isolated.py"
+    path.write_text(_TEST_MODULE.format(size=size, sleep=sleep))
+    return path.as_posix()
+
+
+def _get_address_space() -> int:
+    return int(Path("/proc/self/statm").read_text().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+
+
+class TestRunForked:
+    """Unit tests for :func:`run_forked`."""
+
+    def test_resource_usage(self, tmp_path: Path) -> None:
+        result = run_forked([_write_test_module(tmp_path), "-q", "-p", "no:cacheprovider"], OverhaveTestSettings())
+        assert result.return_code == 0
+        assert result.peak_rss
+        assert result.cpu_time
+        assert not result.timed_out
+
+    def test_memory_limit(self, tmp_path: Path) -> None:
+        if resource.getrlimit(resource.RLIMIT_AS)[1] != resource.RLIM_INFINITY:
+            pytest.skip("Address space of process is already limited")
+        settings = OverhaveTestSettings(isolation_memory_limit=_get_address_space() + 256 * 1024**2)
+        args = [_write_test_module(tmp_path, size=1024**3), "-q", "-p", "no:cacheprovider"]
+        assert run_forked(args, settings).return_code == 1
+
+    def test_timeout(self, tmp_path: Path) -> None:
+        settings = OverhaveTestSettings(isolation_timeout=timedelta(milliseconds=500))
+        result = run_forked([_write_test_module(tmp_path, sleep=10), "-q", "-p", "no:cacheprovider"], settings)
+        assert result.timed_out
+        assert result.killed_by is signal.SIGKILL
@@ -0,0 +1,52 @@
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from overhave.storage import ScenarioModel, TestExecutorContext
+from overhave.test_execution import TestResultMemoizer
+
+
+class TestTestResultMemoizer:
+    """Unit tests for :class:`TestResultMemoizer`."""
+
+    def test_max_age(self, memoizer: TestResultMemoizer) -> None:
+        assert memoizer.max_age == timedelta(hours=1)
+
+    def test_key_does_not_depend_on_executor(
+        self, memoizer: TestResultMemoizer, test_executor_context: TestExecutorContext
+    ) -> None:
+        test_run = test_executor_context.test_run.model_copy(update={"executed_by": "other"})
+        assert memoizer.get_key(test_executor_context.model_copy(update={"test_run": test_run})) == memoizer.get_key(
+            test_executor_context
+        )
+
+    def test_key_depends_on_scenario_text(
+        self, memoizer: TestResultMemoizer, test_executor_context: TestExecutorContext
+    ) -> None:
+        scenario = ScenarioModel(id=1, feature_id=1, text="Scenario: test\n    When step")
+        assert memoizer.get_key(test_executor_context.model_copy(update={"scenario": scenario})) != memoizer.get_key(
+            test_executor_context
+        )
+
+    @pytest.mark.parametrize(
+        ("module", "changed"),
+        [("conftest.py", True), ("feature_type/steps.py", True), ("other_type/steps.py", False)],
+    )
+    def test_key_depends_on_steps_modules(
+        self,
+        memoizer: TestResultMemoizer,
+        test_executor_context: TestExecutorContext,
+        steps_dir: Path,
+        module: str,
+        changed: bool,
+    ) -> None:
+        key = memoizer.get_key(test_executor_context)
+        (steps_dir / module).write_text("# changed")
+        assert (memoizer.get_key(test_executor_context) != key) is changed
+
+    @pytest.mark.parametrize("memoized_feature_type", ["excluded_type"], indirect=True)
+    def test_excluded_feature_type(
+        self, memoizer: TestResultMemoizer, test_executor_context: TestExecutorContext
+    ) -> None:
+        assert memoizer.get_key(test_executor_context) is None
@@ -0,0 +1,47 @@
+import os
+import time
+from pathlib import Path
+from typing import cast
+from unittest import mock
+
+from overhave.test_execution import ITestExecutor, TestRunProcessPool
+
+
+class _FileTestExecutor:
+    def __init__(self, results_dir: Path) -> None:
+        self._results_dir = results_dir
+
+    def execute_test(self, test_run_id: int) -> None:
+        time.sleep(0.1)
+        (self._results_dir / f"{test_run_id}-{os.getpid()}").touch()
+
+
+class TestTestRunProcessPool:
+    """Unit tests for :class:`TestRunProcessPool`."""
+
+    def test_every_run_is_executed_in_own_process(self, tmp_path: Path) -> None:
+        pool = TestRunProcessPool(processes=2, executor_getter=lambda: cast(ITestExecutor, _FileTestExecutor(tmp_path)))
+        try:
+            for test_run_id in range(1, 5):
+                pool.submit(test_run_id)
+            queue = pool.queue
+            assert queue.running == [1, 2]
+            assert queue.waiting == [3, 4]
+            deadline = time.monotonic() + 30
+            while (pool.queue.running or pool.queue.waiting) and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            pool.close()
+        results = [x.name.split("-") for x in tmp_path.iterdir()]
+        assert sorted(int(test_run_id) for test_run_id, _ in results) == [1, 2, 3, 4]
+        assert len({pid for _, pid in results} | {str(os.getpid())}) == 5
+
+    def test_pool_is_closed_at_exit(self, tmp_path: Path) -> None:
+        pool = TestRunProcessPool(processes=1, executor_getter=lambda: cast(ITestExecutor, _FileTestExecutor(tmp_path)))
+        with mock.patch("overhave.test_execution.process_pool.atexit") as mocked_atexit:
+            pool.submit(1)
+            mocked_atexit.register.assert_called_once_with(pool.close)
+            pool.close()
+            mocked_atexit.unregister.assert_called_once_with(pool.close)
+        assert pool.queue.running == []
+        assert [x.name.split("-")[0] for x in tmp_path.iterdir()] == ["1"]
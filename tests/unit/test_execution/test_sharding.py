@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import pytest
+
+from overhave.test_execution import OverhaveTestSettings, PytestRunner, PytestShard, PytestWorkersPlanner
+
+_SCENARIOS_TEXT = "\n".join(f"Scenario: scenario {x}\n    Given step" for x in range(10))
+
+
+class TestPytestShard:
+    """Unit tests for :class:`PytestShard`."""
+
+    def test_parse(self) -> None:
+        shard = PytestShard.parse("1/3")
+        assert shard == PytestShard(index=1, count=3)
+        assert str(shard) == "1/3"
+
+    @pytest.mark.parametrize("value", ["3/3", "-1/2"])
+    def test_parse_incorrect(self, value: str) -> None:
+        with pytest.raises(ValueError, match="Shard index"):
+            PytestShard.parse(value)
+
+    def test_select(self) -> None:
+        selected, deselected = PytestShard(index=1, count=3).select(list(range(8)))
+        assert selected == [1, 4, 7]
+        assert deselected == [0, 2, 3, 5, 6]
+
+    @pytest.mark.parametrize(("shards_max", "expected_shards"), [(1, 0), (4, 2)])
+    def test_get_shards(self, shards_max: int, expected_shards: int) -> None:
+        planner = PytestWorkersPlanner(
+            settings=OverhaveTestSettings(shards_max=shards_max, shard_min_tests=5), step_prefixes=None
+        )
+        assert planner.get_shards(_SCENARIOS_TEXT) == expected_shards
+
+    def test_runner_runs_only_shard_tests(self, tmp_path: Path) -> None:
+        test_file = tmp_path / "test_sharded.py"
+        test_file.write_text(
+            "import pathlib\n\n"
+            + "".join(
+                f"def test_{x}():\n    pathlib.Path(__file__).with_name('test_{x}.done').touch()\n\n" for x in range(5)
+            )
+        )
+        runner = PytestRunner(
+            settings=OverhaveTestSettings(
+                default_pytest_addoptions="-q -p overhave.pytest_plugin.plugin -p no:cacheprovider"
+            )
+        )
+        result = runner.run(
+            fixture_file=test_file.as_posix(),
+            alluredir=(tmp_path / "allure").as_posix(),
+            shard=PytestShard(index=0, count=2),
+        )
+        assert result.return_code == 0
+        assert sorted(x.stem for x in tmp_path.glob("*.done")) == ["test_0", "test_2", "test_4"]
@@ -0,0 +1,40 @@
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from overhave.test_execution import OverhaveTestSettings, PytestProcessResult, PytestRunner, PytestWorkerPool
+
+
+@pytest.fixture()
+def test_file(tmp_path: Path) -> Path:
+    path = tmp_path / "test_forked.py"
+    path.write_text(
+        "import os\n\ndef test_ok():\n    pass\n\ndef test_failed():\n    assert os.environ['RESULT'] == 'ok'\n"
+    )
+    return path
+
+
+class TestPytestWorkerPool:
+    """Unit tests for :class:`PytestWorkerPool`."""
+
+    @pytest.mark.parametrize(("result", "expected_code"), [("ok", 0), ("fail", 1)])
+    def test_run_in_forked_child(
+        self, monkeypatch: pytest.MonkeyPatch, test_file: Path, result: str, expected_code: int
+    ) -> None:
+        monkeypatch.setenv("RESULT", result)
+        worker_pool = PytestWorkerPool(settings=OverhaveTestSettings(prefork_workers=1, prefork_max_runs_per_worker=1))
+        with mock.patch("overhave.test_execution.worker_pool._warm_up_worker"):
+            try:
+                args = [test_file.as_posix(), "-q", "-p", "no:cacheprovider"]
+                assert worker_pool.run(args).return_code == expected_code
+                assert worker_pool.run(args).return_code == expected_code
+            finally:
+                worker_pool.close()
+
+    def test_runner_uses_worker_pool(self, test_file: Path) -> None:
+        worker_pool: mock.MagicMock = mock.create_autospec(PytestWorkerPool, instance=True)
+        worker_pool.run.return_value = PytestProcessResult(return_code=0)
+        runner = PytestRunner(settings=OverhaveTestSettings(), worker_pool=worker_pool)
+        assert runner.run(fixture_file=test_file.as_posix(), alluredir="allure").return_code == 0
+        assert worker_pool.run.call_args.args[0][:2] == [test_file.as_posix(), "--alluredir=allure"]
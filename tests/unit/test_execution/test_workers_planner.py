@@ -0,0 +1,76 @@
+from unittest import mock
+
+import pytest
+
+from overhave.extra import RUSSIAN_PREFIXES
+from overhave.test_execution import OverhaveTestSettings, PytestWorkersPlanner
+
+_SCENARIO_TEXT = """
+Scenario: first
+    Given step
+
+Scenario Outline: second
+    Given step with <value>
+
+    Examples:
+    | value |
+    | 1     |
+    | 2     |
+
+    Examples:
+    | value |
+    | 3     |
+
+Scenario Outline: without examples
+    Given step with table
+    | value |
+    | 1     |
+"""
+
+_RUSSIAN_SCENARIO_TEXT = """
+Сценарий: первый
+    Дано шаг
+
+Структура сценария: второй
+    Дано шаг с <value>
+
+    Примеры:
+    | value |
+    | 1     |
+    | 2     |
+"""
+
+
+class TestPytestWorkersPlanner:
+    """Unit tests for :class:`PytestWorkersPlanner`."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected_count"), [(_SCENARIO_TEXT, 5), (_RUSSIAN_SCENARIO_TEXT, 3), ("Feature: empty", 0)]
+    )
+    def test_count_tests(self, text: str, expected_count: int) -> None:
+        planner = PytestWorkersPlanner(settings=OverhaveTestSettings(), step_prefixes=RUSSIAN_PREFIXES)
+        assert planner.count_tests(text) == expected_count
+
+    @pytest.mark.parametrize(
+        ("texts", "load", "expected_workers"),
+        [
+            ([_SCENARIO_TEXT], 0.0, 0),
+            ([_SCENARIO_TEXT] * 4, 0.0, 5),
+            ([_SCENARIO_TEXT] * 20, 0.0, 6),
+            ([_SCENARIO_TEXT] * 20, 5.5, 3),
+            ([_SCENARIO_TEXT] * 20, 7.0, 0),
+        ],
+    )
+    def test_adaptive_workers(self, texts: list[str], load: float, expected_workers: int) -> None:
+        planner = PytestWorkersPlanner(
+            settings=OverhaveTestSettings(adaptive_workers=True, adaptive_workers_max=6), step_prefixes=None
+        )
+        with (
+            mock.patch("os.cpu_count", return_value=8),
+            mock.patch("os.getloadavg", return_value=(load, load, load)),
+        ):
+            assert planner.get_workers(texts) == expected_workers
+
+    def test_fixed_workers(self) -> None:
+        planner = PytestWorkersPlanner(settings=OverhaveTestSettings(workers=3), step_prefixes=None)
+        assert planner.get_workers([_SCENARIO_TEXT]) == 3
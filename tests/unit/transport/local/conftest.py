@@ -0,0 +1,80 @@
+import pytest
+from _pytest.fixtures import FixtureRequest
+
+from overhave.metrics import BaseOverhaveMetricContainer
+from overhave.transport import (
+    BaseRedisTask,
+    LocalConsumer,
+    LocalProducer,
+    LocalStreamBroker,
+    OverhaveLocalTransportSettings,
+    OverhaveRedisSettings,
+    PublicationTask,
+    RedisLanesConsumer,
+    RedisStream,
+    TestRunTask,
+)
+
+
+@pytest.fixture()
+def local_broker() -> LocalStreamBroker:
+    return LocalStreamBroker(settings=OverhaveLocalTransportSettings(enabled=True, database=":memory:"))
+
+
+@pytest.fixture()
+def stream_settings(request: FixtureRequest) -> OverhaveRedisSettings:
+    if hasattr(request, "param"):
+        return OverhaveRedisSettings(consumer_name="consumer", **request.param)
+    return OverhaveRedisSettings(consumer_name="consumer")
+
+
+@pytest.fixture()
+def local_producer(
+    local_broker: LocalStreamBroker, base_container: BaseOverhaveMetricContainer, stream_settings: OverhaveRedisSettings
+) -> LocalProducer:
+    mapping: dict[type[BaseRedisTask], RedisStream] = {
+        TestRunTask: RedisStream.TEST,
+        PublicationTask: RedisStream.PUBLICATION,
+    }
+    return LocalProducer(
+        settings=stream_settings, mapping=mapping, broker=local_broker, metric_container=base_container
+    )
+
+
+@pytest.fixture()
+def local_consumer(
+    local_broker: LocalStreamBroker, base_container: BaseOverhaveMetricContainer, stream_settings: OverhaveRedisSettings
+) -> LocalConsumer:
+    return LocalConsumer(
+        settings=stream_settings, stream_name=RedisStream.TEST, broker=local_broker, metric_container=base_container
+    )
+
+
+@pytest.fixture()
+def other_local_consumer(
+    local_broker: LocalStreamBroker, base_container: BaseOverhaveMetricContainer, stream_settings: OverhaveRedisSettings
+) -> LocalConsumer:
+    return LocalConsumer(
+        settings=stream_settings.model_copy(update={"consumer_name": "other"}),
+        stream_name=RedisStream.TEST,
+        broker=local_broker,
+        metric_container=base_container,
+    )
+
+
+@pytest.fixture()
+def local_lanes_consumer(
+    local_broker: LocalStreamBroker, base_container: BaseOverhaveMetricContainer, stream_settings: OverhaveRedisSettings
+) -> RedisLanesConsumer:
+    lane_weights = stream_settings.get_lane_weights(RedisStream.TEST)
+    consumers = [
+        LocalConsumer(
+            settings=stream_settings,
+            stream_name=RedisStream.TEST,
+            broker=local_broker,
+            metric_container=base_container,
+            stream_key=stream_key,
+        )
+        for stream_key in lane_weights
+    ]
+    return RedisLanesConsumer(consumers=consumers, weights=list(lane_weights.values()))
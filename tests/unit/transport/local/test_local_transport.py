@@ -0,0 +1,101 @@
+from datetime import timedelta
+
+import pytest
+
+from overhave.metrics import BaseOverhaveMetricContainer
+from overhave.transport import (
+    LocalConsumer,
+    LocalProducer,
+    LocalStreamBroker,
+    RedisDeliveryMode,
+    RedisLanesConsumer,
+    RedisStream,
+    TestRunData,
+    TestRunPriority,
+    TestRunTask,
+)
+
+
+class TestLocalTransport:
+    """Unit tests for :class:`LocalProducer`, :class:`LocalConsumer` and :class:`LocalStreamBroker`."""
+
+    def test_produce_and_consume(
+        self,
+        local_broker: LocalStreamBroker,
+        base_container: BaseOverhaveMetricContainer,
+        local_producer: LocalProducer,
+        local_consumer: LocalConsumer,
+    ) -> None:
+        with local_consumer:
+            tasks = [TestRunTask(data=TestRunData(test_run_id=x)) for x in range(3)]
+            assert local_producer.add_tasks(tasks) == [True] * 3
+            assert [x.decode_task() for x in local_consumer.read(count=5)] == tasks
+            assert local_consumer.read(block=False) == []
+        assert local_broker.length(RedisStream.TEST) == 0
+        assert base_container.produced_redis_tasks.labels(task_type="test")._value.get() == 3
+        assert base_container.consumed_redis_tasks.labels(task_type="test")._value.get() == 3
+
+    def test_consumer_groups_read_the_same_entries(
+        self,
+        local_broker: LocalStreamBroker,
+        local_producer: LocalProducer,
+        local_consumer: LocalConsumer,
+        other_local_consumer: LocalConsumer,
+    ) -> None:
+        with local_consumer, other_local_consumer:
+            local_producer.add_task(TestRunTask(data=TestRunData(test_run_id=1)))
+            assert len(local_consumer.read(block=False)) == 1
+            assert other_local_consumer.read(block=False) == []
+        local_broker.create_group(RedisStream.TEST, "cg-other")
+        assert local_broker.read_group(RedisStream.TEST, "cg-other", "consumer", count=1) == []
+
+    @pytest.mark.parametrize(
+        "stream_settings",
+        [
+            {
+                "delivery_mode": RedisDeliveryMode.AT_LEAST_ONCE,
+                "reclaim_idle_time": timedelta(0),
+                "reclaim_interval": timedelta(0),
+                "max_deliveries": 2,
+            }
+        ],
+        indirect=True,
+    )
+    def test_reclaim_and_dead_letter(
+        self,
+        local_broker: LocalStreamBroker,
+        base_container: BaseOverhaveMetricContainer,
+        local_producer: LocalProducer,
+        local_consumer: LocalConsumer,
+        other_local_consumer: LocalConsumer,
+    ) -> None:
+        with local_consumer, other_local_consumer:
+            task = TestRunTask(data=TestRunData(test_run_id=1))
+            local_producer.add_task(task)
+            assert [x.decode_task() for x in local_consumer.read(block=False)] == [task]
+            reclaimed = other_local_consumer.read(block=False)
+            assert [x.decode_task() for x in reclaimed] == [task]
+            assert other_local_consumer.read(block=False) == []
+        assert local_broker.length(f"{RedisStream.TEST}-dead-letter") == 1
+        assert local_broker.pending_count(RedisStream.TEST, "cg-test") == 0
+        assert base_container.dead_letter_redis_tasks.labels(task_type="test")._value.get() == 1
+
+    @pytest.mark.parametrize("stream_settings", [{"delivery_mode": RedisDeliveryMode.AT_LEAST_ONCE}], indirect=True)
+    def test_acknowledge_after_processing(
+        self, local_broker: LocalStreamBroker, local_producer: LocalProducer, local_consumer: LocalConsumer
+    ) -> None:
+        with local_consumer:
+            local_producer.add_task(TestRunTask(data=TestRunData(test_run_id=1)))
+            messages = local_consumer.read(block=False)
+            assert local_broker.pending_count(RedisStream.TEST, "cg-test", consumer="consumer") == 1
+            local_consumer.acknowledge(messages[0])
+        assert local_broker.pending_count(RedisStream.TEST, "cg-test") == 0
+        assert local_broker.length(RedisStream.TEST) == 0
+
+    def test_priority_lanes(self, local_producer: LocalProducer, local_lanes_consumer: RedisLanesConsumer) -> None:
+        with local_lanes_consumer:
+            local_producer.add_task(TestRunTask(data=TestRunData(test_run_id=1), priority=TestRunPriority.BULK))
+            local_producer.add_task(TestRunTask(data=TestRunData(test_run_id=2)))
+            messages = [local_lanes_consumer.read(block=False)[0] for _ in range(2)]
+        assert [x.decoded_message["data"]["test_run_id"] for x in messages] == [2, 1]
+        assert [x.stream_key for x in messages] == ["test", "test-bulk"]
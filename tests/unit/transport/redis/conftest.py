@@ -0,0 +1,107 @@
+from typing import Any, cast
+from unittest import mock
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+
+from overhave.metrics import BaseOverhaveMetricContainer
+from overhave.transport import (
+    OverhaveRedisSettings,
+    RedisAdmissionController,
+    RedisConsumer,
+    RedisLanesConsumer,
+    RedisStream,
+    TestRunData,
+    TestRunTask,
+)
+from overhave.transport.objects import RedisUnreadData
+
+
+@pytest.fixture()
+def test_run_messages_count(request: FixtureRequest) -> int:
+    if hasattr(request, "param"):
+        return cast(int, request.param)
+    return 3
+
+
+@pytest.fixture()
+def test_run_messages(test_run_messages_count: int) -> list[RedisUnreadData]:
+    return [
+        RedisUnreadData(
+            message_id=f"{test_run_id + 1}-0".encode(),
+            message=TestRunTask(data=TestRunData(test_run_id=test_run_id)).message,
+        )
+        for test_run_id in range(test_run_messages_count)
+    ]
+
+
+@pytest.fixture()
+def mocked_redis_consumer() -> mock.MagicMock:
+    consumer: mock.MagicMock = mock.create_autospec(RedisConsumer, instance=True)
+    consumer.stream_name = RedisStream.TEST
+    return consumer
+
+
+@pytest.fixture()
+def admission_settings(request: FixtureRequest) -> OverhaveRedisSettings:
+    if hasattr(request, "param"):
+        return OverhaveRedisSettings(**request.param)
+    return OverhaveRedisSettings()
+
+
+@pytest.fixture()
+def consumer_groups(request: FixtureRequest) -> list[dict[str, Any]]:
+    groups: list[tuple[int | None, int, int | None]] = [(3, 2, 10)]
+    if hasattr(request, "param"):
+        groups = request.param
+    return [
+        {"name": "cg-test", "pending": pending, "lag": lag, "entries-read": entries_read}
+        for lag, pending, entries_read in groups
+    ]
+
+
+@pytest.fixture()
+def mocked_redis_database(consumer_groups: list[dict[str, Any]]) -> mock.MagicMock:
+    database = mock.MagicMock()
+    database.xinfo_groups.return_value = consumer_groups
+    database.xlen.return_value = 20
+    return database
+
+
+@pytest.fixture()
+def admission_controller(
+    admission_settings: OverhaveRedisSettings,
+    mocked_redis_database: mock.MagicMock,
+    base_container: BaseOverhaveMetricContainer,
+) -> RedisAdmissionController:
+    return RedisAdmissionController(
+        settings=admission_settings,
+        task_type=RedisStream.TEST.value,
+        streams=[RedisStream.TEST.value],
+        database=mocked_redis_database,
+        metric_container=base_container,
+    )
+
+
+@pytest.fixture()
+def lane_messages(request: FixtureRequest) -> dict[str, list[RedisUnreadData]]:
+    if hasattr(request, "param"):
+        return cast(dict[str, list[RedisUnreadData]], request.param)
+    return {"test": [], "test-bulk": []}
+
+
+@pytest.fixture()
+def lane_consumers(lane_messages: dict[str, list[RedisUnreadData]]) -> list[mock.MagicMock]:
+    consumers: list[mock.MagicMock] = []
+    for stream_key, messages in lane_messages.items():
+        consumer = mock.create_autospec(RedisConsumer, instance=True)
+        consumer.stream_key = stream_key
+        consumer.stream_name = RedisStream.TEST
+        consumer.read.return_value = messages
+        consumers.append(consumer)
+    return consumers
+
+
+@pytest.fixture()
+def lanes_consumer(lane_consumers: list[mock.MagicMock]) -> RedisLanesConsumer:
+    return RedisLanesConsumer(consumers=lane_consumers, weights=[8, 1])
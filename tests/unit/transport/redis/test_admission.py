@@ -0,0 +1,82 @@
+from datetime import timedelta
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from overhave.metrics import BaseOverhaveMetricContainer
+from overhave.transport import RedisAdmissionController
+
+
+class TestRedisAdmissionController:
+    """Unit tests for :class:`RedisAdmissionController`."""
+
+    def test_disabled_admission_control(
+        self, admission_controller: RedisAdmissionController, mocked_redis_database: mock.MagicMock
+    ) -> None:
+        assert admission_controller.check().admitted
+        mocked_redis_database.xinfo_groups.assert_not_called()
+
+    @pytest.mark.parametrize("admission_settings", [{"admission_max_backlog": 100}], indirect=True)
+    @pytest.mark.parametrize(
+        ("consumer_groups", "expected_backlog"),
+        [
+            ([(3, 2, 10)], 5),
+            ([(3, 2, 10), (7, 1, 4)], 8),
+            ([(None, 2, None)], 22),
+            ([], 20),
+        ],
+        indirect=["consumer_groups"],
+    )
+    def test_backlog(
+        self,
+        admission_controller: RedisAdmissionController,
+        base_container: BaseOverhaveMetricContainer,
+        expected_backlog: int,
+    ) -> None:
+        decision = admission_controller.check()
+        assert decision.admitted
+        assert decision.backlog == expected_backlog
+        assert base_container.redis_stream_backlog.labels(task_type="test")._value.get() == expected_backlog
+        assert base_container.redis_stream_backlog_threshold.labels(task_type="test")._value.get() == 100
+
+    @pytest.mark.parametrize("admission_settings", [{"admission_max_backlog": 100}], indirect=True)
+    def test_backlog_is_cached(
+        self, admission_controller: RedisAdmissionController, mocked_redis_database: mock.MagicMock
+    ) -> None:
+        admission_controller.check()
+        admission_controller.check()
+        mocked_redis_database.xinfo_groups.assert_called_once()
+
+    @pytest.mark.parametrize("admission_settings", [{"admission_max_backlog": 10}], indirect=True)
+    @pytest.mark.parametrize("consumer_groups", [[(30, 2, 10)]], indirect=True)
+    def test_reject_with_default_retry_after(
+        self, admission_controller: RedisAdmissionController, base_container: BaseOverhaveMetricContainer
+    ) -> None:
+        decision = admission_controller.check(count=3)
+        assert not decision.admitted
+        assert decision.retry_after == 60
+        assert base_container.rejected_redis_tasks.labels(task_type="test")._value.get() == 3
+
+    @pytest.mark.parametrize(
+        "admission_settings",
+        [{"admission_max_backlog": 10, "admission_cache_ttl": timedelta(0)}],
+        indirect=True,
+    )
+    @pytest.mark.parametrize("consumer_groups", [[(30, 0, 10)]], indirect=True)
+    def test_retry_after_by_throughput(
+        self,
+        admission_controller: RedisAdmissionController,
+        mocked_redis_database: mock.MagicMock,
+        consumer_groups: list[dict[str, Any]],
+    ) -> None:
+        mocked_redis_database.xinfo_groups.side_effect = [
+            consumer_groups,
+            [{**group, "entries-read": 20} for group in consumer_groups],
+        ]
+        with mock.patch("time.monotonic", return_value=0.0) as monotonic:
+            admission_controller.check()
+            monotonic.return_value = 5.0
+            decision = admission_controller.check()
+        assert not decision.admitted
+        assert decision.retry_after == 10
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+from typing import Any
+from unittest import mock
+
+import pytest
+from faker import Faker
+
+from overhave.metrics import BaseOverhaveMetricContainer
+from overhave.transport import (
+    AsyncRedisConsumerRunner,
+    OverhaveRedisSettings,
+    PublicationData,
+    PublicationTask,
+    RedisDeliveryMode,
+    RedisStream,
+    TestRunData,
+    TestRunPriority,
+    TestRunTask,
+)
+from overhave.transport.redis.runner import RedisConsumerRunnerException
+
+
+class TestAsyncRedisConsumerRunner:
+    """Unit tests for :class:`AsyncRedisConsumerRunner`."""
+
+    def test_multiplexed_read_with_stream_backpressure(
+        self, faker: Faker, base_container: BaseOverhaveMetricContainer
+    ) -> None:
+        test_task = TestRunTask(data=TestRunData(test_run_id=faker.random_int()))
+        publication_task = PublicationTask(data=PublicationData(draft_id=faker.random_int()))
+        read_streams: list[dict[str, str]] = []
+        processed: list[Any] = []
+        test_task_started = threading.Event()
+        release_test_task = threading.Event()
+
+        def _process_test_task(task: TestRunTask) -> None:
+            test_task_started.set()
+            release_test_task.wait(timeout=5)
+            processed.append(task)
+
+        async def _xreadgroup(
+            group: str, consumer: str, streams: dict[str, str], count: int, block: int | None
+        ) -> list[Any]:
+            if block is None:
+                assert len(streams) == 1
+                return []
+            read_streams.append(streams)
+            if len(read_streams) == 1:
+                return [(RedisStream.TEST.encode(), [(b"1-0", test_task.message)])]
+            if len(read_streams) == 2:
+                assert await asyncio.to_thread(test_task_started.wait, 5)
+                return [(RedisStream.PUBLICATION.encode(), [(b"2-0", publication_task.message)])]
+            release_test_task.set()
+            raise ConnectionError
+
+        redis = mock.AsyncMock()
+        redis.xreadgroup.side_effect = _xreadgroup
+        runner = AsyncRedisConsumerRunner(
+            settings=OverhaveRedisSettings(multiplexed_group="cg-overhave", read_count=2),
+            streams=[RedisStream.TEST, RedisStream.PUBLICATION],
+            redis=redis,
+            mapping={
+                TestRunTask: _process_test_task,  # type: ignore[dict-item]
+                PublicationTask: processed.append,
+            },
+            metric_container=base_container,
+        )
+        with pytest.raises(RedisConsumerRunnerException):
+            runner.run()
+
+        assert read_streams[0] == {RedisStream.TEST.value: ">", RedisStream.PUBLICATION.value: ">"}
+        assert all(RedisStream.TEST.value not in streams for streams in read_streams[1:])
+        assert redis.xreadgroup.await_count > len(read_streams)
+        assert processed == [publication_task, test_task]
+        assert redis.xgroup_create.await_count == len(TestRunPriority) + 1
+        redis.xack.assert_any_await(RedisStream.TEST, "cg-overhave", "1-0")
+        redis.xack.assert_any_await(RedisStream.PUBLICATION, "cg-overhave", "2-0")
+
+    def test_reclaim_count_is_shared_by_lanes(self, faker: Faker, base_container: BaseOverhaveMetricContainer) -> None:
+        message = TestRunTask(data=TestRunData(test_run_id=faker.random_int())).message
+        reclaim_counts: list[tuple[str, int]] = []
+
+        async def _xautoclaim(stream_key: str, *args: Any, count: int, **kwargs: Any) -> list[Any]:
+            reclaim_counts.append((stream_key, count))
+            return ["0-0", [(f"{len(reclaim_counts)}-{x}".encode(), message) for x in range(min(count, 2))], []]
+
+        redis = mock.AsyncMock()
+        redis.xautoclaim.side_effect = _xautoclaim
+        redis.xpending_range.return_value = []
+        runner = AsyncRedisConsumerRunner(
+            settings=OverhaveRedisSettings(delivery_mode=RedisDeliveryMode.AT_LEAST_ONCE, read_count=3),
+            streams=[RedisStream.TEST],
+            redis=redis,
+            mapping={TestRunTask: mock.MagicMock()},
+            metric_container=base_container,
+        )
+        messages = asyncio.run(runner._read("cg-overhave", [RedisStream.TEST], count=3))
+
+        assert len(messages) == 3
+        assert [count for _, count in reclaim_counts] == [3, 1]
+        redis.xreadgroup.assert_not_awaited()
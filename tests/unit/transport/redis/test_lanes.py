@@ -0,0 +1,49 @@
+from collections import Counter
+from unittest import mock
+
+import pytest
+
+from overhave.transport import RedisLanesConsumer, WeightedRoundRobin
+from overhave.transport.objects import RedisUnreadData
+
+
+class TestWeightedRoundRobin:
+    """Unit tests for :class:`WeightedRoundRobin`."""
+
+    def test_order_is_weighted(self) -> None:
+        round_robin = WeightedRoundRobin({"interactive": 8, "scheduled": 3, "bulk": 1})
+        orders = [round_robin.order() for _ in range(24)]
+        assert Counter(order[0] for order in orders) == {"interactive": 16, "scheduled": 6, "bulk": 2}
+        assert all(sorted(order) == ["bulk", "interactive", "scheduled"] for order in orders)
+        assert ["interactive", "scheduled", "bulk"] in orders
+
+
+class TestRedisLanesConsumer:
+    """Unit tests for :class:`RedisLanesConsumer`."""
+
+    @pytest.mark.parametrize(
+        "lane_messages",
+        [{"test": [], "test-bulk": [RedisUnreadData(message_id=b"1-0", message={}, stream_key="test-bulk")]}],
+        indirect=True,
+    )
+    def test_read_from_not_empty_lane(
+        self,
+        lanes_consumer: RedisLanesConsumer,
+        lane_consumers: list[mock.MagicMock],
+        lane_messages: dict[str, list[RedisUnreadData]],
+    ) -> None:
+        message = lane_messages["test-bulk"][0]
+        assert lanes_consumer.read(2) == [message]
+        lane_consumers[0].read.assert_called_once_with(2, block=False)
+        lane_consumers[1].read.assert_called_once_with(2, block=False)
+
+        lanes_consumer.acknowledge(message)
+        lane_consumers[1].acknowledge.assert_called_once_with(message)
+        lane_consumers[0].acknowledge.assert_not_called()
+
+    def test_read_blocks_on_primary_lane(
+        self, lanes_consumer: RedisLanesConsumer, lane_consumers: list[mock.MagicMock]
+    ) -> None:
+        assert lanes_consumer.read() == []
+        assert lane_consumers[0].read.call_args_list == [mock.call(None, block=False), mock.call(None)]
+        lane_consumers[1].read.assert_called_once_with(None, block=False)
@@ -0,0 +1,66 @@
+import pytest
+
+from overhave.transport import (
+    AnyRedisTask,
+    EmulationData,
+    EmulationTask,
+    PublicationData,
+    PublicationTask,
+    RedisMessageFormat,
+    TestRunData,
+    TestRunPriority,
+    TestRunShardData,
+    TestRunTask,
+    UnsupportedRedisMessageError,
+)
+from overhave.transport.objects import RedisUnreadData
+
+_TASKS = [
+    TestRunTask(data=TestRunData(test_run_id=1)),
+    TestRunTask(data=TestRunData(test_run_id=1, shard=TestRunShardData(index=0, count=2))),
+    PublicationTask(data=PublicationData(draft_id=2)),
+    EmulationTask(data=EmulationData(emulation_run_id=3)),
+]
+
+
+class TestRedisUnreadData:
+    """Unit tests for decoding of :class:`RedisUnreadData`."""
+
+    @pytest.mark.parametrize("task", _TASKS)
+    @pytest.mark.parametrize("message_format", list(RedisMessageFormat))
+    def test_decode_task(self, task: AnyRedisTask, message_format: RedisMessageFormat) -> None:
+        data = RedisUnreadData(message_id=b"1-0", message=task.get_message(message_format))
+        assert data.decode_task() == task
+        assert data.decoded_message == {"data": task.data.model_dump()}
+
+    @pytest.mark.parametrize("message_format", list(RedisMessageFormat))
+    @pytest.mark.parametrize(
+        ("stream_key", "priority"),
+        [
+            ("test", TestRunPriority.INTERACTIVE),
+            ("test-scheduled", TestRunPriority.SCHEDULED),
+            ("test-bulk", TestRunPriority.BULK),
+            (None, TestRunPriority.INTERACTIVE),
+        ],
+    )
+    def test_decode_task_priority(
+        self, message_format: RedisMessageFormat, stream_key: str | None, priority: TestRunPriority
+    ) -> None:
+        task = TestRunTask(data=TestRunData(test_run_id=1), priority=priority)
+        data = RedisUnreadData(message_id=b"1-0", message=task.get_message(message_format), stream_key=stream_key)
+        assert data.decode_task() == task
+
+    def test_envelope_has_task_type(self) -> None:
+        message = TestRunTask(data=TestRunData(test_run_id=1)).message
+        assert message == {b"v": b"1", b"t": b"test_run", b"d": b'{"test_run_id":1,"shard":null}'}
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            {b"v": b"2", b"t": b"test_run", b"d": b'{"test_run_id":1}'},
+            {b"v": b"1", b"t": b"unknown", b"d": b'{"test_run_id":1}'},
+        ],
+    )
+    def test_unsupported_message(self, message: dict[bytes, bytes]) -> None:
+        with pytest.raises(UnsupportedRedisMessageError):
+            RedisUnreadData(message_id=b"1-0", message=message).decode_task()
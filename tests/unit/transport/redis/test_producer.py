@@ -0,0 +1,42 @@
+from unittest import mock
+
+import redis
+from faker import Faker
+
+from overhave.metrics import BaseOverhaveMetricContainer
+from overhave.transport import OverhaveRedisSettings, RedisProducer, RedisStream, TestRunData, TestRunTask
+
+
+class TestRedisProducer:
+    """Unit tests for :class:`RedisProducer`."""
+
+    def test_add_tasks_with_partial_failure(self, faker: Faker, base_container: BaseOverhaveMetricContainer) -> None:
+        database = mock.MagicMock()
+        pipeline = database.pipeline.return_value
+        pipeline.execute.return_value = [b"1-0", redis.exceptions.ResponseError(), b"2-0"]
+        producer = RedisProducer(
+            settings=OverhaveRedisSettings(),
+            mapping={TestRunTask: RedisStream.TEST},
+            database=database,
+            metric_container=base_container,
+        )
+        tasks = [TestRunTask(data=TestRunData(test_run_id=faker.random_int())) for _ in range(3)]
+
+        assert producer.add_tasks(tasks) == [True, False, True]
+        database.pipeline.assert_called_once_with(transaction=False)
+        assert pipeline.xadd.call_count == 3
+        assert pipeline.xadd.call_args.args[1] == tasks[-1].legacy_message
+        assert base_container.produced_redis_tasks.labels(task_type=RedisStream.TEST.value)._value.get() == 2
+
+    def test_add_tasks_connection_error(self, faker: Faker, base_container: BaseOverhaveMetricContainer) -> None:
+        database = mock.MagicMock()
+        database.pipeline.return_value.execute.side_effect = redis.exceptions.ConnectionError
+        producer = RedisProducer(
+            settings=OverhaveRedisSettings(),
+            mapping={TestRunTask: RedisStream.TEST},
+            database=database,
+            metric_container=base_container,
+        )
+        tasks = [TestRunTask(data=TestRunData(test_run_id=faker.random_int())) for _ in range(2)]
+
+        assert producer.add_tasks(tasks) == [False, False]
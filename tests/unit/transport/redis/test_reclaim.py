@@ -0,0 +1,25 @@
+from faker import Faker
+
+from overhave.transport import OverhaveRedisSettings, TestRunData, TestRunTask
+from overhave.transport.redis.reclaim import get_claimed_messages, split_reclaimed
+
+
+class TestReclaim:
+    """Unit tests for reclaiming of pending messages."""
+
+    def test_split_reclaimed(self, faker: Faker) -> None:
+        message = TestRunTask(data=TestRunData(test_run_id=faker.random_int())).message
+        claimed = get_claimed_messages(
+            ["0-0", [(b"1-0", message), (b"2-0", None), (b"3-0", message)], []], stream_key="test"
+        )
+        assert [data.message_id for data in claimed] == ["1-0", "3-0"]
+        reclaimed = split_reclaimed(
+            settings=OverhaveRedisSettings(max_deliveries=2),
+            claimed=claimed,
+            pending_messages=[
+                {"message_id": "1-0", "consumer": "consumer", "time_since_delivered": 1, "times_delivered": 2},
+                {"message_id": "3-0", "consumer": "consumer", "time_since_delivered": 1, "times_delivered": 3},
+            ],
+        )
+        assert [data.message_id for data in reclaimed.messages] == ["1-0"]
+        assert [(x.data.message_id, x.stream_key) for x in reclaimed.dead_letters] == [("3-0", "test-dead-letter")]
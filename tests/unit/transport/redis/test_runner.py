@@ -0,0 +1,120 @@
+import threading
+from typing import Sequence
+from unittest import mock
+
+import pytest
+
+from overhave.transport import RedisConsumerRunner, TestRunTask
+from overhave.transport.objects import RedisUnreadData
+from overhave.transport.redis.runner import RedisConsumerRunnerException
+
+
+class TestRedisConsumerRunner:
+    """Unit tests for :class:`RedisConsumerRunner`."""
+
+    @pytest.mark.parametrize(
+        ("concurrency", "test_run_messages_count"), [(2, 2), (4, 4)], indirect=["test_run_messages_count"]
+    )
+    def test_concurrent_dispatch_with_backpressure(
+        self, mocked_redis_consumer: mock.MagicMock, test_run_messages: list[RedisUnreadData], concurrency: int
+    ) -> None:
+        batches = [test_run_messages, []]
+        requested_counts: list[int] = []
+        processed: list[int] = []
+        lock = threading.Lock()
+
+        def _read(count: int) -> list[RedisUnreadData]:
+            requested_counts.append(count)
+            if batches:
+                return batches.pop(0)
+            raise ConnectionError
+
+        def _handler(task: TestRunTask) -> None:
+            with lock:
+                processed.append(task.data.test_run_id)
+
+        consumer = mocked_redis_consumer
+        consumer.batch_size = concurrency * 2
+        consumer.read.side_effect = _read
+        runner = RedisConsumerRunner(
+            consumer=consumer, mapping={TestRunTask: _handler}, concurrency=concurrency  # type: ignore[dict-item]
+        )
+        with pytest.raises(RedisConsumerRunnerException):
+            runner.run()
+
+        assert sorted(processed) == list(range(concurrency))
+        assert requested_counts[0] == concurrency
+        assert all(count <= concurrency for count in requested_counts)
+
+    def test_batched_dispatch(
+        self, mocked_redis_consumer: mock.MagicMock, test_run_messages: list[RedisUnreadData]
+    ) -> None:
+        messages = list(test_run_messages)
+        batches: list[list[int]] = []
+
+        def _read(count: int) -> list[RedisUnreadData]:
+            if messages:
+                return [messages.pop(0) for _ in range(min(count, len(messages)))]
+            raise ConnectionError
+
+        def _batch_handler(tasks: Sequence[TestRunTask]) -> None:
+            batches.append([x.data.test_run_id for x in tasks])
+
+        consumer = mocked_redis_consumer
+        consumer.read.side_effect = _read
+        runner = RedisConsumerRunner(
+            consumer=consumer,
+            mapping={},
+            batch_mapping={TestRunTask: _batch_handler},  # type: ignore[dict-item]
+            batch_size=2,
+        )
+        with pytest.raises(RedisConsumerRunnerException):
+            runner.run()
+
+        assert batches == [[0, 1], [2]]
+        assert consumer.acknowledge.call_count == 3
+
+    @pytest.mark.parametrize("test_run_messages_count", [10], indirect=True)
+    @pytest.mark.parametrize("concurrency", [1, 2])
+    def test_recycling_after_max_tasks(
+        self, mocked_redis_consumer: mock.MagicMock, test_run_messages: list[RedisUnreadData], concurrency: int
+    ) -> None:
+        messages = list(test_run_messages)
+        processed: list[int] = []
+
+        def _read(count: int | None = None, block: bool = True) -> list[RedisUnreadData]:
+            return [messages.pop(0)]
+
+        def _handler(task: TestRunTask) -> None:
+            processed.append(task.data.test_run_id)
+
+        consumer = mocked_redis_consumer
+        consumer.batch_size = 1
+        consumer.read.side_effect = _read
+        consumer.__iter__.side_effect = lambda: iter(lambda: _read(), None)
+        runner = RedisConsumerRunner(
+            consumer=consumer,
+            mapping={TestRunTask: _handler},  # type: ignore[dict-item]
+            concurrency=concurrency,
+            max_tasks=3,
+        )
+        runner.run()
+
+        assert sorted(processed) == [0, 1, 2]
+        assert runner.consumed_tasks == 3
+        assert len(messages) == 7
+
+    def test_recycling_by_rss(
+        self, mocked_redis_consumer: mock.MagicMock, test_run_messages: list[RedisUnreadData]
+    ) -> None:
+        consumer = mocked_redis_consumer
+        consumer.read.return_value = test_run_messages[:1]
+        runner = RedisConsumerRunner(
+            consumer=consumer,
+            mapping={},
+            batch_mapping={TestRunTask: mock.MagicMock()},
+            batch_size=2,
+            max_rss=1,
+        )
+        runner.run()
+        consumer.read.assert_not_called()
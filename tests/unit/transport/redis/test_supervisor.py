@@ -0,0 +1,37 @@
+import os
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from overhave.transport import RedisConsumerSupervisor
+
+
+def _append_pid(path: Path) -> None:
+    with path.open("a") as file:
+        file.write(f"{os.getpid()}\n")
+
+
+class TestRedisConsumerSupervisor:
+    """Unit tests for :class:`RedisConsumerSupervisor`."""
+
+    def test_restart_exited_consumers(self, tmp_path: Path) -> None:
+        pids_file = tmp_path / "pids"
+        supervisor = RedisConsumerSupervisor(
+            target=lambda: _append_pid(pids_file), processes=2, restart_delay=timedelta(milliseconds=10)
+        )
+        thread = threading.Thread(target=supervisor.run)
+        thread.start()
+        try:
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
+                if pids_file.exists() and len(pids_file.read_text().split()) >= 4:
+                    break
+                time.sleep(0.01)
+        finally:
+            supervisor.stop()
+            thread.join(timeout=10)
+        assert not thread.is_alive()
+        pids = pids_file.read_text().split()
+        assert len(pids) >= 4
+        assert len(set(pids)) == len(pids)
@@ -0,0 +1,108 @@
+from datetime import timedelta
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from overhave.metrics import BaseOverhaveMetricContainer
+from overhave.transport import OverhaveRedisSettings, RedisStream, RedisStreamTrimmer
+from overhave.transport.redis.trimmer import StreamEntryId
+
+
+class TestRedisStreamTrimmer:
+    """Unit tests for :class:`RedisStreamTrimmer`."""
+
+    @pytest.mark.parametrize(
+        ("groups", "pending_min_id", "expected_min_id"),
+        [
+            ([{"name": b"cg-test", "pending": 0, "last-delivered-id": b"10-1"}], None, "10-2"),
+            ([{"name": b"cg-test", "pending": 2, "last-delivered-id": b"10-1"}], b"5-0", "5-0"),
+            (
+                [
+                    {"name": b"cg-test", "pending": 0, "last-delivered-id": b"10-1"},
+                    {"name": b"cg-other", "pending": 1, "last-delivered-id": b"10-1"},
+                ],
+                b"3-4",
+                "3-4",
+            ),
+        ],
+    )
+    def test_trim_keeps_unprocessed_entries(
+        self,
+        base_container: BaseOverhaveMetricContainer,
+        groups: list[dict[str, Any]],
+        pending_min_id: bytes | None,
+        expected_min_id: str,
+    ) -> None:
+        database = mock.MagicMock()
+        database.xinfo_groups.return_value = groups
+        database.xpending.return_value = {"pending": 1, "min": pending_min_id}
+        database.xtrim.return_value = 3
+        trimmer = RedisStreamTrimmer(
+            settings=OverhaveRedisSettings(stream_retention=timedelta(0)),
+            streams=[RedisStream.TEST],
+            database=database,
+            metric_container=base_container,
+        )
+        assert trimmer.trim(RedisStream.TEST) == 3
+        database.xtrim.assert_called_once_with(RedisStream.TEST, minid=expected_min_id, approximate=True)
+        assert base_container.trimmed_redis_tasks.labels(task_type=RedisStream.TEST.value)._value.get() == 3
+
+    def test_trim_by_retention_window(self, base_container: BaseOverhaveMetricContainer) -> None:
+        database = mock.MagicMock()
+        database.xinfo_groups.return_value = [
+            {"name": b"cg-test", "pending": 0, "last-delivered-id": b"99999999999999-0"}
+        ]
+        database.xtrim.return_value = 0
+        trimmer = RedisStreamTrimmer(
+            settings=OverhaveRedisSettings(stream_retention=timedelta(days=1)),
+            streams=[RedisStream.TEST],
+            database=database,
+            metric_container=base_container,
+        )
+        trimmer.trim(RedisStream.TEST)
+        min_id = StreamEntryId.parse(database.xtrim.call_args.kwargs["minid"])
+        assert min_id < StreamEntryId.parse(b"99999999999999-0")
+        assert min_id.sequence == 0
+
+    def test_trim_without_groups(self, base_container: BaseOverhaveMetricContainer) -> None:
+        database = mock.MagicMock()
+        database.xinfo_groups.return_value = []
+        trimmer = RedisStreamTrimmer(
+            settings=OverhaveRedisSettings(stream_retention=timedelta(0)),
+            streams=[RedisStream.TEST],
+            database=database,
+            metric_container=base_container,
+        )
+        assert trimmer.trim(RedisStream.TEST) == 0
+        database.xtrim.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("length", "last_delivered_id", "expected_min_id"),
+        [(5, b"10-0", "3-0"), (5, b"1-0", "1-1"), (2, b"10-0", None)],
+    )
+    def test_trim_by_max_length(
+        self,
+        base_container: BaseOverhaveMetricContainer,
+        length: int,
+        last_delivered_id: bytes,
+        expected_min_id: str | None,
+    ) -> None:
+        database = mock.MagicMock()
+        database.xinfo_groups.return_value = [
+            {"name": b"cg-test", "pending": 0, "last-delivered-id": last_delivered_id}
+        ]
+        database.xlen.return_value = length
+        database.xrange.side_effect = lambda stream, count: [(f"{i}-0".encode(), {}) for i in range(1, count + 1)]
+        database.xtrim.return_value = 0
+        trimmer = RedisStreamTrimmer(
+            settings=OverhaveRedisSettings(stream_max_length=3),
+            streams=[RedisStream.TEST],
+            database=database,
+            metric_container=base_container,
+        )
+        trimmer.trim(RedisStream.TEST)
+        if expected_min_id is None:
+            database.xtrim.assert_not_called()
+            return
+        database.xtrim.assert_called_once_with(RedisStream.TEST, minid=expected_min_id, approximate=True)